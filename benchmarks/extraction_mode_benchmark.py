@@ -0,0 +1,85 @@
+"""NaverWebtoonScraper의 getter 방식과 단일 스크립트 방식 추출 성능 비교
+
+사용법:
+    python benchmarks/extraction_mode_benchmark.py URL [URL ...] [--repeat N] [--show-browser]
+
+각 URL을 두 방식으로 번갈아 수집하여 웹툰당 소요 시간과 WebDriver 명령(왕복) 수를 비교한다.
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from modules.web_driver.web_driver_factory import WebDriverFactory
+from scrapers.webtoon_scraper_factory import WebtoonScraperFactory
+
+def count_driver_commands(driver, counter: Dict[str, int]) -> None:
+    """driver.execute를 감싸 WebDriver 명령 수를 센다. WebElement 호출도 같은 경로를 거친다"""
+    original_execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        counter["commands"] += 1
+        return original_execute(driver_command, params)
+
+    driver.execute = counting_execute
+
+def build_scraper(driver, mode: str):
+    builder = (WebtoonScraperFactory.create_builder(driver)
+        .scrape_title()
+        .scrape_thumbnail()
+        .scrape_story()
+        .scrape_day_age()
+        .scrape_day()
+        .scrape_status()
+        .scrape_genres()
+        .scrape_authors()
+        .scrape_unique_id()
+        .scrape_episode_count())
+    if mode == "script":
+        builder.use_script_extraction()
+    return builder.build()
+
+def run(urls: List[str], repeat: int, headless: bool) -> None:
+    driver = WebDriverFactory().create_driver(environment="local", headless=headless).get_driver()
+    counter = {"commands": 0}
+    count_driver_commands(driver, counter)
+    scrapers = {mode: build_scraper(driver, mode) for mode in ("getter", "script")}
+    timings: Dict[str, List[float]] = {mode: [] for mode in scrapers}
+    commands: Dict[str, List[int]] = {mode: [] for mode in scrapers}
+
+    try:
+        for _ in range(repeat):
+            for url in urls:
+                for mode, scraper in scrapers.items():
+                    counter["commands"] = 0
+                    started = time.perf_counter()
+                    success, _ = scraper.fetch_webtoon(url)
+                    elapsed = time.perf_counter() - started
+                    if success:
+                        timings[mode].append(elapsed)
+                        commands[mode].append(counter["commands"])
+    finally:
+        driver.quit()
+
+    print(f"{'mode':<8}{'n':>5}{'mean(s)':>10}{'p50(s)':>10}{'max(s)':>10}{'commands':>10}")
+    for mode in scrapers:
+        if not timings[mode]:
+            print(f"{mode:<8}{0:>5}")
+            continue
+        print(f"{mode:<8}{len(timings[mode]):>5}"
+              f"{statistics.mean(timings[mode]):>10.3f}"
+              f"{statistics.median(timings[mode]):>10.3f}"
+              f"{max(timings[mode]):>10.3f}"
+              f"{statistics.mean(commands[mode]):>10.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls", nargs="+", help="네이버 웹툰 타이틀 URL")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--show-browser", action="store_true", help="브라우저 표시")
+    args = parser.parse_args()
+    run(args.urls, args.repeat, headless=not args.show_browser)
@@ -0,0 +1,169 @@
+"""브라우저 없이 픽스처 HTML을 탐색하는 최소한의 WebDriver 대역
+
+스크래퍼가 사용하는 명령(get, current_url, find_element(s), text, get_attribute,
+click, is_displayed)만 구현한다. JavaScript는 실행하지 않으므로 execute_script를
+쓰는 경로(단일 스크립트 추출, 지문 계산)는 --driver chrome으로 측정한다.
+"""
+import re
+import time
+from html.parser import HTMLParser
+from typing import Callable, List, Optional, Union
+from urllib.parse import urljoin
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from modules.web_driver import IWebDriverManager
+from fixture_set import FixtureSet
+
+BLOCK_TAGS = {"p", "div", "li", "ul", "h1", "h2", "h3", "header", "footer", "section", "br", "tr"}
+VOID_TAGS = {"img", "br", "meta", "link", "input", "hr", "source"}
+XPATH_CLASS_CONTAINS = re.compile(r"^\.//(\w+|\*)\[contains\(@class,\s*'([^']+)'\)\]$")
+
+class FakeElement:
+    """픽스처 DOM의 요소"""
+
+    def __init__(self, tag_name: str, attrs: dict, driver: 'FakeWebDriver'):
+        self.tag_name = tag_name
+        self.attrs = attrs
+        self.children: List[Union['FakeElement', str]] = []
+        self._driver = driver
+
+    @property
+    def text(self) -> str:
+        parts: List[str] = []
+        self._collect_text(parts)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts: List[str]) -> None:
+        if self.tag_name in BLOCK_TAGS:
+            parts.append("\n")
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+            else:
+                child._collect_text(parts)
+        if self.tag_name in BLOCK_TAGS:
+            parts.append("\n")
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        value = self.attrs.get(name)
+        if value is not None and name in ("href", "src"):
+            # 실제 브라우저처럼 절대 URL로 변환
+            return urljoin(self._driver.current_url, value)
+        return value
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        pass
+
+    def iter_descendants(self):
+        for child in self.children:
+            if isinstance(child, FakeElement):
+                yield child
+                yield from child.iter_descendants()
+
+    def find_elements(self, by: str = "id", value: Optional[str] = None) -> List['FakeElement']:
+        matcher = build_matcher(by, value)
+        return [element for element in self.iter_descendants() if matcher(element)]
+
+    def find_element(self, by: str = "id", value: Optional[str] = None) -> 'FakeElement':
+        matcher = build_matcher(by, value)
+        for element in self.iter_descendants():
+            if matcher(element):
+                return element
+        raise NoSuchElementException(f"{by}={value}")
+
+def build_matcher(by: str, value: str) -> Callable[[FakeElement], bool]:
+    """Selenium 로케이터를 요소 판별 함수로 변환"""
+    if by == "class name":
+        return lambda element: value in element.attrs.get("class", "").split()
+    if by == "tag name":
+        return lambda element: element.tag_name == value.lower()
+    if by == "id":
+        return lambda element: element.attrs.get("id") == value
+    if by == "css selector" and re.fullmatch(r"(\w*)(?:\.([\w-]+))?", value):
+        tag, class_name = re.fullmatch(r"(\w*)(?:\.([\w-]+))?", value).groups()
+        return lambda element: ((not tag or element.tag_name == tag)
+                                and (not class_name or class_name in element.attrs.get("class", "").split()))
+    xpath_match = XPATH_CLASS_CONTAINS.match(value or "") if by == "xpath" else None
+    if xpath_match:
+        tag, class_part = xpath_match.groups()
+        return lambda element: ((tag == "*" or element.tag_name == tag)
+                                and class_part in element.attrs.get("class", ""))
+    raise WebDriverException(f"FakeWebDriver가 지원하지 않는 로케이터: {by}={value}")
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self, driver: 'FakeWebDriver'):
+        super().__init__(convert_charrefs=True)
+        self.root = FakeElement("html", {}, driver)
+        self._stack = [self.root]
+        self._driver = driver
+
+    def handle_starttag(self, tag, attrs):
+        element = FakeElement(tag, {name: value or "" for name, value in attrs}, self._driver)
+        self._stack[-1].children.append(element)
+        if tag not in VOID_TAGS:
+            self._stack.append(element)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag_name == tag:
+                del self._stack[index:]
+                break
+
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
+
+class FakeWebDriver:
+    """FixtureSet의 HTML을 페이지로 제공하는 WebDriver 대역"""
+
+    def __init__(self, fixture_set: FixtureSet, latency: float = 0.0):
+        """
+        Args:
+            fixture_set (FixtureSet): 제공할 픽스처
+            latency (float): 페이지 이동마다 추가할 지연(초). 네트워크 지연 흉내
+        """
+        self.fixture_set = fixture_set
+        self.latency = latency
+        self.current_url = "about:blank"
+        self.page_source = ""
+        self.page_count = 0
+        self._root = FakeElement("html", {}, self)
+
+    def get(self, url: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        self.current_url, _, self.page_source = self.fixture_set.resolve(url)
+        builder = _TreeBuilder(self)
+        builder.feed(self.page_source)
+        self._root = builder.root
+        self.page_count += 1
+
+    def find_elements(self, by: str = "id", value: Optional[str] = None) -> List[FakeElement]:
+        return self._root.find_elements(by, value)
+
+    def find_element(self, by: str = "id", value: Optional[str] = None) -> FakeElement:
+        return self._root.find_element(by, value)
+
+    def execute_script(self, script: str, *args):
+        raise WebDriverException("FakeWebDriver는 execute_script를 지원하지 않습니다.")
+
+    def delete_all_cookies(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+class FakeWebDriverManager(IWebDriverManager):
+    """FakeWebDriver를 제공하는 드라이버 매니저 (InitWebtoonCrawler 벤치마크용)"""
+
+    def __init__(self, fixture_set: FixtureSet, latency: float = 0.0):
+        self.fixture_set = fixture_set
+        self.latency = latency
+
+    def setup_driver(self):
+        pass
+
+    def get_driver(self) -> FakeWebDriver:
+        return FakeWebDriver(self.fixture_set, self.latency)
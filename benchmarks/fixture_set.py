@@ -0,0 +1,54 @@
+"""벤치마크용 HTML 픽스처 로더
+
+fixtures/<platform>/manifest.json에 등록된 타이틀 페이지를 URL의 titleId/sort 값으로 찾아 반환한다.
+"""
+import os
+import json
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+FIXTURE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+NOT_FOUND_HTML = "<!DOCTYPE html><html><head><title>404</title></head><body><p>페이지를 찾을 수 없습니다.</p></body></html>"
+LOGIN_HTML = "<!DOCTYPE html><html><head><title>로그인</title></head><body><form id=\"frmNIDLogin\"></form></body></html>"
+
+class FixtureSet:
+    """manifest.json 기반의 타이틀 페이지 픽스처 모음"""
+
+    def __init__(self, platform: str = "naver"):
+        self.directory = os.path.join(FIXTURE_ROOT, platform)
+        with open(os.path.join(self.directory, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.base_url: str = manifest["base_url"]
+        self.titles: Dict[str, dict] = {entry["title_id"]: entry for entry in manifest["titles"]}
+        self._cache: Dict[str, str] = {}
+
+    def _read(self, filename: str) -> str:
+        if filename not in self._cache:
+            with open(os.path.join(self.directory, filename), "r", encoding="utf-8") as f:
+                self._cache[filename] = f.read()
+        return self._cache[filename]
+
+    def title_ids(self, include_slow: bool = True) -> List[str]:
+        """등록된 타이틀 ID 목록. include_slow=False면 태그가 없어 대기 시간이 긴 타이틀 제외"""
+        return [
+            title_id for title_id, entry in self.titles.items()
+            if include_slow or entry.get("has_tags", True)
+        ]
+
+    def urls(self, base_url: Optional[str] = None, include_slow: bool = True) -> List[str]:
+        base_url = base_url or self.base_url
+        return [f"{base_url}/webtoon/list?titleId={title_id}" for title_id in self.title_ids(include_slow)]
+
+    def resolve(self, url: str) -> Tuple[str, Optional[str], str]:
+        """URL에 해당하는 (최종 URL, 리다이렉트 대상, HTML) 반환"""
+        query = parse_qs(urlparse(url).query)
+        title_id = (query.get("titleId") or [None])[0]
+        entry = self.titles.get(title_id)
+        if entry is None:
+            return url, None, NOT_FOUND_HTML
+        if entry.get("redirect"):
+            return entry["redirect"], entry["redirect"], LOGIN_HTML
+        if (query.get("sort") or [""])[0].upper() == "ASC" and entry.get("asc_file"):
+            return url, None, self._read(entry["asc_file"])
+        return url, None, self._read(entry["file"])
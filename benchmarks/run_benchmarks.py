@@ -0,0 +1,335 @@
+"""스크래퍼 핫패스 오프라인 벤치마크
+
+comic.naver.com에 접속하지 않고 fixtures/의 HTML로 다음 항목을 측정한다.
+  - scraper:    NaverWebtoonScraper.fetch_webtoon 웹툰당 지연 백분위수, getter별 비용, pages/sec
+  - batch:      InitWebtoonCrawler + BatchProcessor 전체 처리량
+  - repository: WebtoonRepository / SqliteWebtoonRepository 누적 저장 비용
+
+사용법:
+    python benchmarks/run_benchmarks.py                      # 가짜 드라이버로 전체 실행
+    python benchmarks/run_benchmarks.py --driver chrome      # 로컬 정적 서버 + 실제 Chrome
+    python benchmarks/run_benchmarks.py --output bench.json  # 결과를 JSON으로 저장
+    python benchmarks/run_benchmarks.py --compare base.json  # 이전 결과와 비교
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+import tracemalloc
+import subprocess
+from datetime import datetime
+from typing import Any, Dict, List
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARK_DIR, "..", "src"))
+
+from fixture_set import FixtureSet
+from fake_driver import FakeWebDriver, FakeWebDriverManager
+from static_server import FixtureServer
+from scrapers.webtoon_scraper_factory import WebtoonScraperFactory
+from utils.stage_timer import stage_timer
+
+def percentile(values: List[float], p: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        "count": len(values),
+        "total_s": sum(values),
+        "mean_s": sum(values) / len(values) if values else 0.0,
+        "p50_s": percentile(values, 50),
+        "p90_s": percentile(values, 90),
+        "p99_s": percentile(values, 99),
+        "max_s": max(values) if values else 0.0,
+    }
+
+class DriverProvider:
+    """측정 대상 드라이버와 URL을 제공 (fake: 픽스처 파싱, chrome: 정적 서버 + Chrome)"""
+
+    def __init__(self, kind: str, fixture_set: FixtureSet, latency: float, include_slow: bool, block_resources: bool = True):
+        self.kind = kind
+        self.block_resources = block_resources
+        self.fixture_set = fixture_set
+        self.latency = latency
+        self.server = None
+        base_url = None
+        if kind == "chrome":
+            self.server = FixtureServer(fixture_set).start()
+            base_url = self.server.base_url
+        self.urls = fixture_set.urls(base_url, include_slow=include_slow)
+
+    def create_manager(self):
+        if self.kind == "fake":
+            return FakeWebDriverManager(self.fixture_set, self.latency)
+        from modules.web_driver.web_driver_factory import WebDriverFactory
+        # 리소스 차단을 끄면 페이지 로드 전략도 기존 방식(normal)으로 측정
+        web_driver_factory = WebDriverFactory(
+            block_resources=self.block_resources,
+            page_load_strategy="eager" if self.block_resources else "normal"
+        )
+        return web_driver_factory.create_driver(environment="local", headless=True)
+
+    def create_driver(self):
+        return self.create_manager().get_driver()
+
+    def close(self) -> None:
+        if self.server:
+            self.server.stop()
+
+def bench_scraper(provider: DriverProvider, repeat: int, extraction_mode: str) -> Dict[str, Any]:
+    driver = provider.create_driver()
+
+    builder = WebtoonScraperFactory.create_builder(driver)
+    for option in ("scrape_title", "scrape_thumbnail", "scrape_story", "scrape_day_age", "scrape_day",
+                   "scrape_status", "scrape_genres", "scrape_authors", "scrape_unique_id",
+                   "scrape_episode_count", "scrape_dates"):
+        getattr(builder, option)()
+    if extraction_mode == "script":
+        builder.use_script_extraction()
+    scraper = builder.build()
+
+    latencies: List[float] = []
+    success_count = 0
+    stage_timer.reset()
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        for _ in range(repeat):
+            for url in provider.urls:
+                title_started = time.perf_counter()
+                success, _ = scraper.fetch_webtoon(url)
+                latencies.append(time.perf_counter() - title_started)
+                success_count += int(success)
+    finally:
+        elapsed = time.perf_counter() - started
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        driver.quit()
+
+    stages = stage_timer.summary()
+    pages = stages.get("naver.navigate", {}).get("count", 0)
+    return {
+        "extraction_mode": extraction_mode,
+        "titles": len(latencies),
+        "success": success_count,
+        "elapsed_s": elapsed,
+        "titles_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "pages_per_sec": pages / elapsed if elapsed else 0.0,
+        "latency": summarize(latencies),
+        "stages": stages,
+        "python_peak_mb": peak_bytes / (1024 * 1024),
+    }
+
+def bench_batch(provider: DriverProvider, repeat: int, pool_size: int, batch_size: int) -> Dict[str, Any]:
+    from crawler.tasks.init_webtoon_crawler import InitWebtoonCrawler
+
+    class ProviderFactory:
+        def create_driver(self, environment=None, headless=True):
+            return provider.create_manager()
+
+    crawler = InitWebtoonCrawler(
+        driver_manager=provider.create_manager(),
+        batch_size=batch_size,
+        pool_size=pool_size,
+        web_driver_factory=ProviderFactory()
+    )
+    # 같은 웹툰의 URL은 initialize()에서 하나로 합쳐지므로 반복 횟수만큼 크롤링을 다시 실행
+    titles = 0
+    success_count = 0
+    failure_count = 0
+    try:
+        stage_timer.reset()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            crawler.initialize(provider.urls)
+            crawler.run()
+            titles += len(crawler.urls)
+            success_count += crawler.success_count
+            failure_count += crawler.failure_count
+        elapsed = time.perf_counter() - started
+    finally:
+        crawler.shutdown()
+
+    return {
+        "pool_size": pool_size,
+        "batch_size": batch_size,
+        "titles": titles,
+        "success": success_count,
+        "failure": failure_count,
+        "elapsed_s": elapsed,
+        "titles_per_sec": titles / elapsed if elapsed else 0.0,
+        "stages": crawler.get_timing_summary(),
+    }
+
+def bench_repository(record_count: int, batch_size: int) -> Dict[str, Any]:
+    from modules.webtoon_repository import WebtoonRepository
+    from modules.sqlite_webtoon_repository import SqliteWebtoonRepository
+
+    def make_record(index: int) -> dict:
+        return {
+            "title": f"웹툰 {index}", "external_id": str(100000 + index), "platform": "NAVER",
+            "day_of_week": "MONDAY", "thumbnail_url": f"https://image-comic.pstatic.net/{index}.jpg",
+            "link": f"https://comic.naver.com/webtoon/list?titleId={100000 + index}",
+            "age_rating": "AGE_15", "description": "줄거리 " * 20, "serialization_status": "ONGOING",
+            "episode_count": 100, "platform_rating": 0.0, "publish_start_date": "2021-01-01",
+            "last_updated_date": "2024-05-13", "genres": ["판타지", "액션"],
+            "authors": [{"uid": str(index), "name": "작가", "role": "BOTH"}],
+        }
+
+    results = {}
+    for name, repository_class in (("json", WebtoonRepository), ("sqlite", SqliteWebtoonRepository)):
+        directory = tempfile.mkdtemp(prefix=f"bench_{name}_")
+        try:
+            repository = repository_class(os.path.join(directory, "webtoon_data.json"),
+                                          os.path.join(directory, "failed_webtoon_list.json"))
+            append_samples = []
+            for start in range(0, record_count, batch_size):
+                batch = [make_record(index) for index in range(start, min(start + batch_size, record_count))]
+                started = time.perf_counter()
+                repository.append_success(batch)
+                append_samples.append(time.perf_counter() - started)
+            compact_s = 0.0
+            if hasattr(repository, "compact"):
+                started = time.perf_counter()
+                repository.compact()
+                compact_s = time.perf_counter() - started
+            if hasattr(repository, "close"):
+                repository.close()
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        tail = append_samples[-max(1, len(append_samples) // 10):]
+        results[name] = {
+            "records": record_count,
+            "append": summarize(append_samples),
+            "last_10pct_append_mean_s": sum(tail) / len(tail),
+            "compact_s": compact_s,
+        }
+    return results
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARK_DIR,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return "unknown"
+
+def flatten(data: Any, prefix: str = "") -> Dict[str, float]:
+    """중첩 dict의 숫자 값을 'a.b.c' 키로 평탄화"""
+    flat = {}
+    if isinstance(data, dict):
+        for key, value in data.items():
+            flat.update(flatten(value, f"{prefix}.{key}" if prefix else str(key)))
+    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+        flat[prefix] = float(data)
+    return flat
+
+def print_comparison(current: Dict[str, Any], baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    base_flat = flatten(baseline["results"])
+    current_flat = flatten(current["results"])
+    print(f"\n비교 기준: {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')})")
+    print(f"{'metric':<60}{'base':>12}{'current':>12}{'change':>10}")
+    for key in sorted(set(base_flat) & set(current_flat)):
+        if not key.endswith(("_s", "_per_sec", "_mb")):
+            continue
+        base_value, current_value = base_flat[key], current_flat[key]
+        change = (current_value - base_value) / base_value * 100 if base_value else 0.0
+        print(f"{key:<60}{base_value:>12.4f}{current_value:>12.4f}{change:>9.1f}%")
+
+def print_summary(results: Dict[str, Any]) -> None:
+    scraper = results.get("scraper")
+    if scraper:
+        latency = scraper["latency"]
+        print(f"[scraper] {scraper['titles']} titles ({scraper['success']} ok), "
+              f"{scraper['titles_per_sec']:.2f} titles/s, {scraper['pages_per_sec']:.2f} pages/s, "
+              f"p50 {latency['p50_s'] * 1000:.1f}ms p90 {latency['p90_s'] * 1000:.1f}ms "
+              f"p99 {latency['p99_s'] * 1000:.1f}ms, peak {scraper['python_peak_mb']:.1f}MB")
+        for name, stats in scraper["stages"].items():
+            print(f"  {name:<28} n={stats['count']:<4} mean {stats['mean_s'] * 1000:8.2f}ms "
+                  f"p90 {stats['p90_s'] * 1000:8.2f}ms total {stats['total_s']:.3f}s")
+    batch = results.get("batch")
+    if batch:
+        print(f"[batch] {batch['titles']} titles, pool {batch['pool_size']}, "
+              f"{batch['titles_per_sec']:.2f} titles/s ({batch['success']} ok / {batch['failure']} failed)")
+    repository = results.get("repository")
+    if repository:
+        for name, stats in repository.items():
+            print(f"[repository:{name}] {stats['records']} records, total {stats['append']['total_s']:.3f}s, "
+                  f"last 10% append mean {stats['last_10pct_append_mean_s'] * 1000:.2f}ms, "
+                  f"compact {stats['compact_s'] * 1000:.1f}ms")
+    print(f"[process] max RSS {results['process_max_rss_mb']:.1f}MB")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", action="append", choices=["scraper", "batch", "repository"],
+                        help="실행할 항목 (여러 번 지정 가능, 기본값: 전체)")
+    parser.add_argument("--driver", choices=["fake", "chrome"], default="fake")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="가짜 드라이버 페이지 이동 지연")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-slow", action="store_true", help="태그가 없어 대기 시간이 긴 타이틀 제외")
+    parser.add_argument("--extraction-mode", choices=["getter", "script"], default="getter")
+    parser.add_argument("--block-resources", action=argparse.BooleanOptionalAction, default=True,
+                        help="chrome 드라이버의 리소스 차단 + eager 로드 사용 여부 (--no-block-resources로 비교)")
+    parser.add_argument("--pool-size", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--records", type=int, default=2000, help="repository 항목의 누적 레코드 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    if args.driver == "fake" and args.extraction_mode == "script":
+        parser.error("단일 스크립트 추출은 --driver chrome에서만 측정할 수 있습니다.")
+
+    suites = args.suite or ["scraper", "batch", "repository"]
+    results: Dict[str, Any] = {}
+    provider = None
+    if {"scraper", "batch"} & set(suites):
+        provider = DriverProvider(args.driver, FixtureSet("naver"), args.latency_ms / 1000, not args.skip_slow,
+                                  block_resources=args.block_resources)
+    try:
+        if "scraper" in suites:
+            results["scraper"] = bench_scraper(provider, args.repeat, args.extraction_mode)
+        if "batch" in suites:
+            results["batch"] = bench_batch(provider, args.repeat, args.pool_size, args.batch_size)
+        if "repository" in suites:
+            results["repository"] = bench_repository(args.records, args.batch_size)
+    finally:
+        if provider:
+            provider.close()
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results["process_max_rss_mb"] = max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "driver": args.driver,
+            "block_resources": args.block_resources,
+            "latency_ms": args.latency_ms,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    print_summary(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+    if args.compare:
+        print_comparison(report, args.compare)
+
+if __name__ == "__main__":
+    main()
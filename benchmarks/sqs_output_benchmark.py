@@ -0,0 +1,126 @@
+"""Lambda 결과 전송(SQS) 방식 비교: 메시지별 send_message vs send_message_batch + 스레드 풀
+
+사용법:
+    python benchmarks/sqs_output_benchmark.py [--titles 100] [--latency-ms 20] [--fail-rate 0.05]
+    python benchmarks/sqs_output_benchmark.py --endpoint-url http://localhost:9324 --queue-url URL
+
+기본값은 호출마다 지연을 흉내내는 메모리 SQS 대역을 사용한다.
+--endpoint-url을 지정하면 ElasticMQ, LocalStack 같은 로컬 SQS 호환 서버로 측정한다.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from modules.aws_service import AWSService
+
+class InMemorySQSClient:
+    """boto3 SQS 클라이언트의 send/delete 계열 메서드만 흉내내는 대역"""
+
+    def __init__(self, latency: float = 0.02, fail_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.messages: List[str] = []
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _call(self) -> None:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.fail_rate
+
+    def send_message(self, QueueUrl: str, MessageBody: str) -> Dict[str, Any]:
+        self._call()
+        with self._lock:
+            self.messages.append(MessageBody)
+            return {"MessageId": str(len(self.messages))}
+
+    def send_message_batch(self, QueueUrl: str, Entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        self._call()
+        successful, failed = [], []
+        for entry in Entries:
+            if self._should_fail():
+                failed.append({"Id": entry["Id"], "SenderFault": False, "Code": "InternalError"})
+                continue
+            with self._lock:
+                self.messages.append(entry["MessageBody"])
+            successful.append({"Id": entry["Id"]})
+        return {"Successful": successful, "Failed": failed}
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str) -> Dict[str, Any]:
+        self._call()
+        return {}
+
+    def delete_message_batch(self, QueueUrl: str, Entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        self._call()
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries], "Failed": []}
+
+def make_messages(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "requestId": str(index),
+            "eventType": "WEBTOON_UPDATE",
+            "data": {
+                "webtoon_id": str(index),
+                "platform": "NAVER",
+                "webtoon_data": {"title": f"웹툰 {index}", "description": "줄거리 " * 50, "genres": ["판타지"]}
+            }
+        }
+        for index in range(count)
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--titles", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="메모리 대역의 호출당 지연")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="메모리 대역의 배치 항목 실패 확률")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--endpoint-url", help="로컬 SQS 호환 서버 주소")
+    parser.add_argument("--queue-url", help="--endpoint-url 사용 시 전송할 큐 URL")
+    args = parser.parse_args()
+
+    if args.endpoint_url:
+        if not args.queue_url:
+            parser.error("--endpoint-url을 사용할 때는 --queue-url이 필요합니다.")
+        service = AWSService(ssm_client=object(), endpoint_url=args.endpoint_url, max_workers=args.workers)
+        client = None
+        queue_url = args.queue_url
+    else:
+        client = InMemorySQSClient(latency=args.latency_ms / 1000, fail_rate=args.fail_rate)
+        service = AWSService(ssm_client=object(), sqs_client=client, max_workers=args.workers)
+        queue_url = "memory://webtoon-update-complete"
+
+    messages = make_messages(args.titles)
+
+    calls_before = client.calls if client else 0
+    started = time.perf_counter()
+    for message in messages:
+        service.send_sqs_message(queue_url, message)
+    sequential_s = time.perf_counter() - started
+    sequential_calls = (client.calls - calls_before) if client else len(messages)
+
+    calls_before = client.calls if client else 0
+    started = time.perf_counter()
+    failed = service.send_sqs_message_batch(queue_url, messages)
+    batch_s = time.perf_counter() - started
+    batch_calls = (client.calls - calls_before) if client else None
+
+    print(f"\n메시지 {len(messages)}건")
+    print(f"  send_message 순차      : {sequential_s * 1000:8.1f}ms, 호출 {sequential_calls}회")
+    print(f"  send_message_batch 동시: {batch_s * 1000:8.1f}ms, 호출 {batch_calls if batch_calls is not None else '-'}회, "
+          f"최종 실패 {len(failed)}건")
+    if batch_s:
+        print(f"  속도 향상: {sequential_s / batch_s:.1f}배")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""픽스처 HTML을 제공하는 로컬 정적 서버 (실제 Chrome 벤치마크용)
+
+python benchmarks/static_server.py --port 8765 로 단독 실행할 수도 있다.
+"""
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlparse
+from fixture_set import FixtureSet
+
+class FixtureServer:
+    """FixtureSet을 HTTP로 제공하는 서버. 리다이렉트 타이틀은 /<원래 호스트>/<경로>로 보냄"""
+
+    def __init__(self, fixture_set: FixtureSet, host: str = "127.0.0.1", port: int = 0):
+        self.fixture_set = fixture_set
+        handler = self._build_handler()
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _build_handler(self):
+        fixture_set = self.fixture_set
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                _, redirect, html = fixture_set.resolve(self.path)
+                if redirect:
+                    # 스크래퍼는 current_url에 "nid.naver.com"이 있는지로 성인 인증 페이지를 판단
+                    parsed = urlparse(redirect)
+                    self.send_response(302)
+                    self.send_header("Location", f"/{parsed.netloc}{parsed.path}")
+                    self.end_headers()
+                    return
+                body = html.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> 'FixtureServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--platform", default="naver")
+    args = parser.parse_args()
+    server = FixtureServer(FixtureSet(args.platform), port=args.port)
+    print(f"픽스처 서버 실행: {server.base_url}")
+    for url in server.fixture_set.urls(server.base_url):
+        print(f"  {url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -1,3 +1,7 @@
 from .batch_processor import BatchProcessor
+from .crawl_checkpoint import CrawlCheckpoint
+from .host_rate_controller import HostRateController
+from .retry_queue import RetryQueue
+from .crawl_scheduler import CrawlScheduler
 
-__all__ = ['BatchProcessor'] 
\ No newline at end of file
+__all__ = ['BatchProcessor', 'CrawlCheckpoint', 'HostRateController', 'RetryQueue', 'CrawlScheduler']
\ No newline at end of file
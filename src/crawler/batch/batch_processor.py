@@ -1,11 +1,13 @@
-from typing import List, Callable, Tuple, Generator
+from typing import List, Callable, Tuple, Generator, Optional
 from utils.logger import logger
+from crawler.batch.crawl_checkpoint import CrawlCheckpoint
 
 class BatchProcessor:
     """배치 처리를 담당하는 클래스"""
     
-    def __init__(self, batch_size: int = 10):
+    def __init__(self, batch_size: int = 10, checkpoint: Optional[CrawlCheckpoint] = None):
         self.batch_size = batch_size
+        self.checkpoint = checkpoint
 
     def process_in_batches(
         self, 
@@ -13,11 +15,23 @@ class BatchProcessor:
         process_func: Callable
     ) -> Generator[Tuple[List[dict], List[dict]], None, None]:
         """아이템들을 배치 단위로 처리하고 각 배치의 결과를 순차적으로 yield
+
+        체크포인트는 yield한 배치를 호출한 쪽이 처리를 마친 뒤에 기록한다.
         
         Args:
             items: 처리할 아이템 리스트
             process_func: 배치 처리 함수
         """
+        if self.checkpoint:
+            # 체크포인트에 기록된 아이템은 건너뛰고 남은 작업만 처리
+            pending = [item for item in items if not self.checkpoint.is_done(item)]
+            if len(pending) != len(items):
+                logger.info("체크포인트 이후부터 처리 재개", extra={
+                    "skipped_count": len(items) - len(pending),
+                    "pending_count": len(pending)
+                })
+            items = pending
+
         total_batches = (len(items) + self.batch_size - 1) // self.batch_size
 
         for batch_num in range(total_batches):
@@ -39,4 +53,9 @@ class BatchProcessor:
                 "failure_count": len(failure_batch)
             })
             
-            yield success_batch, failure_batch 
\ No newline at end of file
+            yield success_batch, failure_batch
+
+            # 호출한 쪽이 배치 결과를 모두 저장하고 다음 배치를 요청한 뒤에만 기록
+            # (저장 중 예외가 발생하면 생성기가 재개되지 않으므로 해당 배치는 다음 실행에서 다시 처리됨)
+            if self.checkpoint:
+                self.checkpoint.record_batch(current_batch, failure_batch) 
\ No newline at end of file
@@ -0,0 +1,130 @@
+import os
+import json
+import hashlib
+from typing import Iterable, List, Optional, Set
+from utils.logger import logger
+from modules.webtoon_url import canonicalize_url
+from models.crawl_failure import CrawlFailure
+
+class CrawlCheckpoint:
+    """배치가 끝날 때마다 진행 상황을 기록하여 중단된 크롤링을 이어서 실행하게 하는 클래스
+
+    파일에는 배치 하나당 한 줄(JSON)을 이어 쓴다. 각 줄에는 완료/실패 URL과 커서만 들어 있다.
+    실패는 재시도해도 소용없는 원인(성인 인증, 선택자 불일치 등)만 기록하고,
+    일시적인 원인(타임아웃, 요청 제한 등)으로 실패한 URL은 이어서 실행할 때 다시 처리한다.
+    수집 결과는 싱크가 이미 받았으므로 기록하지 않는다 (배치는 모든 싱크가 받은 뒤에 기록됨).
+    각 줄에는 URL 목록의 식별자(plan)도 들어 있어, 목록이 바뀐 실행(예: 날마다 바뀌는 CrawlScheduler.plan 결과)에서는
+    이전 진행 상황을 이어받지 않는다.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.completed_urls: Set[str] = set()
+        self.failed_urls: Set[str] = set()
+        self.cursor: int = 0
+        self.plan_id: Optional[str] = None
+
+    @staticmethod
+    def compute_plan_id(urls: Iterable[str]) -> str:
+        """URL 목록의 식별자 (순서와 URL 변형에 관계없이 같은 웹툰 목록이면 같은 값)"""
+        canonical_urls = sorted(set(map(canonicalize_url, urls)))
+        return hashlib.sha256("\n".join(canonical_urls).encode("utf-8")).hexdigest()[:16]
+
+    def _clear_state(self) -> None:
+        self.completed_urls = set()
+        self.failed_urls = set()
+        self.cursor = 0
+
+    def load(self, plan_id: Optional[str] = None) -> bool:
+        """체크포인트 파일을 읽어 상태를 복원. 복원할 내용이 있으면 True
+
+        Args:
+            plan_id: 이번 실행의 URL 목록 식별자 (compute_plan_id). 기록된 식별자와 다르면 복원하지 않고 False
+        """
+        self._clear_state()
+        self.plan_id = plan_id
+        if not os.path.exists(self.filename):
+            return False
+
+        valid_lines = []
+        corrupted = False
+        with open(self.filename, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 종료되어 잘린 줄은 무시 (해당 배치는 다시 처리됨)
+                    logger.warning("손상된 체크포인트 줄을 건너뜁니다.", extra={"filename": self.filename})
+                    corrupted = True
+                    continue
+                if plan_id is not None and entry.get("plan") != plan_id:
+                    logger.info("URL 목록이 바뀌어 이전 체크포인트를 사용하지 않습니다.", extra={
+                        "filename": self.filename,
+                        "plan": plan_id,
+                        "checkpoint_plan": entry.get("plan")
+                    })
+                    self._clear_state()
+                    return False
+                valid_lines.append(line)
+                self.completed_urls.update(canonicalize_url(url) for url in entry["completed"])
+                self.failed_urls.update(canonicalize_url(url) for url in entry["failed"])
+                self.cursor = entry["cursor"]
+
+        if corrupted:
+            # 잘린 줄 뒤에 새 기록이 이어 붙지 않도록 정상 줄만 남겨 다시 씀
+            with open(self.filename, "w", encoding="utf-8") as f:
+                f.write("".join(line + "\n" for line in valid_lines))
+
+        logger.info("체크포인트 복원 완료", extra={
+            "filename": self.filename,
+            "cursor": self.cursor,
+            "completed_count": len(self.completed_urls),
+            "failed_count": len(self.failed_urls)
+        })
+        return self.cursor > 0
+
+    def is_done(self, url: str) -> bool:
+        """이미 처리(성공 또는 일시적이지 않은 실패)된 URL인지 확인 (같은 웹툰의 URL 변형도 처리된 것으로 봄)"""
+        url = canonicalize_url(url)
+        return url in self.completed_urls or url in self.failed_urls
+
+    def record_batch(self, batch_urls: Iterable[str], failure_batch: List[dict]) -> None:
+        """배치의 완료/실패 URL을 파일 끝에 기록 (일시적인 실패는 기록하지 않음)"""
+        failed = []
+        retry = set()
+        for item in failure_batch:
+            url = canonicalize_url(item["url"])
+            if CrawlFailure.from_dict(item).is_transient:
+                retry.add(url)
+            else:
+                failed.append(url)
+        failed_set = set(failed)
+        completed = [url for url in map(canonicalize_url, batch_urls) if url not in failed_set and url not in retry]
+        self.completed_urls.update(completed)
+        self.failed_urls.update(failed)
+        self.cursor += len(completed) + len(failed)
+
+        entry = {
+            "plan": self.plan_id,
+            "cursor": self.cursor,
+            "completed": completed,
+            "failed": failed
+        }
+        with open(self.filename, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def reset(self, plan_id: Optional[str] = None) -> None:
+        """기존 체크포인트를 지우고 처음부터 기록
+
+        Args:
+            plan_id: 새로 기록할 URL 목록의 식별자 (compute_plan_id)
+        """
+        self._clear_state()
+        self.plan_id = plan_id
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
@@ -0,0 +1,163 @@
+import os
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from utils.logger import logger
+from models.enums import DayOfWeek, SerializationStatus
+from modules.webtoon_url import get_external_id, get_record_platform
+
+KST = timezone(timedelta(hours=9))
+
+class CrawlScheduler:
+    """웹툰의 연재 요일과 연재 상태로 이번 실행에서 크롤링할 URL을 고르고 순서를 정하는 클래스
+
+    우선순위 (같은 순위에서는 마지막 크롤링이 오래된 웹툰부터):
+      1. 오늘 새 회차가 올라오는 연재 중 웹툰 (오늘 공개 시각 이후 아직 크롤링하지 않은 경우)
+      2. 저장된 정보가 없거나 요일/상태를 모르는 웹툰 (unknown_interval마다)
+      3. 다른 요일에 연재 중이거나 휴재 중인 웹툰 (ongoing_interval마다)
+      4. 완결 웹툰 (completed_interval마다)
+
+    마지막 크롤링 시각은 "플랫폼:external_id"(저장소의 (platform, external_id)와 같은 기준)를 키로 JSON 파일에 저장한다. mark_crawled()로 바뀐 시각은 메모리에만 반영되며,
+    결과가 저장된 뒤 save()를 호출해야 파일에 기록된다 (FingerprintStore와 같은 방식).
+    """
+
+    TIER_TODAY = "today"
+    TIER_UNKNOWN = "unknown"
+    TIER_ONGOING = "ongoing"
+    TIER_COMPLETED = "completed"
+    TIER_ORDER = (TIER_TODAY, TIER_UNKNOWN, TIER_ONGOING, TIER_COMPLETED)
+
+    # 네이버 요일 웹툰은 전날 23시(KST)에 공개됨
+    RELEASE_HOUR = 23
+
+    def __init__(
+        self,
+        filename: str,
+        ongoing_interval: timedelta = timedelta(days=7),
+        completed_interval: timedelta = timedelta(days=30),
+        unknown_interval: timedelta = timedelta(days=1)
+    ):
+        """
+        Args:
+            filename (str): 웹툰별 마지막 크롤링 시각을 저장할 JSON 파일
+            ongoing_interval (timedelta): 연재 요일이 아닌 연재 중/휴재 웹툰의 크롤링 간격
+            completed_interval (timedelta): 완결 웹툰의 크롤링 간격
+            unknown_interval (timedelta): 요일이나 상태를 모르는 웹툰의 크롤링 간격
+        """
+        self.filename = filename
+        self.intervals: Dict[str, timedelta] = {
+            self.TIER_UNKNOWN: unknown_interval,
+            self.TIER_ONGOING: ongoing_interval,
+            self.TIER_COMPLETED: completed_interval
+        }
+        self._last_crawled: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        if self._last_crawled is None:
+            self._last_crawled = {}
+            if os.path.exists(self.filename):
+                try:
+                    with open(self.filename, "r", encoding="utf-8") as f:
+                        self._last_crawled = json.load(f)
+                except json.JSONDecodeError:
+                    logger.warning("파일이 비어있거나 올바르지 않은 JSON 형식입니다.", extra={"filename": self.filename})
+        return self._last_crawled
+
+    @staticmethod
+    def get_schedule_key(url: str) -> str:
+        """마지막 크롤링 시각의 키. 플랫폼이 다르면 external_id가 같아도 다른 웹툰으로 봄"""
+        return f"{get_record_platform(url)}:{get_external_id(url)}"
+
+    def get_last_crawled(self, url: str) -> Optional[datetime]:
+        key = self.get_schedule_key(url)
+        with self._lock:
+            value = self._load().get(key)
+        return datetime.fromisoformat(value) if value else None
+
+    def mark_crawled(self, urls: Iterable[str], now: Optional[datetime] = None) -> None:
+        """크롤링을 마친 웹툰의 시각 갱신 (save() 전까지는 메모리에만 반영)"""
+        crawled_at = (now or datetime.now(KST)).isoformat()
+        with self._lock:
+            last_crawled = self._load()
+            for url in urls:
+                last_crawled[self.get_schedule_key(url)] = crawled_at
+
+    def save(self) -> None:
+        """마지막 크롤링 시각을 파일에 기록"""
+        with self._lock:
+            last_crawled = self._load()
+            temp_filename = f"{self.filename}.tmp"
+            try:
+                with open(temp_filename, "w", encoding="utf-8") as f:
+                    json.dump(last_crawled, f, ensure_ascii=False)
+                os.replace(temp_filename, self.filename)
+                logger.info("크롤링 일정 저장 완료", extra={"count": len(last_crawled), "filename": self.filename})
+            except Exception as e:
+                logger.error("크롤링 일정 저장 실패", error=e)
+
+    def get_release_day(self, now: datetime) -> Tuple[DayOfWeek, datetime]:
+        """now 시점에 가장 최근에 공개된 요일과 그 공개 시각 (KST)"""
+        now = now.astimezone(KST)
+        release_shift = timedelta(hours=24 - self.RELEASE_HOUR)
+        release_date = (now + release_shift).date()
+        released_at = datetime(release_date.year, release_date.month, release_date.day, tzinfo=KST) - release_shift
+        return list(DayOfWeek)[release_date.weekday()], released_at
+
+    def classify(self, metadata: Optional[dict], today: DayOfWeek) -> str:
+        """웹툰 정보({"day_of_week", "serialization_status"})로 순위 분류"""
+        metadata = metadata or {}
+        status = metadata.get("serialization_status")
+        day_of_week = metadata.get("day_of_week")
+        if status == SerializationStatus.COMPLETED.name:
+            return self.TIER_COMPLETED
+        if status == SerializationStatus.ONGOING.name and day_of_week == today.name:
+            return self.TIER_TODAY
+        if status in (SerializationStatus.ONGOING.name, SerializationStatus.HIATUS.name) and day_of_week:
+            return self.TIER_ONGOING
+        return self.TIER_UNKNOWN
+
+    def plan(
+        self,
+        urls: Iterable[str],
+        metadata: Dict[Tuple[str, str], dict],
+        now: Optional[datetime] = None,
+        budget: Optional[int] = None
+    ) -> List[str]:
+        """이번 실행에서 크롤링할 URL을 우선순위 순서로 반환
+
+        Args:
+            urls: 전체 URL 목록
+            metadata: (platform, external_id)별 {"day_of_week", "serialization_status"} (SqliteWebtoonRepository.get_crawl_metadata())
+            now: 기준 시각. 기본값은 현재 시각
+            budget: 이번 실행에서 크롤링할 최대 웹툰 수. None이면 기한이 된 웹툰 모두
+        """
+        now = (now or datetime.now(KST)).astimezone(KST)
+        today, released_at = self.get_release_day(now)
+        due: List[Tuple[int, datetime, str]] = []
+        tier_counts = dict.fromkeys(self.TIER_ORDER, 0)
+        oldest = datetime.min.replace(tzinfo=KST)
+
+        for url in urls:
+            tier = self.classify(metadata.get((get_record_platform(url), get_external_id(url))), today)
+            last_crawled = self.get_last_crawled(url)
+            if tier == self.TIER_TODAY:
+                is_due = last_crawled is None or last_crawled < released_at
+            else:
+                is_due = last_crawled is None or now - last_crawled >= self.intervals[tier]
+            if is_due:
+                due.append((self.TIER_ORDER.index(tier), last_crawled or oldest, url))
+                tier_counts[tier] += 1
+
+        due.sort(key=lambda item: (item[0], item[1]))
+        planned = [url for _, _, url in due]
+        if budget is not None:
+            planned = planned[:budget]
+        logger.info("크롤링 일정 계획 완료", extra={
+            "today": today.name,
+            "due_counts": tier_counts,
+            "planned_count": len(planned),
+            "budget": budget
+        })
+        return planned
@@ -0,0 +1,185 @@
+import time
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from utils.logger import logger
+
+@dataclass
+class HostState:
+    """호스트 하나의 동시 요청 한도와 관측값"""
+    limit: float
+    in_flight: int = 0
+    latency_ewma: Optional[float] = None
+    base_latency: Optional[float] = None
+    paused_until: float = 0.0
+    last_decrease: float = 0.0
+    consecutive_blocked: int = 0
+    successes: int = 0
+    timeouts: int = 0
+    blocked: int = 0
+    errors: int = 0
+    decreases: int = 0
+
+class HostRateController:
+    """호스트별 동시 요청 수를 AIMD 방식으로 조절하는 클래스
+
+    - 성공: 한도만큼 성공할 때마다 한도가 1씩 늘어남 (가산 증가)
+    - 타임아웃, 지연 급증, 연속된 로그인/봇 리다이렉트: 한도를 decrease_factor배로 줄임 (곱셈 감소)
+    - 감소는 평균 지연 시간 한 번에 최대 한 번만 적용하여 같은 혼잡으로 여러 번 줄이지 않음
+    - 연속 리다이렉트는 추가로 block_pause초 동안 해당 호스트 요청을 멈춤
+
+    성인 웹툰처럼 정상적으로 로그인 페이지로 이동하는 경우가 있으므로,
+    리다이렉트는 block_threshold번 연속될 때만 혼잡 신호로 본다.
+
+    사용법:
+        host = controller.acquire(url)
+        started = time.perf_counter()
+        ... 요청 ...
+        controller.release(host, time.perf_counter() - started, HostRateController.OUTCOME_SUCCESS)
+    """
+
+    OUTCOME_SUCCESS = "success"
+    OUTCOME_TIMEOUT = "timeout"
+    OUTCOME_BLOCKED = "blocked"  # 로그인/봇 확인 페이지로 리다이렉트
+    OUTCOME_ERROR = "error"  # 혼잡과 무관한 실패 (선택자 누락 등)
+
+    BASE_LATENCY_DRIFT = 1.01  # 성공 한 번마다 기준 지연이 올라가는 비율
+
+    def __init__(
+        self,
+        max_limit: int = 4,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_alpha: float = 0.2,
+        block_threshold: int = 3,
+        block_pause: float = 5.0
+    ):
+        """
+        Args:
+            max_limit (int): 호스트당 최대 동시 요청 수 (보통 드라이버 풀 크기)
+            min_limit (int): 호스트당 최소 동시 요청 수
+            initial_limit (int, optional): 시작 한도. 기본값은 min(2, max_limit)
+            decrease_factor (float): 혼잡 시 한도에 곱할 값
+            latency_tolerance (float): 평균 지연이 최저 평균 지연의 몇 배를 넘으면 혼잡으로 볼지
+            latency_alpha (float): 평균 지연(EWMA) 갱신 비율
+            block_threshold (int): 혼잡으로 판단할 연속 리다이렉트 수
+            block_pause (float): 연속 리다이렉트 시 요청을 멈출 시간(초)
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError(f"잘못된 한도 설정: min_limit={min_limit}, max_limit={max_limit}")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.initial_limit = min(max(initial_limit or min(2, max_limit), min_limit), max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.latency_alpha = latency_alpha
+        self.block_threshold = block_threshold
+        self.block_pause = block_pause
+        self._hosts: Dict[str, HostState] = {}
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def _get_state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(limit=float(self.initial_limit))
+        return state
+
+    def acquire(self, url: str) -> str:
+        """호스트의 동시 요청 수가 한도 아래로 내려갈 때까지 기다린 뒤 자리를 차지하고 호스트를 반환"""
+        host = self.get_host(url)
+        with self._condition:
+            state = self._get_state(host)
+            while True:
+                wait_time = state.paused_until - time.monotonic()
+                if wait_time <= 0 and state.in_flight < int(state.limit):
+                    state.in_flight += 1
+                    return host
+                self._condition.wait(timeout=wait_time if wait_time > 0 else None)
+
+    def release(self, host: str, latency: Optional[float], outcome: str) -> None:
+        """요청 결과를 반영하고 자리를 반납
+
+        Args:
+            host (str): acquire()가 반환한 호스트
+            latency (float, optional): 요청 소요 시간. 지문 비교만 한 경우처럼 일반 요청과 비교할 수 없으면 None
+            outcome (str): OUTCOME_* 중 하나
+        """
+        with self._condition:
+            state = self._get_state(host)
+            state.in_flight = max(state.in_flight - 1, 0)
+            now = time.monotonic()
+
+            if outcome == self.OUTCOME_BLOCKED:
+                state.blocked += 1
+                state.consecutive_blocked += 1
+                if state.consecutive_blocked >= self.block_threshold:
+                    state.paused_until = max(state.paused_until, now + self.block_pause)
+                    self._decrease(host, state, now, "blocked")
+            else:
+                state.consecutive_blocked = 0
+
+            if outcome == self.OUTCOME_TIMEOUT:
+                state.timeouts += 1
+                self._decrease(host, state, now, "timeout")
+            elif outcome == self.OUTCOME_ERROR:
+                state.errors += 1
+            elif outcome == self.OUTCOME_SUCCESS:
+                state.successes += 1
+                if latency is not None:
+                    self._observe_latency(state, latency)
+                if latency is not None and state.latency_ewma > state.base_latency * self.latency_tolerance:
+                    self._decrease(host, state, now, "latency")
+                else:
+                    state.limit = min(state.limit + 1 / state.limit, float(self.max_limit))
+
+            self._condition.notify_all()
+
+    def _observe_latency(self, state: HostState, latency: float) -> None:
+        if state.latency_ewma is None:
+            state.latency_ewma = latency
+        else:
+            state.latency_ewma += self.latency_alpha * (latency - state.latency_ewma)
+        if state.base_latency is None:
+            state.base_latency = state.latency_ewma
+        else:
+            # 기준 지연은 최저값을 따르되 조금씩 올라가게 하여 초기의 우연히 빠른 응답에 고정되지 않게 함
+            state.base_latency = min(state.base_latency * self.BASE_LATENCY_DRIFT, state.latency_ewma)
+
+    def _decrease(self, host: str, state: HostState, now: float, reason: str) -> None:
+        """평균 지연 시간 안에 이미 줄였거나 이미 최소 한도면 줄이지 않음"""
+        if now - state.last_decrease < (state.latency_ewma or 0.0) or state.limit <= self.min_limit:
+            return
+        previous = state.limit
+        state.limit = max(state.limit * self.decrease_factor, float(self.min_limit))
+        state.last_decrease = now
+        state.decreases += 1
+        logger.warning("호스트 동시 요청 한도 감소", extra={
+            "host": host,
+            "reason": reason,
+            "limit": round(state.limit, 2),
+            "previous_limit": round(previous, 2)
+        })
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """호스트별 현재 한도와 누적 관측값"""
+        with self._condition:
+            return {
+                host: {
+                    "limit": round(state.limit, 2),
+                    "in_flight": state.in_flight,
+                    "latency_ewma_s": round(state.latency_ewma or 0.0, 4),
+                    "successes": state.successes,
+                    "timeouts": state.timeouts,
+                    "blocked": state.blocked,
+                    "errors": state.errors,
+                    "decreases": state.decreases
+                }
+                for host, state in self._hosts.items()
+            }
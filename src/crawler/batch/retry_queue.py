@@ -0,0 +1,69 @@
+import time
+import heapq
+import random
+import itertools
+from typing import List, Optional, Tuple
+
+class RetryQueue:
+    """일시적인 실패를 지수 백오프와 지터를 적용해 다시 시도하기 위한 큐
+
+    n번째 시도가 실패하면 base_delay * 2^(n-1)초(최대 max_delay)의 절반에
+    나머지 절반 범위의 무작위 지연을 더한 시각 이후에 다시 꺼낼 수 있다.
+    여러 세션이 같은 순간에 재시도하며 다시 몰리지 않도록 지터를 적용한다.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Args:
+            max_attempts (int): URL당 최대 시도 횟수 (첫 시도 포함)
+            base_delay (float): 첫 재시도 전 기본 대기 시간(초)
+            max_delay (float): 재시도 전 최대 대기 시간(초)
+            rng (random.Random, optional): 지터에 사용할 난수 생성기
+        """
+        if max_attempts < 1:
+            raise ValueError(f"최대 시도 횟수는 1 이상이어야 합니다: {max_attempts}")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng or random.Random()
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._sequence = itertools.count()
+        self.scheduled_count = 0
+
+    def get_delay(self, attempts: int) -> float:
+        """attempts번 시도한 뒤 다음 시도까지 기다릴 시간"""
+        delay = min(self.base_delay * (2 ** (attempts - 1)), self.max_delay)
+        return delay / 2 + self._rng.uniform(0, delay / 2)
+
+    def push(self, url: str, attempts: int) -> bool:
+        """재시도를 예약. 최대 시도 횟수에 도달했으면 False"""
+        if attempts >= self.max_attempts:
+            return False
+        ready_at = time.monotonic() + self.get_delay(attempts)
+        heapq.heappush(self._heap, (ready_at, next(self._sequence), url, attempts))
+        self.scheduled_count += 1
+        return True
+
+    def pop_ready(self) -> List[Tuple[str, int]]:
+        """가장 이른 재시도 시각까지 기다린 뒤 시각이 된 (URL, 이전 시도 횟수)를 모두 반환. 비어 있으면 빈 리스트"""
+        if not self._heap:
+            return []
+        wait_time = self._heap[0][0] - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        now = time.monotonic()
+        ready = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, url, attempts = heapq.heappop(self._heap)
+            ready.append((url, attempts))
+        return ready
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -0,0 +1,15 @@
+from .i_result_sink import IResultSink
+from .memory_result_sink import MemoryResultSink
+from .jsonl_result_sink import JsonlResultSink
+from .repository_result_sink import RepositoryResultSink
+from .sqs_result_sink import SqsResultSink
+from .schedule_result_sink import ScheduleResultSink
+
+__all__ = [
+    'IResultSink',
+    'MemoryResultSink',
+    'JsonlResultSink',
+    'RepositoryResultSink',
+    'SqsResultSink',
+    'ScheduleResultSink'
+]
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+class IResultSink(ABC):
+    """크롤러가 배치를 끝낼 때마다 결과를 받는 출력 인터페이스"""
+
+    @abstractmethod
+    def write_batch(self, success_batch: List[dict], failure_batch: List[dict], unchanged_batch: List[dict]) -> None:
+        """배치 하나의 수집 결과, 실패 목록, 지문이 같아 건너뛴 목록을 받아 처리"""
+        pass
+
+    def close(self) -> None:
+        """크롤러 종료 시 호출 (열어 둔 자원 정리)"""
+        pass
@@ -0,0 +1,34 @@
+import json
+from typing import List, Optional
+from .i_result_sink import IResultSink
+
+class JsonlResultSink(IResultSink):
+    """배치마다 결과를 JSONL 파일 끝에 이어 쓰는 싱크
+
+    중복을 확인하지 않고 그대로 추가한다. 체크포인트로 재개하면 마지막 배치가 다시 기록될 수 있으므로
+    중복 제거가 필요하면 RepositoryResultSink(SqliteWebtoonRepository)를 사용한다.
+    """
+
+    def __init__(self, success_filename: str, failure_filename: str, unchanged_filename: Optional[str] = None):
+        """
+        Args:
+            success_filename (str): 수집 결과를 기록할 JSONL 파일
+            failure_filename (str): 실패 목록을 기록할 JSONL 파일
+            unchanged_filename (str, optional): 지문이 같아 건너뛴 목록을 기록할 JSONL 파일. 없으면 기록하지 않음
+        """
+        self.success_filename = success_filename
+        self.failure_filename = failure_filename
+        self.unchanged_filename = unchanged_filename
+
+    @staticmethod
+    def _append(filename: Optional[str], records: List[dict]) -> None:
+        if not filename or not records:
+            return
+        # 배치 전체를 한 번에 써서 중간에 끊겨도 배치 단위로만 잘리게 함
+        with open(filename, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+
+    def write_batch(self, success_batch: List[dict], failure_batch: List[dict], unchanged_batch: List[dict]) -> None:
+        self._append(self.success_filename, success_batch)
+        self._append(self.failure_filename, failure_batch)
+        self._append(self.unchanged_filename, unchanged_batch)
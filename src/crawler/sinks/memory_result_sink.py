@@ -0,0 +1,27 @@
+from typing import List, Tuple
+from .i_result_sink import IResultSink
+
+class MemoryResultSink(IResultSink):
+    """결과를 메모리에 모아 두는 싱크 (get_results() 호환, 테스트/벤치마크용)
+
+    전체 결과를 보관하므로 메모리가 크롤링한 웹툰 수에 비례한다.
+    대량 크롤링에는 JsonlResultSink나 RepositoryResultSink를 사용한다.
+    """
+
+    def __init__(self):
+        self.success_results: List[dict] = []
+        self.failure_results: List[dict] = []
+        self.unchanged_results: List[dict] = []
+
+    def write_batch(self, success_batch: List[dict], failure_batch: List[dict], unchanged_batch: List[dict]) -> None:
+        self.success_results.extend(success_batch)
+        self.failure_results.extend(failure_batch)
+        self.unchanged_results.extend(unchanged_batch)
+
+    def get_results(self) -> Tuple[List[dict], List[dict]]:
+        return self.success_results, self.failure_results
+
+    def reset(self) -> None:
+        self.success_results = []
+        self.failure_results = []
+        self.unchanged_results = []
@@ -0,0 +1,21 @@
+from typing import List
+from .i_result_sink import IResultSink
+
+class RepositoryResultSink(IResultSink):
+    """배치마다 결과를 저장소(SqliteWebtoonRepository, SqliteEpisodeRepository, WebtoonRepository 등)에 추가하는 싱크
+
+    저장소는 append_success(data_list), append_failure(data_list)를 제공해야 한다.
+    append_unchanged(data_list)도 제공하면 새 결과 없이 성공한 항목을 전달한다 (이전 실패 기록 삭제 등).
+    저장에 실패하면 저장소의 예외를 그대로 전달하므로 해당 배치는 체크포인트에 기록되지 않는다.
+    """
+
+    def __init__(self, repository):
+        self.repository = repository
+
+    def write_batch(self, success_batch: List[dict], failure_batch: List[dict], unchanged_batch: List[dict]) -> None:
+        if success_batch:
+            self.repository.append_success(success_batch)
+        if failure_batch:
+            self.repository.append_failure(failure_batch)
+        if unchanged_batch and hasattr(self.repository, "append_unchanged"):
+            self.repository.append_unchanged(unchanged_batch)
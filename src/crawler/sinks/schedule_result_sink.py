@@ -0,0 +1,23 @@
+from typing import List
+from .i_result_sink import IResultSink
+
+class ScheduleResultSink(IResultSink):
+    """배치마다 수집했거나 지문이 같아 건너뛴 웹툰의 마지막 크롤링 시각을 CrawlScheduler에 기록하는 싱크
+
+    실패한 웹툰은 기록하지 않으므로 다음 실행에서 다시 일정에 포함된다.
+    """
+
+    def __init__(self, scheduler):
+        """
+        Args:
+            scheduler (CrawlScheduler): 마지막 크롤링 시각을 기록할 스케줄러
+        """
+        self.scheduler = scheduler
+
+    def write_batch(self, success_batch: List[dict], failure_batch: List[dict], unchanged_batch: List[dict]) -> None:
+        self.scheduler.mark_crawled(
+            [record["link"] for record in success_batch] + [record["url"] for record in unchanged_batch]
+        )
+
+    def close(self) -> None:
+        self.scheduler.save()
@@ -0,0 +1,34 @@
+from typing import Callable, List
+from utils.logger import logger
+from .i_result_sink import IResultSink
+
+class SqsResultSink(IResultSink):
+    """배치마다 결과를 SQS 메시지로 변환해 크롤링 도중에 바로 전송하는 싱크
+
+    전송하지 못한 메시지는 unsent_messages에 모아 두므로, 크롤링이 끝난 뒤 확인해
+    지문 저장이나 요청 실패 처리를 결정한다.
+    """
+
+    def __init__(
+        self,
+        build_messages: Callable[[List[dict], List[dict]], List[dict]],
+        send_batch: Callable[[List[dict]], List[dict]]
+    ):
+        """
+        Args:
+            build_messages (Callable): (수집 결과 배치, 변경 없음 배치)를 받아 전송할 메시지 목록을 반환
+            send_batch (Callable): 메시지 목록을 전송하고 전송하지 못한 메시지 목록을 반환 (예: AWSService.send_sqs_message_batch)
+        """
+        self.build_messages = build_messages
+        self.send_batch = send_batch
+        self.sent_count = 0
+        self.unsent_messages: List[dict] = []
+
+    def write_batch(self, success_batch: List[dict], failure_batch: List[dict], unchanged_batch: List[dict]) -> None:
+        messages = self.build_messages(success_batch, unchanged_batch)
+        if not messages:
+            return
+        unsent = self.send_batch(messages)
+        self.sent_count += len(messages) - len(unsent)
+        self.unsent_messages.extend(unsent)
+        logger.info("배치 결과 SQS 전송", extra={"sent": len(messages) - len(unsent), "unsent": len(unsent)})
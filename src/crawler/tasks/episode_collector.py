@@ -1,20 +1,168 @@
-from crawler.common.i_webtoon_crawler import IWebtoonCrawler
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from utils.logger import logger
+from utils.stage_timer import stage_timer
+from crawler.tasks.init_webtoon_crawler import InitWebtoonCrawler
+from crawler.sinks import RepositoryResultSink
+from modules.web_driver import ManagedDriverSession
+from modules.webtoon_url import get_title_key
+from scrapers.webtoon_scraper_factory import WebtoonScraperFactory
+from scrapers.common import IEpisodeScraper
+from models.episode import EpisodeDTO
+from models.enums import FailureType
+from selenium.webdriver.remote.webdriver import WebDriver
 
-class EpisodeCollectorCrawler(IWebtoonCrawler):
-    def __init__(self):
-        # 셋업: driver, scraper, repository 등
-        pass
+class EpisodeCollectorCrawler(InitWebtoonCrawler):
+    """웹툰별 회차 목록을 수집하는 크롤러
 
-    def initialize(self, url_list: List[str]) -> None:
-        pass
+    회차 목록을 최신 회차부터 한 페이지씩 읽다가 저장소에 있는 마지막 회차 번호에 도달하면 멈춘다.
+    매일 실행하면 웹툰당 보통 첫 페이지 하나만 읽는다. 처음 수집하는 웹툰은 전체 회차를 읽는다.
 
-    def run(self) -> None:
-        # 각 웹툰 URL에서 에피소드 목록 긁어오기
-        pass
+    한 웹툰의 새 회차는 모두 같은 배치 결과로 싱크에 전달되므로(저장소에서는 한 트랜잭션),
+    중간에 중단되어도 일부 페이지만 저장되어 이전 회차가 빠지는 일은 없다.
+
+    범위를 벗어난 page= 요청에 마지막 페이지가 다시 오는 경우에 대비해, 처음 보는 회차 번호가 없는 페이지에서
+    멈추고 웹툰당 max_pages_per_title 페이지까지만 읽는다.
+
+    세션 풀, 호스트별 속도 조절, 재시도, 세션 재시작, 체크포인트, 싱크는 InitWebtoonCrawler와 같다.
+    """
+
+    def __init__(self, episode_repository=None, max_pages_per_title: int = 300, **kwargs):
+        """
+        Args:
+            episode_repository (SqliteEpisodeRepository, optional): 웹툰별 마지막 회차 번호를 조회할 저장소.
+                                                                     없으면 항상 전체 회차를 수집
+            max_pages_per_title (int): 웹툰 하나에서 읽을 최대 페이지 수. 넘으면 해당 웹툰은 실패로 기록
+            **kwargs: InitWebtoonCrawler 인자 (platform은 회차 스크래퍼 이름, fingerprint_store는 사용하지 않음).
+                      sinks의 기본값은 저장소가 있으면 RepositoryResultSink, 없으면 MemoryResultSink
+        """
+        kwargs["fingerprint_store"] = None
+        if kwargs.get("sinks") is None and episode_repository is not None:
+            kwargs["sinks"] = [RepositoryResultSink(episode_repository)]
+        super().__init__(**kwargs)
+        self.episode_repository = episode_repository
+        self.max_pages_per_title = max_pages_per_title
+        self.title_count = 0
+        self._pages_at_start = 0
+
+    def _create_scraper(self, driver: WebDriver, platform: str) -> IEpisodeScraper:
+        return WebtoonScraperFactory.create_episode_scraper(driver, platform=platform)
+
+    def initialize(self, url_list: List[str], resume: bool = False) -> None:
+        super().initialize(url_list, resume=resume)
+        self.title_count = 0
+        self._pages_at_start = self.driver_pool.summary()["pages"]
+
+    def _fetch_page(
+        self,
+        url: str,
+        page: int,
+        scraper: IEpisodeScraper,
+        session: ManagedDriverSession
+    ) -> Tuple[bool, List[EpisodeDTO], bool]:
+        """세션 재시작 조건을 확인한 뒤 페이지를 수집. 세션이 죽어 실패했다면 새 세션으로 한 번 더 수집"""
+        for _ in range(2):
+            driver = session.before_page()
+            if scraper.driver is not driver:
+                scraper.set_driver(driver)
+            success, episodes, has_next = scraper.fetch_episode_page(url, page)
+            session.after_page()
+            if success or scraper.last_failure not in self.SESSION_FAILURES or not session.restart_if_dead():
+                break
+        return success, episodes, has_next
+
+    @stage_timer.timed("episode.collect_title")
+    def collect_title(
+        self,
+        url: str,
+        scraper: Optional[IEpisodeScraper] = None,
+        session: Optional[ManagedDriverSession] = None
+    ) -> Tuple[bool, List[EpisodeDTO], Optional[FailureType]]:
+        """웹툰 하나의 새 회차를 수집
 
-    def get_results(self) -> None:
-        pass
+        Returns:
+            (성공 여부, 저장된 마지막 회차 이후의 회차 목록, 실패 원인)
+        """
+        scraper = scraper or self.scraper
+        session = session or self.driver_pool.sessions[0]
+        last_episode_no = None
+        if self.episode_repository is not None:
+            last_episode_no = self.episode_repository.get_last_episode_no(
+                scraper.PLATFORM_NAME.name, get_title_key(url).title_id
+            )
+
+        new_episodes: List[EpisodeDTO] = []
+        seen_episode_nos = set()
+        page = 1
+        while True:
+            success, episodes, has_next = self._fetch_page(url, page, scraper, session)
+            if not success:
+                return False, [], scraper.last_failure
+            unseen = [episode for episode in episodes if episode.episode_no not in seen_episode_nos]
+            seen_episode_nos.update(episode.episode_no for episode in unseen)
+            new_episodes.extend(
+                episode for episode in unseen
+                if last_episode_no is None or episode.episode_no > last_episode_no
+            )
+            reached_stored = last_episode_no is not None and any(
+                episode.episode_no <= last_episode_no for episode in episodes
+            )
+            # 처음 보는 회차가 없으면 같은 페이지가 반복된 것으로 보고 멈춤
+            if reached_stored or not has_next or not unseen:
+                break
+            if page >= self.max_pages_per_title:
+                # 오래된 회차가 빠진 채 저장되면 이후 실행에서 채울 수 없으므로 실패로 기록
+                logger.error("회차 목록 페이지 수 제한 도달", extra={"url": url, "pages": page})
+                return False, [], FailureType.SELECTOR_MISS
+            page += 1
+
+        logger.info("회차 목록 수집 완료", extra={
+            "url": url,
+            "last_episode_no": last_episode_no,
+            "new_count": len(new_episodes),
+            "pages": page
+        })
+        return True, new_episodes, None
+
+    def _fetch_url(
+        self,
+        url: str,
+        scraper: IEpisodeScraper,
+        session: ManagedDriverSession
+    ) -> Tuple[bool, Optional[List[dict]], Optional[FailureType]]:
+        """웹툰 하나의 새 회차를 수집하여 오래된 회차부터 정렬된 레코드 목록으로 반환
+
+        새 회차 없이 성공한 웹툰은 unchanged_batch에 모아 두었다가 배치가 끝나면 싱크로 전달한다.
+        """
+        try:
+            success, episodes, failure_type = self.collect_title(url, scraper, session)
+        except Exception as e:
+            logger.error("회차 목록 처리 중 오류 발생", error=e, extra={"url": url})
+            return False, None, FailureType.UNKNOWN
+        if not success:
+            return False, None, failure_type or FailureType.UNKNOWN
+        if not episodes:
+            # 새 회차가 없어도 성공했으므로 저장소가 이전 실패 기록을 지울 수 있도록 전달
+            self._add_unchanged({"url": url, "external_id": get_title_key(url).title_id})
+        return True, [episode.to_dict() for episode in reversed(episodes)], None
+
+    def _process_batch(self, url_batch: List[str]) -> Tuple[List[dict], List[dict]]:
+        """배치 단위로 웹툰의 새 회차를 수집. 성공 목록은 회차 레코드, 실패 목록은 웹툰 단위"""
+        title_batch, failure_batch = super()._process_batch(url_batch)
+        self.title_count += len(url_batch)
+        return [episode for episodes in title_batch for episode in episodes], failure_batch
+
+    def run(self) -> None:
+        """크롤링 실행"""
+        try:
+            super().run()
+        finally:
+            logger.info("회차 수집 결과", extra=self.get_summary())
 
-    def shutdown(self) -> None:
-        pass
+    def get_summary(self) -> Dict[str, int]:
+        """처리한 웹툰 수, 새 회차 수, 실패 수, 읽은 페이지 수 반환"""
+        return {
+            "titles": self.title_count,
+            "episodes": self.success_count,
+            "failures": self.failure_count,
+            "pages": self.driver_pool.summary()["pages"] - self._pages_at_start
+        }
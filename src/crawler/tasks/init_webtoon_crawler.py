@@ -1,62 +1,295 @@
+import time
 import atexit
-from typing import List, Optional, Tuple
+import threading
+from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from utils.logger import logger
-from modules.web_driver import IWebDriverManager, WebDriverFactory
+from utils.stage_timer import stage_timer
+from modules.web_driver import IWebDriverManager, WebDriverFactory, WebDriverPool, ManagedDriverSession
 from scrapers.webtoon_scraper_factory import WebtoonScraperFactory
+from scrapers.common import IWebtoonScraper
 from crawler import IWebtoonCrawler
 from crawler.batch.batch_processor import BatchProcessor
+from crawler.batch.crawl_checkpoint import CrawlCheckpoint
+from crawler.batch.host_rate_controller import HostRateController
+from crawler.batch.retry_queue import RetryQueue
+from crawler.sinks import IResultSink, MemoryResultSink
+from modules.fingerprint_store import FingerprintStore
+from modules.webtoon_url import TitleIndex, get_title_key
+from models.enums import FailureType
+from models.crawl_failure import CrawlFailure
 from selenium.webdriver.remote.webdriver import WebDriver
 
 class InitWebtoonCrawler(IWebtoonCrawler):
     """웹툰 초기화 크롤러 클래스"""
 
+    # 스크래퍼의 실패 원인별 속도 조절 신호 (그 외 실패는 혼잡과 무관한 오류로 처리)
+    FAILURE_OUTCOMES = {
+        FailureType.TIMEOUT: HostRateController.OUTCOME_TIMEOUT,
+        FailureType.LOGIN_REDIRECT: HostRateController.OUTCOME_BLOCKED,
+        FailureType.THROTTLED: HostRateController.OUTCOME_BLOCKED,
+    }
+    # 세션이 죽었을 수 있는 실패 (세션 상태를 확인하고 죽었으면 재시작)
+    SESSION_FAILURES = (FailureType.DRIVER_CRASH, FailureType.UNKNOWN, None)
+
     def __init__(
         self,
         driver_manager: Optional[IWebDriverManager] = None,
         batch_size: int = 10,
-        environment: Optional[str] = None
+        environment: Optional[str] = None,
+        pool_size: int = 1,
+        headless: bool = True,
+        web_driver_factory: Optional[WebDriverFactory] = None,
+        platform: str = "naver",
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        fingerprint_store: Optional[FingerprintStore] = None,
+        rate_controller: Optional[HostRateController] = None,
+        retry_queue: Optional[RetryQueue] = None,
+        max_pages_per_session: Optional[int] = 300,
+        max_session_rss_mb: Optional[float] = 2048,
+        sinks: Optional[List[IResultSink]] = None
     ):
-        self.driver_manager = driver_manager or WebDriverFactory.create_driver(
+        """
+        웹툰 초기화 크롤러 초기화
+
+        Args:
+            driver_manager (IWebDriverManager, optional): 첫 번째 세션에 사용할 드라이버 매니저
+            batch_size (int): 배치 크기
+            environment (str, optional): 실행 환경 ("local", "docker_lambda")
+            pool_size (int): 동시에 실행할 Chrome 세션 수. 1이면 순차 처리
+            headless (bool): 추가 세션의 헤드리스 모드 사용 여부
+            web_driver_factory (WebDriverFactory, optional): 추가 세션 생성에 사용할 팩토리
+            platform (str): 스크래퍼 팩토리에 등록된 플랫폼 이름 ("naver", "naver_http")
+            checkpoint (CrawlCheckpoint, optional): 배치마다 진행 상황을 기록할 체크포인트
+            fingerprint_store (FingerprintStore, optional): 지정하면 지문이 같은 웹툰은 전체 수집을 건너뜀
+            rate_controller (HostRateController, optional): 호스트별 동시 요청 수 조절기. 기본값은 풀 크기를 상한으로 생성
+            retry_queue (RetryQueue, optional): 일시적인 실패(타임아웃, 요청 제한, 세션 오류 등)를 같은 배치 안에서 다시 시도할 큐
+            max_pages_per_session (int, optional): Chrome 세션을 새로 만들기 전까지 처리할 최대 페이지 수
+            max_session_rss_mb (float, optional): Chrome 세션을 새로 만들 메모리(RSS) 상한(MB)
+            sinks (List[IResultSink], optional): 배치가 끝날 때마다 결과를 받을 싱크 목록.
+                                                 기본값은 get_results()용 MemoryResultSink 하나
+        """
+        if pool_size < 1:
+            raise ValueError(f"풀 크기는 1 이상이어야 합니다: {pool_size}")
+
+        web_driver_factory = web_driver_factory or WebDriverFactory()
+        self.driver_manager = driver_manager or web_driver_factory.create_driver(
             environment=environment,
-            headless=True
+            headless=headless
         )
-        self.driver: WebDriver = self.driver_manager.get_driver()
-        self.scraper = WebtoonScraperFactory.create_basic_info_scraper(self.driver, platform="naver")
-        self.batch_processor = BatchProcessor(batch_size)
+        managers = [self.driver_manager] + [
+            web_driver_factory.create_driver(environment=environment, headless=headless)
+            for _ in range(pool_size - 1)
+        ]
+        self.driver_pool = WebDriverPool(managers, max_pages=max_pages_per_session, max_rss_mb=max_session_rss_mb)
+        self.driver: WebDriver = self.driver_pool.drivers[0]
+        # 세션마다 독립된 스크래퍼를 사용 (스크래퍼는 드라이버 상태를 공유하면 안 됨)
+        self.scrapers: List[IWebtoonScraper] = [
+            self._create_scraper(driver, platform)
+            for driver in self.driver_pool.drivers
+        ]
+        self.scraper = self.scrapers[0]
+        self.checkpoint = checkpoint
+        self.fingerprint_store = fingerprint_store
+        self.rate_controller = rate_controller or HostRateController(max_limit=pool_size)
+        self.retry_queue = retry_queue or RetryQueue()
+        self.recovered_count = 0
+        # 배치가 풀보다 작으면 남는 세션이 놀게 되므로 최소 풀 크기만큼 배치를 구성
+        self.batch_processor = BatchProcessor(max(batch_size, pool_size), checkpoint=checkpoint)
+        self.sinks: List[IResultSink] = list(sinks) if sinks is not None else [MemoryResultSink()]
         self.urls: List[str] = []
-        self.current_batch_results: Tuple[List[dict], List[dict]] = ([], [])
+        # 현재 배치에서 지문이 같아 건너뛴 웹툰 (배치가 끝나면 싱크로 전달하고 비움)
+        self.unchanged_batch: List[dict] = []
+        # 풀의 작업 스레드가 동시에 추가하므로 잠금으로 보호
+        self._unchanged_lock = threading.Lock()
+        self.success_count = 0
+        self.failure_count = 0
+        self.unchanged_count = 0
         self.is_running: bool = False
 
-    def initialize(self, url_list: List[str]) -> None:
-        """URL 리스트 초기화"""
+    def _create_scraper(self, driver: WebDriver, platform: str) -> IWebtoonScraper:
+        """세션 하나에 사용할 스크래퍼 생성 (수집 항목이 다른 크롤러는 재정의)"""
+        return WebtoonScraperFactory.create_basic_info_scraper(driver, platform=platform)
+
+    def initialize(self, url_list: List[str], resume: bool = False) -> None:
+        """URL 리스트 초기화
+
+        Args:
+            url_list: 크롤링할 URL 리스트. 같은 웹툰을 가리키는 URL 변형은 정규 URL 하나로 합쳐짐
+            resume: True면 체크포인트에 기록된 URL은 건너뜀 (이전 결과는 이미 싱크에 전달되었으므로 다시 쓰지 않음).
+                    체크포인트가 다른 URL 목록으로 기록되었다면 처음부터 실행
+        """
         if not url_list:
             raise ValueError("URL 리스트가 비어있습니다.")
-        self.urls = list(url_list)
-        self.current_batch_results = ([], [])
-        logger.info("URL 리스트 초기화 완료", extra={"count": len(url_list)})
+        self.urls = list(TitleIndex(url_list))
+        self.unchanged_batch = []
+        self.success_count = self.failure_count = self.unchanged_count = 0
+        for sink in self.sinks:
+            if isinstance(sink, MemoryResultSink):
+                sink.reset()
+        if self.checkpoint:
+            plan_id = CrawlCheckpoint.compute_plan_id(self.urls)
+            if not (resume and self.checkpoint.load(plan_id)):
+                self.checkpoint.reset(plan_id)
+        logger.info("URL 리스트 초기화 완료", extra={
+            "count": len(self.urls),
+            "duplicate_count": len(url_list) - len(self.urls)
+        })
 
-    def _process_single_url(self, url: str) -> tuple[bool, Optional[dict]]:
-        """단일 URL 처리"""
+    @stage_timer.timed("crawler.process_url")
+    def _process_single_url(self, url: str, scraper: Optional[IWebtoonScraper] = None) -> tuple[bool, Optional[dict]]:
+        """단일 URL 처리
+
+        Returns:
+            (성공 여부, 수집 데이터). 지문이 같아 수집을 건너뛴 경우 (True, None)
+        """
+        scraper = scraper or self.scraper
         try:
-            success, webtoon_data = self.scraper.fetch_webtoon(url)
-            if success and webtoon_data:
+            if self.fingerprint_store is None:
+                success, webtoon_data = scraper.fetch_webtoon(url)
+                if success and webtoon_data:
+                    with stage_timer.measure("crawler.serialize"):
+                        return True, webtoon_data.to_dict()
+                return False, None
+
+            key = get_title_key(url)
+            success, webtoon_data, fingerprint = scraper.fetch_webtoon_if_changed(url, self.fingerprint_store.get(key))
+            if not success:
+                return False, None
+            if webtoon_data is None:
+                self._add_unchanged({"url": url, "external_id": key.title_id, "fingerprint": fingerprint})
+                return True, None
+            if fingerprint:
+                self.fingerprint_store.update(key, fingerprint)
+            with stage_timer.measure("crawler.serialize"):
                 return True, webtoon_data.to_dict()
-            return False, None
         except Exception as e:
             logger.error("URL 처리 중 오류 발생", error=e, extra={"url": url})
             return False, None
 
+    def _add_unchanged(self, entry: dict) -> None:
+        """현재 배치의 건너뛴 웹툰 목록에 추가 (작업 스레드에서 호출됨)"""
+        with self._unchanged_lock:
+            self.unchanged_batch.append(entry)
+
+    def _fetch_with_session(self, url: str, scraper: IWebtoonScraper, session: ManagedDriverSession) -> Tuple[bool, Optional[dict]]:
+        """세션 재시작 조건을 확인한 뒤 URL을 처리. 세션이 죽어 실패했다면 새 세션으로 한 번 더 처리"""
+        for _ in range(2):
+            driver = session.before_page()
+            if scraper.driver is not driver:
+                scraper.set_driver(driver)
+            success, webtoon_data = self._process_single_url(url, scraper)
+            session.after_page()
+            if success or scraper.last_failure not in self.SESSION_FAILURES or not session.restart_if_dead():
+                return success, webtoon_data
+            logger.info("세션 재시작 후 URL 다시 처리", extra={"url": url})
+        return success, webtoon_data
+
+    def _fetch_url(
+        self,
+        url: str,
+        scraper: IWebtoonScraper,
+        session: ManagedDriverSession
+    ) -> Tuple[bool, Optional[dict], Optional[FailureType]]:
+        """URL 하나를 처리 (수집 단위가 다른 크롤러는 재정의)
+
+        Returns:
+            (성공 여부, 수집 데이터, 실패 원인)
+        """
+        success, webtoon_data = self._fetch_with_session(url, scraper, session)
+        if success:
+            return True, webtoon_data, None
+        return False, None, scraper.last_failure or FailureType.UNKNOWN
+
+    def _crawl_url(
+        self,
+        url: str,
+        scraper: IWebtoonScraper,
+        session: ManagedDriverSession
+    ) -> Tuple[bool, Optional[dict], Optional[FailureType]]:
+        """호스트별 동시 요청 한도 안에서 URL을 처리하고 결과를 속도 조절기에 반영
+
+        Returns:
+            (성공 여부, 수집 데이터, 실패 원인)
+        """
+        with stage_timer.measure("crawler.rate_wait"):
+            host = self.rate_controller.acquire(url)
+        started = time.perf_counter()
+        latency: Optional[float] = None
+        outcome = HostRateController.OUTCOME_ERROR
+        try:
+            success, webtoon_data, failure_type = self._fetch_url(url, scraper, session)
+            if success:
+                outcome = HostRateController.OUTCOME_SUCCESS
+                # 지문 비교만 하고 건너뛴 요청은 전체 수집보다 훨씬 빨라 지연 기준에서 제외
+                latency = time.perf_counter() - started if webtoon_data is not None else None
+                return True, webtoon_data, None
+            outcome = self.FAILURE_OUTCOMES.get(failure_type, HostRateController.OUTCOME_ERROR)
+            return False, None, failure_type
+        finally:
+            self.rate_controller.release(host, latency, outcome)
+
+    def _process_urls_in_pool(self, url_batch: List[str]) -> List[Tuple[bool, Optional[dict], Optional[FailureType]]]:
+        """공유 작업 큐에서 각 세션이 URL을 가져가 병렬로 처리. 결과는 입력 순서대로 반환"""
+        url_queue: Queue = Queue()
+        for index, url in enumerate(url_batch):
+            url_queue.put((index, url))
+        results: List[Tuple[bool, Optional[dict], Optional[FailureType]]] = [(False, None, FailureType.UNKNOWN)] * len(url_batch)
+
+        def worker(scraper: IWebtoonScraper, session: ManagedDriverSession) -> None:
+            while True:
+                try:
+                    index, url = url_queue.get_nowait()
+                except Empty:
+                    return
+                results[index] = self._crawl_url(url, scraper, session)
+
+        worker_count = min(len(self.scrapers), len(url_batch))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                executor.submit(worker, scraper, session)
+                for scraper, session in zip(self.scrapers[:worker_count], self.driver_pool.sessions)
+            ]
+            for future in futures:
+                future.result()
+        return results
+
+    def _process_urls(self, url_batch: List[str]) -> List[Tuple[bool, Optional[dict], Optional[FailureType]]]:
+        if len(self.scrapers) > 1:
+            return self._process_urls_in_pool(url_batch)
+        return [self._crawl_url(url, self.scraper, self.driver_pool.sessions[0]) for url in url_batch]
+
+    @stage_timer.timed("crawler.batch")
     def _process_batch(self, url_batch: List[str]) -> tuple[List[dict], List[dict]]:
-        """배치 단위 URL 처리"""
+        """배치 단위 URL 처리
+
+        일시적인 실패는 재시도 큐에 넣어 백오프 후 같은 배치 안에서 다시 시도하고,
+        재시도할 수 없는 실패와 재시도 횟수를 모두 쓴 실패만 원인과 함께 기록한다.
+        """
         success_batch = []
         failure_batch = []
 
-        for url in url_batch:
-            success, webtoon_data = self._process_single_url(url)
-            if success and webtoon_data:
-                success_batch.append(webtoon_data)
-            else:
-                failure_batch.append({"url": url, "error": "데이터 수집 실패"})
+        pending = [(url, 0) for url in url_batch]
+        while pending:
+            results = self._process_urls([url for url, _ in pending])
+            for (url, previous_attempts), (success, webtoon_data, failure_type) in zip(pending, results):
+                attempts = previous_attempts + 1
+                if success:
+                    if attempts > 1:
+                        self.recovered_count += 1
+                    if webtoon_data:
+                        success_batch.append(webtoon_data)
+                    continue
+
+                failure = CrawlFailure(url=url, failure_type=failure_type, attempts=attempts)
+                if failure.is_transient and self.retry_queue.push(url, attempts):
+                    logger.info("재시도 예약", extra={"url": url, "failure_type": failure_type.value, "attempts": attempts})
+                    continue
+                failure_batch.append(failure.to_dict())
+
+            with stage_timer.measure("crawler.retry_wait"):
+                pending = self.retry_queue.pop_ready()
 
         return success_batch, failure_batch
 
@@ -64,34 +297,82 @@ class InitWebtoonCrawler(IWebtoonCrawler):
         """크롤링 실행"""
         if not self.urls:
             raise ValueError("URL 리스트가 초기화되지 않았습니다.")
-        
+
         if self.is_running:
             raise RuntimeError("크롤러가 이미 실행 중입니다.")
 
         self.is_running = True
         try:
+            # 체크포인트는 배치 결과가 모든 싱크에 전달된 뒤 다음 배치를 요청할 때 기록됨
             for success_batch, failure_batch in self.batch_processor.process_in_batches(self.urls, self._process_batch):
-                # 각 배치의 결과를 누적
-                self.current_batch_results = (
-                    self.current_batch_results[0] + success_batch,
-                    self.current_batch_results[1] + failure_batch
-                )
+                with self._unchanged_lock:
+                    unchanged_batch, self.unchanged_batch = self.unchanged_batch, []
+                self._write_to_sinks(success_batch, failure_batch, unchanged_batch)
                 logger.info("배치 처리 결과", extra={
-                    "success_count": len(self.current_batch_results[0]),
-                    "failure_count": len(self.current_batch_results[1])
+                    "success_count": self.success_count,
+                    "failure_count": self.failure_count,
+                    "unchanged_count": self.unchanged_count
                 })
         finally:
             self.is_running = False
+            logger.info("단계별 소요 시간", extra={"timing": self.get_timing_summary()})
+            logger.info("호스트별 요청 한도", extra={"hosts": self.get_rate_summary()})
+            logger.info("WebDriver 세션", extra={"sessions": self.get_session_summary()})
+            logger.info("재시도 결과", extra={
+                "retried_count": self.retry_queue.scheduled_count,
+                "recovered_count": self.recovered_count
+            })
+
+    def _write_to_sinks(self, success_batch: List[dict], failure_batch: List[dict], unchanged_batch: List[dict]) -> None:
+        """배치 결과를 모든 싱크에 전달 (배치가 끝나면 크롤러는 결과를 보관하지 않음)"""
+        with stage_timer.measure("crawler.sink"):
+            for sink in self.sinks:
+                sink.write_batch(success_batch, failure_batch, unchanged_batch)
+        self.success_count += len(success_batch)
+        self.failure_count += len(failure_batch)
+        self.unchanged_count += len(unchanged_batch)
+
+    def _get_memory_sink(self) -> MemoryResultSink:
+        for sink in self.sinks:
+            if isinstance(sink, MemoryResultSink):
+                return sink
+        raise RuntimeError("MemoryResultSink가 없어 결과를 반환할 수 없습니다. 싱크에 MemoryResultSink를 추가하세요.")
 
     def get_results(self) -> Tuple[List[dict], List[dict]]:
-        """현재까지의 크롤링 결과 반환"""
-        return self.current_batch_results
+        """현재까지의 크롤링 결과 반환 (MemoryResultSink를 사용할 때만 가능)"""
+        return self._get_memory_sink().get_results()
+
+    def get_timing_summary(self) -> Dict[str, Dict[str, float]]:
+        """단계별 소요 시간 요약 반환 (페이지 이동, 대기, getter, 직렬화, 저장)"""
+        return stage_timer.summary()
+
+    def get_rate_summary(self) -> Dict[str, Dict[str, float]]:
+        """호스트별 동시 요청 한도, 평균 지연, 타임아웃/리다이렉트 횟수 반환"""
+        return self.rate_controller.summary()
+
+    def get_session_summary(self) -> Dict[str, int]:
+        """처리 페이지 수와 원인별(페이지 수, 메모리, 세션 오류) 세션 재시작 횟수 반환"""
+        return self.driver_pool.summary()
+
+    def get_unchanged_results(self) -> List[dict]:
+        """지문이 같아 수집을 건너뛴 웹툰 목록 반환 (MemoryResultSink를 사용할 때만 가능)"""
+        return self._get_memory_sink().unchanged_results
+
+    def save_fingerprints(self) -> None:
+        """결과 저장이 끝난 뒤 갱신된 지문을 파일에 기록"""
+        if self.fingerprint_store:
+            self.fingerprint_store.save()
+
+    def clear_checkpoint(self) -> None:
+        """결과 저장이 끝난 뒤 체크포인트 삭제"""
+        if self.checkpoint:
+            self.checkpoint.reset()
 
     def shutdown(self) -> None:
         """리소스 정리"""
-        try:
-            self.driver.quit()
-        except Exception as e:
-            logger.error("WebDriver 종료 중 오류 발생", error=e)
-        else:
-            logger.info("WebDriver 종료 완료")
\ No newline at end of file
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                logger.error("결과 싱크 종료 중 오류 발생", error=e)
+        self.driver_pool.shutdown()
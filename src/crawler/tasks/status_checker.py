@@ -1,20 +1,98 @@
-from crawler.common.i_webtoon_crawler import IWebtoonCrawler
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from utils.logger import logger
+from crawler.tasks.init_webtoon_crawler import InitWebtoonCrawler
+from scrapers.webtoon_scraper_factory import WebtoonScraperFactory
+from scrapers.common import IWebtoonScraper
+from modules.webtoon_url import get_external_id
+from selenium.webdriver.remote.webdriver import WebDriver
 
-class StatusCheckCrawler(IWebtoonCrawler):
-    def __init__(self):
-        # 셋업: driver, scraper 등
-        pass
+class StatusCheckCrawler(InitWebtoonCrawler):
+    """웹툰의 연재 상태(연재 중, 휴재, 완결)만 확인하는 크롤러
 
-    def initialize(self, url_list: List[str]) -> None:
-        pass
+    NaverWebtoonScraper의 get_status와 같은 방식으로 메타 정보와 휴재 안내만 읽고,
+    장르, 작가, 썸네일, 줄거리, 첫 회차 날짜(sort=ASC 페이지 이동)는 수집하지 않는다.
+    저장된 상태와 다른 웹툰만 결과로 내보낸다.
 
-    def run(self) -> None:
-        # 각 웹툰이 연재 중인지, 완결인지 등 상태만 확인
-        pass
+    세션 풀, 호스트별 속도 조절, 재시도, 세션 재시작, 체크포인트, 싱크는 InitWebtoonCrawler와 같다.
+    """
+
+    def __init__(self, repository=None, **kwargs):
+        """
+        Args:
+            repository (SqliteWebtoonRepository, optional): 저장된 연재 상태를 읽고 바뀐 상태를 갱신할 저장소
+            **kwargs: InitWebtoonCrawler 인자 (fingerprint_store는 사용하지 않음)
+        """
+        kwargs["fingerprint_store"] = None
+        super().__init__(**kwargs)
+        self.repository = repository
+        self.known_statuses: Dict[Tuple[str, str], Optional[str]] = {}
+        self.status_unchanged_count = 0
+
+    def _create_scraper(self, driver: WebDriver, platform: str) -> IWebtoonScraper:
+        return WebtoonScraperFactory.create_status_scraper(driver, platform=platform)
+
+    def initialize(
+        self,
+        url_list: List[str],
+        resume: bool = False,
+        known_statuses: Optional[Dict[Tuple[str, str], Optional[str]]] = None
+    ) -> None:
+        """URL 리스트와 비교 기준 상태 초기화
 
-    def get_results(self) -> None:
-        pass
+        Args:
+            url_list: 상태를 확인할 URL 리스트
+            resume: True면 체크포인트에 기록된 URL은 건너뜀
+            known_statuses: (platform, external_id)별 이전 연재 상태. 없으면 저장소에서 읽음.
+                            이전 상태를 알 수 없는 웹툰은 바뀐 것으로 보고 내보냄
+        """
+        super().initialize(url_list, resume=resume)
+        if known_statuses is not None:
+            self.known_statuses = dict(known_statuses)
+        elif self.repository is not None:
+            self.known_statuses = self.repository.get_serialization_statuses(self.scraper.PLATFORM_NAME.name)
+        else:
+            self.known_statuses = {}
+        self.status_unchanged_count = 0
 
-    def shutdown(self) -> None:
-        pass
+    def _process_batch(self, url_batch: List[str]) -> tuple[List[dict], List[dict]]:
+        """배치 단위로 상태를 확인하고 저장된 상태와 다른 웹툰만 성공 목록으로 반환"""
+        status_batch, failure_batch = super()._process_batch(url_batch)
+        changed_batch = []
+        for webtoon_data in status_batch:
+            url = webtoon_data["link"]
+            external_id = webtoon_data.get("external_id") or get_external_id(url)
+            key = (webtoon_data["platform"], external_id)
+            previous_status = self.known_statuses.get(key)
+            status = webtoon_data["serialization_status"]
+            if status == previous_status:
+                self.status_unchanged_count += 1
+                continue
+            self.known_statuses[key] = status
+            changed_batch.append({
+                "platform": webtoon_data["platform"],
+                "external_id": external_id,
+                "link": url,
+                "previous_status": previous_status,
+                "serialization_status": status
+            })
+        return changed_batch, failure_batch
+
+    def _write_to_sinks(self, success_batch: List[dict], failure_batch: List[dict], unchanged_batch: List[dict]) -> None:
+        """바뀐 상태를 싱크에 전달하고 저장소에도 반영"""
+        super()._write_to_sinks(success_batch, failure_batch, unchanged_batch)
+        if self.repository is not None and success_batch:
+            try:
+                self.repository.update_serialization_status(success_batch)
+            except Exception as e:
+                logger.error("연재 상태 갱신 실패", error=e)
+
+    def run(self) -> None:
+        """상태 확인 실행"""
+        try:
+            super().run()
+        finally:
+            logger.info("연재 상태 확인 결과", extra={
+                "changed_count": self.success_count,
+                "unchanged_count": self.status_unchanged_count,
+                "failure_count": self.failure_count
+            })
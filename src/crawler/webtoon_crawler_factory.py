@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import List, Optional
 from crawler.common.i_webtoon_crawler import IWebtoonCrawler
 from modules.web_driver.web_driver_factory import WebDriverFactory
+from modules.web_driver.common.i_web_driver_manager import IWebDriverManager
+from crawler.sinks import IResultSink
 
 class WebtoonCrawlerFactory:
     """웹툰 크롤러 팩토리 클래스"""
@@ -14,7 +16,20 @@ class WebtoonCrawlerFactory:
         """
         self.web_driver_factory = web_driver_factory or WebDriverFactory()
 
-    def create_crawler(self, task_name: str, environment: Optional[str] = None, show_browser: bool = False) -> IWebtoonCrawler:
+    def create_crawler(
+        self,
+        task_name: str,
+        environment: Optional[str] = None,
+        show_browser: bool = False,
+        pool_size: int = 1,
+        platform: str = "naver",
+        checkpoint_filename: Optional[str] = None,
+        fingerprint_filename: Optional[str] = None,
+        driver_manager: Optional[IWebDriverManager] = None,
+        sinks: Optional[List[IResultSink]] = None,
+        episode_repository=None,
+        webtoon_repository=None
+    ) -> IWebtoonCrawler:
         """
         크롤러 생성
         
@@ -22,6 +37,18 @@ class WebtoonCrawlerFactory:
             task_name (str): 크롤러 작업 이름
             environment (str, optional): 실행 환경 ("local", "lambda", "docker_lambda")
             show_browser (bool, optional): 브라우저 표시 여부. True면 브라우저가 보이고, False면 headless 모드로 실행
+            pool_size (int, optional): 병렬로 실행할 Chrome 세션 수
+            platform (str, optional): 사용할 스크래퍼 ("naver": Selenium, "naver_http": HTTP 우선 수집)
+            checkpoint_filename (str, optional): 배치마다 진행 상황을 기록할 체크포인트 파일
+            fingerprint_filename (str, optional): 웹툰별 지문 파일. 지정하면 변경 없는 웹툰은 수집을 건너뜀
+            driver_manager (IWebDriverManager, optional): 첫 번째 세션에 사용할 드라이버 매니저 (예: WarmWebDriverManager).
+                                                          지정하지 않으면 environment에 맞게 새로 생성
+            sinks (List[IResultSink], optional): 배치마다 결과를 받을 싱크 목록.
+                                                 지정하지 않으면 get_results()용 MemoryResultSink 사용
+            episode_repository (SqliteEpisodeRepository, optional): 회차 저장소 (collect_episodes 작업에만 적용).
+                                                                     저장된 마지막 회차까지만 수집하고 새 회차를 저장
+            webtoon_repository (SqliteWebtoonRepository, optional): 웹툰 저장소 (check_status 작업에만 적용).
+                                                                     저장된 연재 상태와 비교하고 바뀐 상태를 갱신
             
         Returns:
             IWebtoonCrawler: 생성된 크롤러 인스턴스
@@ -30,21 +57,53 @@ class WebtoonCrawlerFactory:
             ValueError: 지원하지 않는 작업 이름이 지정된 경우
         """
         task_name = task_name.lower()
+        driver_manager = driver_manager or self.web_driver_factory.create_driver(
+            environment=environment,
+            headless=not show_browser
+        )
 
         if task_name == "collect_episodes":
             from crawler import EpisodeCollectorCrawler
+            from crawler.batch.crawl_checkpoint import CrawlCheckpoint
             return EpisodeCollectorCrawler(
-                driver_manager=self.web_driver_factory.create_driver(environment=environment, headless=not show_browser)
+                episode_repository=episode_repository,
+                driver_manager=driver_manager,
+                environment=environment,
+                pool_size=pool_size,
+                headless=not show_browser,
+                web_driver_factory=self.web_driver_factory,
+                platform=platform,
+                checkpoint=CrawlCheckpoint(checkpoint_filename) if checkpoint_filename else None,
+                sinks=sinks
             )
         elif task_name == "check_status":
             from crawler import StatusCheckCrawler
+            from crawler.batch.crawl_checkpoint import CrawlCheckpoint
             return StatusCheckCrawler(
-                driver_manager=self.web_driver_factory.create_driver(environment=environment, headless=not show_browser)
+                repository=webtoon_repository,
+                driver_manager=driver_manager,
+                environment=environment,
+                pool_size=pool_size,
+                headless=not show_browser,
+                web_driver_factory=self.web_driver_factory,
+                platform=platform,
+                checkpoint=CrawlCheckpoint(checkpoint_filename) if checkpoint_filename else None,
+                sinks=sinks
             )
         elif task_name == "test" or task_name == "update":
             from crawler.tasks.init_webtoon_crawler import InitWebtoonCrawler
+            from crawler.batch.crawl_checkpoint import CrawlCheckpoint
+            from modules.fingerprint_store import FingerprintStore
             return InitWebtoonCrawler(
-                driver_manager=self.web_driver_factory.create_driver(environment=environment, headless=not show_browser)
+                driver_manager=driver_manager,
+                environment=environment,
+                pool_size=pool_size,
+                headless=not show_browser,
+                web_driver_factory=self.web_driver_factory,
+                platform=platform,
+                checkpoint=CrawlCheckpoint(checkpoint_filename) if checkpoint_filename else None,
+                fingerprint_store=FingerprintStore(fingerprint_filename) if fingerprint_filename else None,
+                sinks=sinks
             )
         else:
             # 향후 다른 크롤러가 생기면 여기에 추가
@@ -1,13 +1,21 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
 from crawler.webtoon_crawler_factory import WebtoonCrawlerFactory
+from crawler.sinks import IResultSink, MemoryResultSink, SqsResultSink
+from modules.web_driver import WebDriverFactory, WarmWebDriverManager
 from modules.aws_service import AWSService, SlackNotifier
 from utils.logger import logger, LoggerFactory, LoggerType
-from models.sqs_message import SQSRequestMessage, WebtoonUpdateData, SQSEventType
+from utils.stage_timer import stage_timer
+from modules.webtoon_url import TitleKey, get_title_key
+from models.crawl_failure import CrawlFailure
+from models.enums import FailureType
+from models.sqs_message import SQSRequestMessage, WebtoonUpdateData, WebtoonUpdateRequest, SQSEventType
 import os
 
 # 환경 설정
 IS_LOCAL = True  # 로컬 테스트 환경 설정
+FINGERPRINT_FILENAME = "/tmp/webtoon_fingerprints.json"  # warm 컨테이너 동안 유지되는 웹툰별 지문
+MAX_URL_RETRIES = 2  # 실패한 URL만 담아 요청 큐에 다시 넣는 최대 횟수
 
 class ServiceManager:
     def __init__(self):
@@ -18,8 +26,11 @@ class ServiceManager:
 
     def initialize(self):
         if not IS_LOCAL:
+            if self.aws_service:
+                # warm 컨테이너에서는 클라이언트와 SSM 파라미터를 재사용
+                return
             try:
-                self.aws_service = AWSService()
+                self.aws_service = AWSService(endpoint_url=os.environ.get("SQS_ENDPOINT_URL"))
                 self.input_sqs_url = self.aws_service.get_parameter('/TOONPICK/prod/AWS/AWS_SQS_WEBTOON_UPDATE_REQUEST_URL')
                 self.output_sqs_url = self.aws_service.get_parameter('/TOONPICK/prod/AWS/AWS_SQS_WEBTOON_UPDATE_COMPLETE_URL')
                 slack_webhook_url = self.aws_service.get_parameter('/TOONPICK/prod/SLACK/SLACK_WEBHOOK_URL')
@@ -30,25 +41,27 @@ class ServiceManager:
         else:
             logger.info("로컬 환경: 외부 서비스 비활성화")
 
-    def send_to_sqs(self, message: Dict):
-        if not IS_LOCAL and self.aws_service and self.output_sqs_url:
-            try:
-                self.aws_service.send_sqs_message(self.output_sqs_url, message)
-                logger.info("SQS 메시지 전송 완료")
-            except Exception as e:
-                logger.error(f"SQS 메시지 전송 실패: {str(e)}")
-        else:
-            logger.info("로컬 환경: SQS 메시지 전송 건너뜀")
+    def send_batch_to_sqs(self, messages: List[Dict]) -> List[Dict]:
+        """결과 메시지를 배치로 전송하고 전송하지 못한 메시지 목록 반환"""
+        return self._send_batch(self.output_sqs_url, messages)
 
-    def delete_from_sqs(self, receipt_handle: str):
-        if not IS_LOCAL and self.aws_service and self.input_sqs_url:
+    def requeue_to_sqs(self, messages: List[Dict]) -> List[Dict]:
+        """재시도할 요청 메시지를 요청 큐에 다시 넣고 넣지 못한 메시지 목록 반환"""
+        return self._send_batch(self.input_sqs_url, messages)
+
+    def _send_batch(self, queue_url: Optional[str], messages: List[Dict]) -> List[Dict]:
+        if not messages:
+            return []
+        if not IS_LOCAL and self.aws_service and queue_url:
             try:
-                self.aws_service.delete_sqs_message(self.input_sqs_url, receipt_handle)
-                logger.info("SQS 메시지 삭제 완료")
+                failed = self.aws_service.send_sqs_message_batch(queue_url, messages)
+                logger.info("SQS 메시지 배치 전송 완료", extra={"count": len(messages), "failed": len(failed)})
+                return failed
             except Exception as e:
-                logger.error(f"SQS 메시지 삭제 실패: {str(e)}")
-        else:
-            logger.info("로컬 환경: SQS 메시지 삭제 건너뜀")
+                logger.error(f"SQS 메시지 배치 전송 실패: {str(e)}")
+                return messages
+        logger.info("로컬 환경: SQS 메시지 전송 건너뜀", extra={"count": len(messages)})
+        return []
 
     def send_slack_notification(self, message: Dict):
         if not IS_LOCAL and self.slack_notifier:
@@ -62,27 +75,49 @@ class ServiceManager:
 
 service_manager = ServiceManager()
 
-def run_crawling(update_data: WebtoonUpdateData, crawler_factory: WebtoonCrawlerFactory):
+# warm 컨테이너 동안 유지되는 WebDriver (Chrome 시작 비용을 요청마다 내지 않도록 재사용)
+warm_driver_manager = None
+
+def get_warm_driver_manager() -> WarmWebDriverManager:
+    global warm_driver_manager
+    if warm_driver_manager is None:
+        warm_driver_manager = WarmWebDriverManager(WebDriverFactory().create_driver(environment="docker_lambda"))
+    return warm_driver_manager
+
+def run_crawling(
+    update_data: WebtoonUpdateData,
+    crawler_factory: WebtoonCrawlerFactory,
+    sinks: Optional[List[IResultSink]] = None
+):
+    """크롤링 실행. sinks에는 배치가 끝날 때마다 결과가 전달됨 (예: 결과를 바로 보내는 SqsResultSink)"""
     if not update_data.requests:
         raise ValueError("URL 목록이 비어있습니다.")
 
     urls = [req.url for req in update_data.requests]
 
+    memory_sink = MemoryResultSink()
     crawler = crawler_factory.create_crawler(
         task_name="update",
-        environment="docker_lambda"
+        environment="docker_lambda",
+        fingerprint_filename=FINGERPRINT_FILENAME,
+        driver_manager=get_warm_driver_manager(),
+        sinks=[memory_sink] + list(sinks or [])
     )
-    crawler.initialize(urls)
-    crawler.run()
+    try:
+        crawler.initialize(urls)
+        crawler.run()
 
-    success_data, failed_data = crawler.get_results()
-    return success_data, failed_data
+        success_data, failed_data = memory_sink.get_results()
+        return success_data, failed_data, memory_sink.unchanged_results, crawler
+    finally:
+        crawler.shutdown()
 
-def send_success_results_to_sqs(success_data: list[dict], update_data: WebtoonUpdateData):
+def build_success_messages(success_data: list[dict], request_index: Dict[TitleKey, WebtoonUpdateRequest]) -> List[Dict]:
+    messages = []
     for webtoon in success_data:
-        matched_req = next((req for req in update_data.requests if req.url == webtoon['url']), None)
+        matched_req = request_index.get(get_title_key(webtoon['link']))
         if matched_req:
-            message_body = {
+            messages.append({
                 "requestId": matched_req.id,
                 "eventType": SQSEventType.WEBTOON_UPDATE.value,
                 "data": {
@@ -90,82 +125,258 @@ def send_success_results_to_sqs(success_data: list[dict], update_data: WebtoonUp
                     "platform": matched_req.platform,
                     "webtoon_data": webtoon
                 }
-            }
-            service_manager.send_to_sqs(message_body)
-
-def handle_record(record: Dict[str, Any]) -> Dict[str, Any]:
-    result = {
-        "status": "SUCCESS",
-        "error": None,
-        "updated_count": 0,
-        "webdriver_ok": False
+            })
+    return messages
+
+def build_unchanged_messages(unchanged_data: list[dict], request_index: Dict[TitleKey, WebtoonUpdateRequest]) -> List[Dict]:
+    messages = []
+    for webtoon in unchanged_data:
+        matched_req = request_index.get(get_title_key(webtoon['url']))
+        if matched_req:
+            messages.append({
+                "requestId": matched_req.id,
+                "eventType": SQSEventType.WEBTOON_UNCHANGED.value,
+                "data": {
+                    "webtoon_id": matched_req.id,
+                    "platform": matched_req.platform,
+                    "external_id": webtoon['external_id']
+                }
+            })
+    return messages
+
+def parse_record(record: Dict[str, Any]) -> Tuple[SQSRequestMessage, WebtoonUpdateData]:
+    """SQS 레코드를 요청 메시지와 업데이트 데이터로 변환"""
+    body = record['body']
+    if isinstance(body, str):
+        body = json.loads(body)
+
+    sqs_message = SQSRequestMessage.from_dict(body)
+    if sqs_message.eventType != SQSEventType.WEBTOON_UPDATE:
+        raise ValueError(f"지원하지 않는 이벤트 타입: {sqs_message.eventType}")
+
+    return sqs_message, WebtoonUpdateData.from_dict(sqs_message.data)
+
+def build_retry_message(sqs_message: SQSRequestMessage, update_data: WebtoonUpdateData, failed_data: List[dict]) -> Optional[Dict]:
+    """실패한 URL만 담은 재시도 요청 메시지 (재시도 횟수를 넘었거나 실패가 없으면 None)
+
+    성인 인증, 존재하지 않는 웹툰처럼 다시 시도해도 같은 결과인 실패는 다시 요청하지 않는다.
+    """
+    failures = [CrawlFailure.from_dict(failure) for failure in failed_data]
+    failed_urls = {
+        failure.url for failure in failures
+        if failure.is_transient or failure.failure_type == FailureType.UNKNOWN
+    }
+    failed_keys = {get_title_key(url) for url in failed_urls}
+    failed_requests = [req.to_dict() for req in update_data.requests if get_title_key(req.url) in failed_keys]
+    if not failed_requests:
+        return None
+    if sqs_message.retryCount >= MAX_URL_RETRIES:
+        logger.warning("재시도 횟수 초과, 실패한 URL 재요청 중단", extra={
+            "requestId": sqs_message.requestId,
+            "retry_count": sqs_message.retryCount,
+            "failed_urls": sorted(failed_urls)
+        })
+        return None
+    return {
+        "requestId": sqs_message.requestId,
+        "eventType": SQSEventType.WEBTOON_UPDATE.value,
+        "data": {"requests": failed_requests},
+        "message": sqs_message.message,
+        "requestTime": sqs_message.requestTime,
+        "retryCount": sqs_message.retryCount + 1
     }
 
+def merge_update_data(parsed_records: List[Tuple[int, SQSRequestMessage, WebtoonUpdateData]]) -> Tuple[WebtoonUpdateData, Dict[TitleKey, List[Tuple[int, WebtoonUpdateRequest]]]]:
+    """여러 레코드의 요청을 웹툰 단위로 중복 제거
+
+    Returns:
+        (크롤링할 요청 목록, 웹툰 키별 (레코드 위치, 원래 요청) 목록)
+    """
+    unique_requests: List[WebtoonUpdateRequest] = []
+    requesters: Dict[TitleKey, List[Tuple[int, WebtoonUpdateRequest]]] = {}
+    for position, _, update_data in parsed_records:
+        for req in update_data.requests:
+            key = get_title_key(req.url)
+            if key not in requesters:
+                requesters[key] = []
+                unique_requests.append(req)
+            requesters[key].append((position, req))
+    return WebtoonUpdateData(requests=unique_requests), requesters
+
+def handle_records_coalesced(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """모든 레코드를 한 번의 크롤링으로 처리하고 결과를 각 requestId로 나누어 전송"""
+    stage_timer.reset()
+    results: List[Dict[str, Any]] = []
+    parsed_records: List[Tuple[int, SQSRequestMessage, WebtoonUpdateData]] = []
+
+    for position, record in enumerate(records):
+        result = {
+            "status": "SUCCESS",
+            "error": None,
+            "updated_count": 0,
+            "webdriver_ok": False
+        }
+        try:
+            sqs_message, update_data = parse_record(record)
+            result["requestId"] = sqs_message.requestId
+            if not update_data.requests:
+                raise ValueError("URL 목록이 비어있습니다.")
+            parsed_records.append((position, sqs_message, update_data))
+        except json.JSONDecodeError as e:
+            result["status"] = "FAILED"
+            result["error"] = f"JSON Parsing Error: {e}"
+            logger.error("JSON 파싱 오류", error=e)
+        except Exception as e:
+            result["status"] = "FAILED"
+            result["error"] = f"Processing Error: {e}"
+            logger.error("레코드 처리 중 오류 발생", error=e)
+        results.append(result)
+
+    if not parsed_records:
+        return results
+
+    merged_data, requesters = merge_update_data(parsed_records)
+    logger.info("레코드 병합", extra={
+        "records": len(parsed_records),
+        "requests": sum(len(update_data.requests) for _, _, update_data in parsed_records),
+        "unique_titles": len(merged_data.requests)
+    })
+
+    # 배치가 끝날 때마다 결과를 요청한 모든 레코드의 메시지로 나누어 바로 전송
+    unsent_positions: Set[int] = set()
+    batch_positions: List[int] = []
+
+    def build_fanout_messages(success_batch: List[dict], unchanged_batch: List[dict]) -> List[Dict]:
+        messages: List[Dict] = []
+        batch_positions.clear()
+        for webtoon in success_batch:
+            key = get_title_key(webtoon['link'])
+            for position, req in requesters.get(key, []):
+                messages.extend(build_success_messages([webtoon], {key: req}))
+                batch_positions.append(position)
+        for webtoon in unchanged_batch:
+            key = get_title_key(webtoon['url'])
+            for position, req in requesters.get(key, []):
+                messages.extend(build_unchanged_messages([webtoon], {key: req}))
+                batch_positions.append(position)
+        return messages
+
+    def send_fanout_messages(messages: List[Dict]) -> List[Dict]:
+        unsent_messages = service_manager.send_batch_to_sqs(messages)
+        unsent_ids = {id(message) for message in unsent_messages}
+        unsent_positions.update(
+            position for message, position in zip(messages, batch_positions) if id(message) in unsent_ids
+        )
+        return unsent_messages
+
+    sqs_sink = SqsResultSink(build_messages=build_fanout_messages, send_batch=send_fanout_messages)
     try:
-        # SQS 메시지 파싱
-        body = record['body']
-        if isinstance(body, str):
-            body = json.loads(body)
-        
-        # SQS 메시지를 객체로 변환
-        sqs_message = SQSRequestMessage.from_dict(body)
-        
-        # 이벤트 타입 검증
-        if sqs_message.eventType != SQSEventType.WEBTOON_UPDATE:
-            raise ValueError(f"지원하지 않는 이벤트 타입: {sqs_message.eventType}")
-
-        # 데이터를 WebtoonUpdateData 객체로 변환
-        update_data = WebtoonUpdateData.from_dict(sqs_message.data)
-
-        # 크롤링 실행
         crawler_factory = WebtoonCrawlerFactory()
-        success_data, failed_data = run_crawling(update_data, crawler_factory)
+        success_data, failed_data, unchanged_data, crawler = run_crawling(merged_data, crawler_factory, sinks=[sqs_sink])
+    except Exception as e:
+        logger.error("병합 크롤링 중 오류 발생", error=e)
+        for position, _, _ in parsed_records:
+            results[position].update({"status": "FAILED", "error": f"Processing Error: {e}"})
+        return results
 
-        result.update({
-            "requestId": sqs_message.requestId,
-            "updated_count": len(success_data),
+    # 수집 결과를 요청한 모든 레코드로 분배
+    per_record: Dict[int, Dict[str, list]] = {
+        position: {"success_data": [], "failed_data": [], "unchanged": []} for position, _, _ in parsed_records
+    }
+    for webtoon in success_data:
+        for position, _ in requesters.get(get_title_key(webtoon['link']), []):
+            per_record[position]["success_data"].append(webtoon)
+    for webtoon in unchanged_data:
+        for position, _ in requesters.get(get_title_key(webtoon['url']), []):
+            per_record[position]["unchanged"].append(webtoon)
+    for failure in failed_data:
+        for position, req in requesters.get(get_title_key(failure['url']), []):
+            per_record[position]["failed_data"].append({**failure, "url": req.url})
+
+    # 전송하지 못한 결과가 있으면 재전달 시 '변경 없음'으로 건너뛰지 않도록 지문을 저장하지 않음
+    if not sqs_sink.unsent_messages:
+        crawler.save_fingerprints()
+
+    timing = crawler.get_timing_summary()
+    webdriver_reused = get_warm_driver_manager().last_reused
+    for position, sqs_message, update_data in parsed_records:
+        record_data = per_record[position]
+        results[position].update({
+            "updated_count": len(record_data["success_data"]),
+            "unchanged_count": len(record_data["unchanged"]),
             "webdriver_ok": True,
-            "success_data": success_data,
-            "failed_data": failed_data
+            "webdriver_reused": webdriver_reused,
+            "success_data": record_data["success_data"],
+            "failed_data": record_data["failed_data"],
+            "timing": timing,
+            "retry_message": build_retry_message(sqs_message, update_data, record_data["failed_data"])
         })
+        if position in unsent_positions:
+            results[position].update({"status": "FAILED", "error": "Processing Error: 결과 메시지 전송 실패"})
 
-        # SQS 메시지 전송
-        send_success_results_to_sqs(success_data, update_data)
-        
-        # SQS 메시지 삭제
-        if 'receiptHandle' in record:
-            service_manager.delete_from_sqs(record['receiptHandle'])
+    logger.info("병합 크롤링 완료", extra={
+        "records": len(parsed_records),
+        "success": len(success_data),
+        "failed": len(failed_data),
+        "unchanged": len(unchanged_data),
+        "unsent": len(sqs_sink.unsent_messages)
+    })
+    return results
 
-        logger.info("크롤링 완료", extra={
-            "requestId": sqs_message.requestId,
-            "success": len(success_data), 
-            "failed": len(failed_data)
-        })
+def requeue_failed_urls(results: List[Dict[str, Any]]) -> None:
+    """일부 URL만 실패한 레코드는 실패한 URL만 요청 큐에 다시 넣고, 넣지 못하면 레코드 전체를 실패로 처리"""
+    retry_messages = []
+    retry_results = []
+    for result in results:
+        retry_message = result.pop("retry_message", None)
+        result["requeued_count"] = 0
+        if result["status"] == "SUCCESS" and retry_message:
+            retry_messages.append(retry_message)
+            retry_results.append(result)
 
-    except json.JSONDecodeError as e:
-        result["status"] = "FAILED"
-        result["error"] = f"JSON Parsing Error: {e}"
-        logger.error("JSON 파싱 오류", error=str(e))
-    except Exception as e:
-        result["status"] = "FAILED"
-        result["error"] = f"Processing Error: {e}"
-        logger.error("레코드 처리 중 오류 발생", error=e)
+    unsent_ids = {id(message) for message in service_manager.requeue_to_sqs(retry_messages)}
+    for message, result in zip(retry_messages, retry_results):
+        if id(message) in unsent_ids:
+            result.update({"status": "FAILED", "error": "Processing Error: 실패한 URL 재요청 실패"})
+        else:
+            result["requeued_count"] = len(message["data"]["requests"])
 
-    return result
+def build_batch_item_failures(records: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """ReportBatchItemFailures 응답 형식의 실패 레코드 목록"""
+    return [
+        {"itemIdentifier": record['messageId']}
+        for record, result in zip(records, results)
+        if result["status"] != "SUCCESS" and record.get('messageId')
+    ]
 
 def lambda_handler(event, context=None):
+    """SQS 이벤트 처리
+
+    이벤트 소스 매핑에 ReportBatchItemFailures가 설정되어 있어야 한다.
+    실패한 레코드의 messageId만 batchItemFailures로 반환하여 해당 레코드만 다시 전달되며,
+    일부 URL만 실패한 레코드는 실패한 URL만 담은 새 메시지를 요청 큐에 넣고 성공으로 처리한다.
+    """
+    records = event.get('Records', [])
     try:
         # 서비스 초기화
         service_manager.initialize()
 
-        results = []
-        for record in event.get('Records', []):
-            result = handle_record(record)
+        # 한 번의 호출에 들어온 모든 레코드를 중복 제거 후 하나의 크롤링으로 처리
+        results = handle_records_coalesced(records)
+
+        requeue_failed_urls(results)
+        for result in results:
             # Slack 알림 전송
             service_manager.send_slack_notification(result)
-            results.append(result)
 
+        batch_item_failures = build_batch_item_failures(records, results)
+        logger.info("SQS 배치 처리 완료", extra={
+            "records": len(records),
+            "failed_records": len(batch_item_failures),
+            "requeued_urls": sum(result["requeued_count"] for result in results)
+        })
         return {
+            "batchItemFailures": batch_item_failures,
             "statusCode": 200,
             "body": json.dumps({
                 "results": results,
@@ -173,8 +384,10 @@ def lambda_handler(event, context=None):
             })
         }
     except Exception as e:
-        logger.error("Lambda 핸들러 오류", error=str(e))
+        logger.error("Lambda 핸들러 오류", error=e)
+        # 처리 결과를 알 수 없으므로 모든 레코드를 다시 전달받음
         return {
+            "batchItemFailures": [{"itemIdentifier": record['messageId']} for record in records if record.get('messageId')],
             "statusCode": 500,
             "body": json.dumps({"error": str(e)})
         }
@@ -1,19 +1,19 @@
 from modules.webtoon_list_manager import WebtoonListManager
-from modules.webtoon_repository import WebtoonRepository
+from modules.sqlite_webtoon_repository import SqliteWebtoonRepository
 from scrapers import WebtoonListScraper
 from crawler.webtoon_crawler_factory import WebtoonCrawlerFactory
+from crawler.batch import CrawlScheduler
+from crawler.sinks import RepositoryResultSink, ScheduleResultSink
 from modules.web_driver.web_driver_factory import WebDriverFactory
-
-def save_crawler_results(success_data: list, failed_data: list, repository: WebtoonRepository) -> None:
-    """크롤러 결과를 저장하는 함수"""
-    if success_data:
-        repository.append_success(success_data)
-    if failed_data:
-        repository.append_failure(failed_data)
+from utils.logger import logger
+from utils.stage_timer import stage_timer
 
 if __name__ == "__main__":
-    # 저장소 초기화
-    repository = WebtoonRepository("webtoon_data.json", "failed_webtoon_list.json")
+    # 저장소 초기화 (SQLite에 갱신하고 종료 시 JSON 파일로 내보냄. 기존 JSON 파일이 있으면 처음 한 번 가져옴)
+    repository = SqliteWebtoonRepository("webtoon_data.json", "failed_webtoon_list.json")
+
+    # 연재 요일과 상태로 이번 실행에서 크롤링할 웹툰을 고르는 스케줄러
+    scheduler = CrawlScheduler("crawl_schedule.json")
     
     # 웹 드라이버 팩토리 및 크롤러 팩토리 초기화
     web_driver_factory = WebDriverFactory()
@@ -23,28 +23,39 @@ if __name__ == "__main__":
     crawler = crawler_factory.create_crawler(
         task_name="test",
         environment="local",
-        show_browser=True
+        show_browser=True,
+        pool_size=3,
+        checkpoint_filename="crawl_checkpoint.jsonl",
+        # 배치가 끝날 때마다 저장소에 바로 추가하고 마지막 크롤링 시각 기록
+        sinks=[RepositoryResultSink(repository), ScheduleResultSink(scheduler)]
     )
     
     try:
         # URL 목록 초기화
         list_manager = WebtoonListManager("webtoon_urls.txt")
         if not list_manager.load_urls_from_txt():
-            list_scraper = WebtoonListScraper(crawler.driver)
-            list_manager.collect_webtoon_urls(list_scraper)
+            # 세션마다 목록 스크래퍼를 두고 요일별/완결 목록을 동시에 수집
+            list_scrapers = [WebtoonListScraper(driver) for driver in crawler.driver_pool.drivers]
+            list_manager.collect_webtoon_urls(list_scrapers)
+
+        # 오늘 연재 웹툰부터, 크롤링 간격이 지난 웹툰만 선택
+        urls = scheduler.plan(sorted(list_manager.urls), repository.get_crawl_metadata())
+
+        if urls:
+            # 크롤링 실행 (이전 실행이 중단되었다면 체크포인트부터 재개)
+            crawler.initialize(urls, resume=True)
+            crawler.run()
 
-        # 크롤링 실행
-        crawler.initialize(list_manager.urls)
-        crawler.run()
-        
-        # 결과 저장
-        success_data, failed_data = crawler.get_results()
-        save_crawler_results(success_data, failed_data, repository)
+            # 모든 배치가 저장소에 기록되었으므로 체크포인트 삭제
+            crawler.clear_checkpoint()
+        else:
+            logger.info("크롤링할 웹툰이 없습니다.")
     
     except KeyboardInterrupt:
+        # 완료된 배치는 이미 저장소에 기록됨
         print("\n[사용자 중단] Ctrl+C 감지됨. 안전하게 종료 중...")
-        # 강제 종료 시 현재까지의 배치 결과 저장
-        success_data, failed_data = crawler.get_results()
-        save_crawler_results(success_data, failed_data, repository)
     finally:
         crawler.shutdown()
+        repository.compact()
+        repository.close()
+        logger.info("단계별 소요 시간 (저장 포함)", extra={"timing": stage_timer.summary()})
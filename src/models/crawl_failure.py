@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Optional
+from models.enums import FailureType
+
+@dataclass
+class CrawlFailure:
+    """URL 하나의 최종 실패 기록"""
+    url: str
+    failure_type: FailureType
+    attempts: int = 1
+    message: Optional[str] = None
+
+    @property
+    def is_transient(self) -> bool:
+        return self.failure_type.is_transient
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "error": self.message or self.failure_type.description,
+            "failure_type": self.failure_type.value,
+            "attempts": self.attempts
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CrawlFailure':
+        """이전 형식({"url", "error"})의 기록은 원인을 알 수 없는 실패로 변환"""
+        return cls(
+            url=data.get('url'),
+            failure_type=FailureType(data.get('failure_type', FailureType.UNKNOWN.value)),
+            attempts=data.get('attempts', 1),
+            message=data.get('error')
+        )
@@ -3,6 +3,7 @@ from .platform import Platform
 from .age_rating import AgeRating
 from .day_of_week import DayOfWeek
 from .author_role import AuthorRole
+from .failure_type import FailureType
 
 __all__ = [
     "SerializationStatus",
@@ -10,4 +11,5 @@ __all__ = [
     "AgeRating",
     "DayOfWeek",
     "AuthorRole",
+    "FailureType",
 ]
@@ -0,0 +1,30 @@
+from enum import Enum
+
+class FailureType(Enum):
+    """크롤링 실패 원인"""
+    TIMEOUT = "timeout"
+    LOGIN_REDIRECT = "login_redirect"  # 성인 인증 등 로그인 페이지로 이동
+    THROTTLED = "throttled"  # 429/403 등 요청 제한 응답
+    SELECTOR_MISS = "selector_miss"  # 페이지 구조가 예상과 다름
+    DRIVER_CRASH = "driver_crash"  # Chrome 세션이 끊기거나 응답하지 않음
+    HTTP_ERROR = "http_error"  # 연결 실패, 5xx 응답
+    NOT_FOUND = "not_found"  # 삭제되었거나 존재하지 않는 웹툰
+    UNKNOWN = "error"
+
+    @property
+    def is_transient(self) -> bool:
+        """다시 시도하면 성공할 수 있는 실패인지 여부"""
+        return self in (FailureType.TIMEOUT, FailureType.THROTTLED, FailureType.DRIVER_CRASH, FailureType.HTTP_ERROR)
+
+    @property
+    def description(self) -> str:
+        return {
+            FailureType.TIMEOUT: "페이지 로딩 시간 초과",
+            FailureType.LOGIN_REDIRECT: "로그인(성인 인증) 필요",
+            FailureType.THROTTLED: "요청 제한",
+            FailureType.SELECTOR_MISS: "페이지 요소를 찾을 수 없음",
+            FailureType.DRIVER_CRASH: "WebDriver 세션 오류",
+            FailureType.HTTP_ERROR: "HTTP 요청 실패",
+            FailureType.NOT_FOUND: "존재하지 않는 웹툰",
+            FailureType.UNKNOWN: "데이터 수집 실패",
+        }[self]
@@ -0,0 +1,15 @@
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+@dataclass
+class EpisodeDTO:
+    """웹툰 회차 정보를 저장하는 데이터 객체"""
+    platform: str
+    external_id: str
+    episode_no: int
+    title: str
+    thumbnail_url: Optional[str]
+    published_date: Optional[str]
+
+    def to_dict(self):
+        return asdict(self)
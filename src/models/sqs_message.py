@@ -5,6 +5,7 @@ from datetime import datetime
 
 class SQSEventType(Enum):
     WEBTOON_UPDATE = "WEBTOON_UPDATE"
+    WEBTOON_UNCHANGED = "WEBTOON_UNCHANGED"
     # 필요한 이벤트 타입 추가
 
 T = TypeVar('T')
@@ -16,6 +17,7 @@ class SQSRequestMessage(Generic[T]):
     data: T
     message: Optional[str] = None
     requestTime: int = int(datetime.now().timestamp() * 1000)
+    retryCount: int = 0  # 실패한 URL만 다시 보낸 횟수
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -24,7 +26,8 @@ class SQSRequestMessage(Generic[T]):
             eventType=SQSEventType(data.get('eventType')),
             data=data.get('data'),
             message=data.get('message'),
-            requestTime=data.get('requestTime', int(datetime.now().timestamp() * 1000))
+            requestTime=data.get('requestTime', int(datetime.now().timestamp() * 1000)),
+            retryCount=data.get('retryCount', 0)
         )
 
 @dataclass
@@ -41,6 +44,9 @@ class WebtoonUpdateRequest:
             url=data.get('url')
         )
 
+    def to_dict(self) -> dict:
+        return {"id": self.id, "platform": self.platform, "url": self.url}
+
 @dataclass
 class WebtoonUpdateData:
     requests: list[WebtoonUpdateRequest]
@@ -1,12 +1,33 @@
+import time
 import boto3
 import json
 import requests
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional
 
 class AWSService:
-    def __init__(self):
-        self.ssm = boto3.client('ssm')
-        self.sqs = boto3.client('sqs')
+    SQS_BATCH_SIZE = 10  # SQS 배치 API의 최대 항목 수
+    SQS_BATCH_MAX_BYTES = 256 * 1024  # 배치 전체 메시지 크기 제한
+    SQS_BATCH_RETRIES = 3  # 일부 항목 실패 시 재시도 횟수
+    SQS_RETRY_DELAY = 0.2  # 재시도 기본 대기 시간(초), 재시도마다 2배
+
+    def __init__(
+        self,
+        ssm_client=None,
+        sqs_client=None,
+        endpoint_url: Optional[str] = None,
+        max_workers: int = 4
+    ):
+        """
+        Args:
+            ssm_client (optional): SSM 클라이언트. 지정하지 않으면 boto3로 생성
+            sqs_client (optional): SQS 클라이언트. 지정하지 않으면 boto3로 생성
+            endpoint_url (str, optional): 로컬 SQS 호환 서버(ElasticMQ, LocalStack 등) 주소
+            max_workers (int): 배치 호출을 동시에 보낼 스레드 수
+        """
+        self.ssm = ssm_client or boto3.client('ssm')
+        self.sqs = sqs_client or boto3.client('sqs', endpoint_url=endpoint_url)
+        self.max_workers = max_workers
         self._cached_parameters = {}
 
     def get_parameter(self, parameter_name: str) -> str:
@@ -30,16 +51,79 @@ class AWSService:
         except Exception as e:
             raise RuntimeError(f"SQS 메시지 전송 실패: {e}")
 
-    def delete_sqs_message(self, queue_url: str, receipt_handle: str) -> None:
-        """SQS 메시지 삭제"""
-        try:
-            response = self.sqs.delete_message(
-                QueueUrl=queue_url,
-                ReceiptHandle=receipt_handle
-            )
-            print(f"SQS 메시지 삭제 완료: {receipt_handle}")
-        except Exception as e:
-            raise RuntimeError(f"SQS 메시지 삭제 실패: {e}")
+    def send_sqs_message_batch(self, queue_url: str, message_bodies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """SQS 메시지를 10개씩 묶어 동시에 전송
+
+        Returns:
+            재시도 후에도 전송하지 못한 메시지 목록
+        """
+        entries = [
+            {"Id": str(index), "MessageBody": json.dumps(body)}
+            for index, body in enumerate(message_bodies)
+        ]
+        failed_ids = self._run_batches(
+            entries,
+            lambda chunk: self.sqs.send_message_batch(QueueUrl=queue_url, Entries=chunk),
+            size_of=lambda entry: len(entry["MessageBody"].encode("utf-8"))
+        )
+        if failed_ids:
+            print(f"SQS 메시지 일부 전송 실패: {len(failed_ids)}/{len(entries)}")
+        return [message_bodies[int(entry_id)] for entry_id in sorted(failed_ids, key=int)]
+
+    def _chunk_entries(self, entries: List[Dict[str, Any]], size_of: Optional[Callable[[Dict[str, Any]], int]]) -> List[List[Dict[str, Any]]]:
+        """항목 수(10개)와 전체 크기 제한을 넘지 않도록 배치 구성"""
+        chunks: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_bytes = 0
+        for entry in entries:
+            entry_bytes = size_of(entry) if size_of else 0
+            if current and (len(current) >= self.SQS_BATCH_SIZE or current_bytes + entry_bytes > self.SQS_BATCH_MAX_BYTES):
+                chunks.append(current)
+                current, current_bytes = [], 0
+            current.append(entry)
+            current_bytes += entry_bytes
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _send_chunk_with_retry(self, chunk: List[Dict[str, Any]], call: Callable[[List[Dict[str, Any]]], Dict[str, Any]]) -> List[str]:
+        """배치 하나를 호출하고 실패한 항목만 재시도. 최종 실패한 항목 Id 목록 반환"""
+        pending = chunk
+        rejected_ids: List[str] = []
+        for attempt in range(self.SQS_BATCH_RETRIES + 1):
+            if attempt:
+                time.sleep(self.SQS_RETRY_DELAY * (2 ** (attempt - 1)))
+            try:
+                response = call(pending)
+            except Exception as e:
+                print(f"SQS 배치 호출 실패 (시도 {attempt + 1}): {e}")
+                continue
+
+            failed = response.get("Failed", [])
+            # 요청 자체가 잘못된 항목(SenderFault)은 재시도해도 실패하므로 제외
+            rejected = [item["Id"] for item in failed if item.get("SenderFault")]
+            if rejected:
+                print(f"SQS 배치 항목 거부: {rejected}")
+                rejected_ids.extend(rejected)
+            retryable_ids = {item["Id"] for item in failed if not item.get("SenderFault")}
+            pending = [entry for entry in pending if entry["Id"] in retryable_ids]
+            if not pending:
+                break
+        return rejected_ids + [entry["Id"] for entry in pending]
+
+    def _run_batches(
+        self,
+        entries: List[Dict[str, Any]],
+        call: Callable[[List[Dict[str, Any]]], Dict[str, Any]],
+        size_of: Optional[Callable[[Dict[str, Any]], int]] = None
+    ) -> List[str]:
+        """배치들을 스레드 풀로 동시에 호출하고 최종 실패한 항목 Id 목록 반환"""
+        chunks = self._chunk_entries(entries, size_of)
+        if not chunks:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            results = list(executor.map(lambda chunk: self._send_chunk_with_retry(chunk, call), chunks))
+        return [entry_id for failed_ids in results for entry_id in failed_ids]
 
 class SlackNotifier:
     def __init__(self, webhook_url: str):
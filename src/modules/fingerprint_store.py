@@ -0,0 +1,53 @@
+import os
+import json
+import threading
+from typing import Dict, Optional
+from utils.logger import logger
+from modules.webtoon_url import TitleKey
+
+class FingerprintStore:
+    """웹툰별 페이지 지문(fingerprint)을 JSON 파일로 저장하고 불러오는 클래스
+
+    update()로 바뀐 지문은 메모리에만 반영되며, 수집 결과가 저장된 뒤 save()를 호출해야
+    파일에 기록된다. 결과 저장 전에 중단되어도 다음 실행에서 '변경 없음'으로 잘못 건너뛰지 않는다.
+    지문은 웹툰 키(TitleKey, "플랫폼:작품 ID")로 저장하므로 플랫폼이 다르면 ID가 같아도 섞이지 않는다.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._fingerprints: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        if self._fingerprints is None:
+            self._fingerprints = {}
+            if os.path.exists(self.filename):
+                try:
+                    with open(self.filename, "r", encoding="utf-8") as f:
+                        self._fingerprints = json.load(f)
+                except json.JSONDecodeError:
+                    logger.warning("파일이 비어있거나 올바르지 않은 JSON 형식입니다.", extra={"filename": self.filename})
+        return self._fingerprints
+
+    def get(self, key: TitleKey) -> Optional[str]:
+        """저장된 지문 조회"""
+        with self._lock:
+            return self._load().get(str(key))
+
+    def update(self, key: TitleKey, fingerprint: str) -> None:
+        """지문 갱신 (save() 전까지는 메모리에만 반영)"""
+        with self._lock:
+            self._load()[str(key)] = fingerprint
+
+    def save(self) -> None:
+        """지문을 파일에 기록"""
+        with self._lock:
+            fingerprints = self._load()
+            temp_filename = f"{self.filename}.tmp"
+            try:
+                with open(temp_filename, "w", encoding="utf-8") as f:
+                    json.dump(fingerprints, f, ensure_ascii=False)
+                os.replace(temp_filename, self.filename)
+                logger.info("지문 저장 완료", extra={"count": len(fingerprints), "filename": self.filename})
+            except Exception as e:
+                logger.error("지문 저장 실패", error=e)
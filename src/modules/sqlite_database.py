@@ -0,0 +1,61 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+class SqliteDatabase:
+    """SQLite 파일 하나에 대한 스레드별 연결과 트랜잭션을 관리하는 클래스
+
+    WAL 모드를 사용하므로 여러 스레드/프로세스가 같은 파일을 함께 읽고 쓸 수 있다.
+    sqlite3 연결은 스레드 간에 공유하지 않고 스레드마다 따로 연다.
+    """
+
+    def __init__(self, filename: str, timeout: float = 30.0):
+        """
+        Args:
+            filename (str): SQLite 파일
+            timeout (float): 다른 연결이 쓰는 중일 때 잠금을 기다릴 최대 시간(초)
+        """
+        self.filename = filename
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결을 반환. 없으면 WAL 모드로 새로 연결"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.filename, timeout=self.timeout, isolation_level=None,
+                                         check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡고, 예외가 나면 롤백"""
+        connection = self.connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """모든 스레드의 연결을 닫음"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
@@ -0,0 +1,198 @@
+import os
+import json
+from typing import Iterable, Iterator, List, Optional
+from utils.logger import logger
+from utils.stage_timer import stage_timer
+from modules.sqlite_database import SqliteDatabase
+from modules.webtoon_url import get_external_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    platform TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    episode_no INTEGER NOT NULL,
+    title TEXT,
+    thumbnail_url TEXT,
+    published_date TEXT,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (platform, external_id, episode_no)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS episode_failures (
+    id INTEGER PRIMARY KEY,
+    external_id TEXT NOT NULL UNIQUE,
+    url TEXT NOT NULL,
+    failure_type TEXT,
+    record TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+EPISODE_FIELDS = ("platform", "external_id", "episode_no", "title", "thumbnail_url", "published_date")
+
+class SqliteEpisodeRepository:
+    """웹툰 회차 정보를 SQLite 데이터베이스에 저장하는 클래스
+
+    (platform, external_id, episode_no)가 기본 키이므로 웹툰별 마지막 회차 번호 조회와
+    회차 갱신이 O(log n)이다. SqliteWebtoonRepository와 같은 데이터베이스 파일을 사용해도 된다.
+    """
+
+    def __init__(
+        self,
+        episode_filename: str,
+        failure_filename: str,
+        database_filename: Optional[str] = None,
+        timeout: float = 30.0
+    ):
+        """
+        Args:
+            episode_filename (str): 회차 데이터를 내보낼 JSON 파일
+            failure_filename (str): 실패 데이터를 내보낼 JSON 파일
+            database_filename (str, optional): SQLite 파일. 기본값은 회차 파일의 확장자만 .db로 바꾼 이름
+            timeout (float): 다른 연결이 쓰는 중일 때 잠금을 기다릴 최대 시간(초)
+        """
+        self.episode_filename = episode_filename
+        self.failure_filename = failure_filename
+        self.database_filename = database_filename or f"{os.path.splitext(episode_filename)[0]}.db"
+        self.database = SqliteDatabase(self.database_filename, timeout=timeout)
+        self.database.connection().executescript(SCHEMA)
+
+    def get_last_episode_no(self, platform: str, external_id: str) -> Optional[int]:
+        """저장된 마지막 회차 번호. 저장된 회차가 없으면 None"""
+        return self.database.connection().execute(
+            "SELECT MAX(episode_no) FROM episodes WHERE platform = ? AND external_id = ?",
+            (platform, external_id)
+        ).fetchone()[0]
+
+    def upsert_episodes(self, data_list: List[dict]) -> int:
+        """회차 데이터를 한 트랜잭션으로 갱신하고 처리한 레코드 수를 반환. 같은 웹툰의 실패 기록은 삭제"""
+        with self.database.transaction() as connection:
+            connection.executemany(
+                f"""
+                INSERT INTO episodes ({", ".join(EPISODE_FIELDS)}) VALUES ({", ".join("?" for _ in EPISODE_FIELDS)})
+                ON CONFLICT (platform, external_id, episode_no) DO UPDATE SET
+                    title = excluded.title,
+                    thumbnail_url = excluded.thumbnail_url,
+                    published_date = excluded.published_date,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                [tuple(record.get(field) for field in EPISODE_FIELDS) for record in data_list]
+            )
+            connection.executemany(
+                "DELETE FROM episode_failures WHERE external_id = ?",
+                {(record["external_id"],) for record in data_list}
+            )
+        return len(data_list)
+
+    def upsert_failure(self, data_list: List[dict]) -> int:
+        """실패 데이터를 한 트랜잭션으로 갱신하고 처리한 레코드 수를 반환"""
+        with self.database.transaction() as connection:
+            connection.executemany(
+                """
+                INSERT INTO episode_failures (external_id, url, failure_type, record) VALUES (?, ?, ?, ?)
+                ON CONFLICT (external_id) DO UPDATE SET
+                    url = excluded.url,
+                    failure_type = excluded.failure_type,
+                    record = excluded.record,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                [
+                    (get_external_id(item['url']), item['url'], item.get("failure_type"),
+                     json.dumps(item, ensure_ascii=False, default=str))
+                    for item in data_list
+                ]
+            )
+        return len(data_list)
+
+    @stage_timer.timed("repository.append_episodes")
+    def append_success(self, data_list: List[dict]) -> None:
+        """수집한 회차 데이터를 데이터베이스에 추가하거나 갱신"""
+        try:
+            count = self.upsert_episodes(data_list)
+            if count:
+                logger.info("회차 데이터 추가 완료", extra={"count": count})
+        except Exception as e:
+            logger.error("회차 데이터 저장 실패", error=e)
+            raise
+
+    def clear_failures(self, external_ids: Iterable[str]) -> int:
+        """회차 목록 수집에 성공한 웹툰의 실패 기록을 삭제하고 삭제한 수를 반환"""
+        with self.database.transaction() as connection:
+            return connection.executemany(
+                "DELETE FROM episode_failures WHERE external_id = ?",
+                {(external_id,) for external_id in external_ids}
+            ).rowcount
+
+    @stage_timer.timed("repository.append_unchanged")
+    def append_unchanged(self, data_list: List[dict]) -> None:
+        """새 회차 없이 수집에 성공한 웹툰({"url", "external_id"})의 이전 실패 기록을 삭제"""
+        try:
+            count = self.clear_failures(item.get("external_id") or get_external_id(item["url"]) for item in data_list)
+            if count:
+                logger.info("실패 기록 삭제 완료", extra={"count": count})
+        except Exception as e:
+            logger.error("실패 기록 삭제 실패", error=e)
+            raise
+
+    @stage_timer.timed("repository.append_failure")
+    def append_failure(self, data_list: List[dict]) -> None:
+        """회차 목록 수집에 실패한 웹툰을 데이터베이스에 추가하거나 갱신"""
+        try:
+            count = self.upsert_failure(data_list)
+            if count:
+                logger.info("실패 데이터 추가 완료", extra={"count": count})
+        except Exception as e:
+            logger.error("실패 데이터 저장 실패", error=e)
+            raise
+
+    def find(self, platform: str, external_id: str) -> List[dict]:
+        """웹툰 하나의 회차 목록을 회차 번호 순서대로 조회"""
+        rows = self.database.connection().execute(
+            f"SELECT {', '.join(EPISODE_FIELDS)} FROM episodes WHERE platform = ? AND external_id = ? ORDER BY episode_no",
+            (platform, external_id)
+        )
+        return [dict(row) for row in rows]
+
+    def iter_episodes(self) -> Iterator[dict]:
+        for row in self.database.connection().execute(
+            f"SELECT {', '.join(EPISODE_FIELDS)} FROM episodes ORDER BY platform, external_id, episode_no"
+        ):
+            yield dict(row)
+
+    def iter_failures(self) -> Iterator[dict]:
+        for row in self.database.connection().execute("SELECT record FROM episode_failures ORDER BY id"):
+            yield json.loads(row["record"])
+
+    @staticmethod
+    def _export(filename: str, records: List[dict]) -> None:
+        temp_filename = f"{filename}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as f:
+            json.dump(
+                records,
+                f,
+                ensure_ascii=False,
+                separators=(',', ':'),
+                indent=2
+            )
+        os.replace(temp_filename, filename)
+
+    @stage_timer.timed("repository.compact")
+    def compact(self) -> None:
+        """데이터베이스 내용을 JSON 파일로 내보냄"""
+        try:
+            episode_records = list(self.iter_episodes())
+            failure_records = list(self.iter_failures())
+            self._export(self.episode_filename, episode_records)
+            self._export(self.failure_filename, failure_records)
+            logger.info("JSON 파일 내보내기 완료", extra={
+                "episode_filename": self.episode_filename,
+                "episode_count": len(episode_records),
+                "failure_filename": self.failure_filename,
+                "failure_count": len(failure_records)
+            })
+        except Exception as e:
+            logger.error("JSON 파일 내보내기 실패", error=e)
+
+    def close(self) -> None:
+        """모든 스레드의 연결을 닫음"""
+        self.database.close()
@@ -0,0 +1,424 @@
+import os
+import json
+import sqlite3
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from utils.logger import logger
+from utils.stage_timer import stage_timer
+from modules.sqlite_database import SqliteDatabase
+from models.enums import SerializationStatus
+from modules.webtoon_url import get_external_id, get_record_key, get_record_platform
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS webtoons (
+    id INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    title TEXT,
+    day_of_week TEXT,
+    thumbnail_url TEXT,
+    link TEXT,
+    age_rating TEXT,
+    description TEXT,
+    serialization_status TEXT,
+    episode_count INTEGER,
+    platform_rating REAL,
+    publish_start_date TEXT,
+    last_updated_date TEXT,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (platform, external_id)
+);
+CREATE INDEX IF NOT EXISTS idx_webtoons_external_id ON webtoons (external_id);
+CREATE INDEX IF NOT EXISTS idx_webtoons_platform ON webtoons (platform);
+CREATE INDEX IF NOT EXISTS idx_webtoons_serialization_status ON webtoons (serialization_status);
+
+CREATE TABLE IF NOT EXISTS authors (
+    id INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    uid,
+    name TEXT,
+    UNIQUE (platform, uid)
+);
+
+CREATE TABLE IF NOT EXISTS webtoon_authors (
+    webtoon_id INTEGER NOT NULL REFERENCES webtoons (id) ON DELETE CASCADE,
+    author_id INTEGER NOT NULL REFERENCES authors (id),
+    role TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (webtoon_id, author_id, role)
+);
+CREATE INDEX IF NOT EXISTS idx_webtoon_authors_author_id ON webtoon_authors (author_id);
+
+CREATE TABLE IF NOT EXISTS genres (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS webtoon_genres (
+    webtoon_id INTEGER NOT NULL REFERENCES webtoons (id) ON DELETE CASCADE,
+    genre_id INTEGER NOT NULL REFERENCES genres (id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (webtoon_id, genre_id)
+);
+CREATE INDEX IF NOT EXISTS idx_webtoon_genres_genre_id ON webtoon_genres (genre_id);
+
+CREATE TABLE IF NOT EXISTS failures (
+    id INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    failure_type TEXT,
+    record TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (platform, external_id)
+);
+"""
+
+# WebtoonDTO 필드 순서 (authors, genres 제외)
+RECORD_FIELDS = (
+    "title", "external_id", "platform", "day_of_week", "thumbnail_url", "link", "age_rating", "description",
+    "serialization_status", "episode_count", "platform_rating", "publish_start_date", "last_updated_date"
+)
+WEBTOON_COLUMNS = tuple(field for field in RECORD_FIELDS if field not in ("external_id", "platform"))
+# 다시 수집할 때 스크래퍼가 수집하지 않은 필드(None)는 기존 값을 유지.
+# 연재 요일은 WebtoonDTO와 같이 완결 웹툰이면 비움
+UPSERT_ASSIGNMENTS = tuple(
+    f"{column} = CASE WHEN excluded.serialization_status = '{SerializationStatus.COMPLETED.name}' THEN NULL "
+    f"ELSE COALESCE(excluded.{column}, webtoons.{column}) END"
+    if column == "day_of_week" else f"{column} = COALESCE(excluded.{column}, webtoons.{column})"
+    for column in WEBTOON_COLUMNS
+)
+
+class SqliteWebtoonRepository:
+    """웹툰 데이터를 SQLite 데이터베이스에 저장하는 클래스
+
+    - 웹툰, 작가, 장르를 정규화된 테이블에 저장하고 (platform, external_id) 기준으로 갱신(upsert)한다.
+      다시 수집한 웹툰은 건너뛰지 않고 최신 정보로 덮어쓴다.
+    - external_id, platform, serialization_status에 인덱스가 있어 단건 조회와 갱신이 O(log n)이다.
+    - 한 번의 append 호출을 하나의 트랜잭션으로 처리한다.
+    - WAL 모드를 사용하므로 여러 스레드/프로세스가 같은 파일을 함께 쓸 수 있다 (SqliteDatabase).
+    - compact()를 호출하면 WebtoonRepository와 같은 형식의 JSON 파일로 내보낸다.
+    """
+
+    def __init__(
+        self,
+        success_filename: str,
+        failure_filename: str,
+        database_filename: Optional[str] = None,
+        timeout: float = 30.0
+    ):
+        """
+        Args:
+            success_filename (str): 성공 데이터를 내보낼 JSON 파일
+            failure_filename (str): 실패 데이터를 내보낼 JSON 파일
+            database_filename (str, optional): SQLite 파일. 기본값은 성공 파일의 확장자만 .db로 바꾼 이름
+            timeout (float): 다른 연결이 쓰는 중일 때 잠금을 기다릴 최대 시간(초)
+        """
+        self.success_filename = success_filename
+        self.failure_filename = failure_filename
+        self.database_filename = database_filename or f"{os.path.splitext(success_filename)[0]}.db"
+        self.database = SqliteDatabase(self.database_filename, timeout=timeout)
+
+        self.database.connection().executescript(SCHEMA)
+        self._migrate_export_files()
+
+    def _migrate_export_files(self) -> None:
+        """데이터베이스가 비어 있고 기존 JSON 파일이 있으면 그 내용을 가져옴"""
+        connection = self.database.connection()
+        if connection.execute("SELECT 1 FROM webtoons LIMIT 1").fetchone() is None:
+            records = self._load_export_file(self.success_filename)
+            if records:
+                self.upsert_success(records)
+                logger.info("기존 JSON 데이터를 SQLite로 가져오기 완료", extra={
+                    "filename": self.success_filename,
+                    "count": len(records)
+                })
+        if connection.execute("SELECT 1 FROM failures LIMIT 1").fetchone() is None:
+            records = self._load_export_file(self.failure_filename)
+            if records:
+                self.upsert_failure(records)
+
+    @staticmethod
+    def _load_export_file(filename: str) -> List[dict]:
+        if not os.path.exists(filename):
+            return []
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning("파일이 비어있거나 올바르지 않은 JSON 형식입니다.", extra={"filename": filename})
+            return []
+
+    @staticmethod
+    def _to_column(value: Any) -> Any:
+        """날짜와 Enum 값을 저장 가능한 형태로 변환"""
+        if isinstance(value, date):
+            return value.isoformat()
+        return getattr(value, "name", value)
+
+    @staticmethod
+    def _upsert_author(connection: sqlite3.Connection, platform: str, author: dict) -> int:
+        """작가를 갱신하고 id를 반환. uid는 받은 타입 그대로 저장하며, uid가 없으면 이름으로 구분"""
+        uid, name = author.get("uid"), author.get("name")
+        if uid is None:
+            row = connection.execute(
+                "SELECT id FROM authors WHERE platform = ? AND uid IS NULL AND name IS ?", (platform, name)
+            ).fetchone()
+            if row is not None:
+                return row[0]
+            return connection.execute(
+                "INSERT INTO authors (platform, uid, name) VALUES (?, NULL, ?)", (platform, name)
+            ).lastrowid
+        connection.execute(
+            "INSERT INTO authors (platform, uid, name) VALUES (?, ?, ?) "
+            "ON CONFLICT (platform, uid) DO UPDATE SET name = excluded.name",
+            (platform, uid, name)
+        )
+        return connection.execute(
+            "SELECT id FROM authors WHERE platform = ? AND uid = ?", (platform, uid)
+        ).fetchone()[0]
+
+    def upsert_success(self, data_list: List[dict]) -> int:
+        """성공 데이터를 한 트랜잭션으로 갱신하고 처리한 레코드 수를 반환. 같은 웹툰의 실패 기록은 삭제
+
+        레코드에 없는(None) 필드와 비어 있는 작가/장르 목록은 저장된 값을 유지한다.
+        """
+        with self.database.transaction() as connection:
+            for record in data_list:
+                platform = self._to_column(record.get("platform")) or ""
+                external_id = get_record_key(record)
+                values = [self._to_column(record.get(column)) for column in WEBTOON_COLUMNS]
+                connection.execute(
+                    f"""
+                    INSERT INTO webtoons (platform, external_id, {", ".join(WEBTOON_COLUMNS)})
+                    VALUES (?, ?, {", ".join("?" for _ in WEBTOON_COLUMNS)})
+                    ON CONFLICT (platform, external_id) DO UPDATE SET
+                        {", ".join(UPSERT_ASSIGNMENTS)},
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    (platform, external_id, *values)
+                )
+                webtoon_id = connection.execute(
+                    "SELECT id FROM webtoons WHERE platform = ? AND external_id = ?", (platform, external_id)
+                ).fetchone()[0]
+
+                if record.get("authors"):
+                    connection.execute("DELETE FROM webtoon_authors WHERE webtoon_id = ?", (webtoon_id,))
+                for position, author in enumerate(record.get("authors") or []):
+                    author_id = self._upsert_author(connection, platform, author)
+                    connection.execute(
+                        "INSERT OR IGNORE INTO webtoon_authors (webtoon_id, author_id, role, position) VALUES (?, ?, ?, ?)",
+                        (webtoon_id, author_id, self._to_column(author.get("role")) or "", position)
+                    )
+
+                if record.get("genres"):
+                    connection.execute("DELETE FROM webtoon_genres WHERE webtoon_id = ?", (webtoon_id,))
+                for position, genre in enumerate(record.get("genres") or []):
+                    connection.execute("INSERT OR IGNORE INTO genres (name) VALUES (?)", (genre,))
+                    genre_id = connection.execute("SELECT id FROM genres WHERE name = ?", (genre,)).fetchone()[0]
+                    connection.execute(
+                        "INSERT OR IGNORE INTO webtoon_genres (webtoon_id, genre_id, position) VALUES (?, ?, ?)",
+                        (webtoon_id, genre_id, position)
+                    )
+
+                connection.execute(
+                    "DELETE FROM failures WHERE platform = ? AND external_id = ?", (platform, external_id)
+                )
+        return len(data_list)
+
+    def upsert_failure(self, data_list: List[dict]) -> int:
+        """실패 데이터를 한 트랜잭션으로 갱신하고 처리한 레코드 수를 반환"""
+        with self.database.transaction() as connection:
+            connection.executemany(
+                """
+                INSERT INTO failures (platform, external_id, url, failure_type, record) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (platform, external_id) DO UPDATE SET
+                    url = excluded.url,
+                    failure_type = excluded.failure_type,
+                    record = excluded.record,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                [
+                    (self._to_column(item.get("platform")) or get_record_platform(item['url']),
+                     get_external_id(item['url']), item['url'], item.get("failure_type"),
+                     json.dumps(item, ensure_ascii=False, default=str))
+                    for item in data_list
+                ]
+            )
+        return len(data_list)
+
+    @stage_timer.timed("repository.append_success")
+    def append_success(self, data_list: List[dict]) -> None:
+        """성공한 데이터를 데이터베이스에 추가하거나 갱신"""
+        try:
+            count = self.upsert_success(data_list)
+            if count:
+                logger.info("성공 데이터 추가 완료", extra={"count": count})
+        except Exception as e:
+            logger.error("성공 데이터 저장 실패", error=e)
+            raise
+
+    @stage_timer.timed("repository.append_failure")
+    def append_failure(self, data_list: List[dict]) -> None:
+        """실패한 데이터를 데이터베이스에 추가하거나 갱신"""
+        try:
+            count = self.upsert_failure(data_list)
+            if count:
+                logger.info("실패 데이터 추가 완료", extra={"count": count})
+        except Exception as e:
+            logger.error("실패 데이터 저장 실패", error=e)
+            raise
+
+    def _build_records(self, rows: List[sqlite3.Row]) -> List[dict]:
+        """webtoons 행에 작가와 장르를 붙여 WebtoonDTO.to_dict()와 같은 형태로 변환"""
+        if not rows:
+            return []
+        records: Dict[int, dict] = {}
+        for row in rows:
+            record = {field: row[field] for field in RECORD_FIELDS}
+            record["authors"] = []
+            record["genres"] = []
+            records[row["id"]] = record
+
+        connection = self.database.connection()
+        placeholders = ", ".join("?" for _ in records)
+        for row in connection.execute(
+            f"""
+            SELECT wa.webtoon_id, a.uid, a.name, wa.role FROM webtoon_authors wa
+            JOIN authors a ON a.id = wa.author_id
+            WHERE wa.webtoon_id IN ({placeholders}) ORDER BY wa.webtoon_id, wa.position
+            """,
+            tuple(records)
+        ):
+            records[row["webtoon_id"]]["authors"].append({"uid": row["uid"], "name": row["name"], "role": row["role"]})
+        for row in connection.execute(
+            f"""
+            SELECT wg.webtoon_id, g.name FROM webtoon_genres wg
+            JOIN genres g ON g.id = wg.genre_id
+            WHERE wg.webtoon_id IN ({placeholders}) ORDER BY wg.webtoon_id, wg.position
+            """,
+            tuple(records)
+        ):
+            records[row["webtoon_id"]]["genres"].append(row["name"])
+        return list(records.values())
+
+    def get(self, external_id: str, platform: Optional[str] = None) -> Optional[dict]:
+        """external_id(와 플랫폼)로 웹툰 하나를 조회. 없으면 None"""
+        sql = "SELECT * FROM webtoons WHERE external_id = ?"
+        params: tuple = (external_id,)
+        if platform is not None:
+            sql += " AND platform = ?"
+            params += (platform,)
+        records = self._build_records(self.database.connection().execute(sql + " LIMIT 1", params).fetchall())
+        return records[0] if records else None
+
+    def contains(self, external_id: str) -> bool:
+        return self.database.connection().execute(
+            "SELECT 1 FROM webtoons WHERE external_id = ? LIMIT 1", (external_id,)
+        ).fetchone() is not None
+
+    def find(
+        self,
+        platform: Optional[str] = None,
+        serialization_status: Optional[str] = None,
+        batch_size: int = 500
+    ) -> Iterator[dict]:
+        """플랫폼과 연재 상태로 웹툰을 조회. 결과는 batch_size개씩 읽어 순서대로 반환"""
+        conditions = []
+        params: tuple = ()
+        if platform is not None:
+            conditions.append("platform = ?")
+            params += (platform,)
+        if serialization_status is not None:
+            conditions.append("serialization_status = ?")
+            params += (serialization_status,)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        cursor = self.database.connection().execute(f"SELECT * FROM webtoons {where} ORDER BY id", params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from self._build_records(rows)
+
+    def get_serialization_statuses(self, platform: Optional[str] = None) -> Dict[Tuple[str, str], Optional[str]]:
+        """(platform, external_id)별 저장된 연재 상태 (상태 확인 크롤러의 비교 기준). 작가와 장르는 읽지 않음"""
+        sql = "SELECT platform, external_id, serialization_status FROM webtoons"
+        params: tuple = ()
+        if platform is not None:
+            sql += " WHERE platform = ?"
+            params = (platform,)
+        return {
+            (row["platform"], row["external_id"]): row["serialization_status"]
+            for row in self.database.connection().execute(sql, params)
+        }
+
+    def get_crawl_metadata(self, platform: Optional[str] = None) -> Dict[Tuple[str, str], dict]:
+        """(platform, external_id)별 연재 요일과 연재 상태 (CrawlScheduler의 일정 계산 기준)"""
+        sql = "SELECT platform, external_id, day_of_week, serialization_status FROM webtoons"
+        params: tuple = ()
+        if platform is not None:
+            sql += " WHERE platform = ?"
+            params = (platform,)
+        return {
+            (row["platform"], row["external_id"]): {"day_of_week": row["day_of_week"], "serialization_status": row["serialization_status"]}
+            for row in self.database.connection().execute(sql, params)
+        }
+
+    @stage_timer.timed("repository.update_status")
+    def update_serialization_status(self, data_list: List[dict]) -> int:
+        """연재 상태만 한 트랜잭션으로 갱신하고 갱신된 웹툰 수를 반환. 저장되지 않은 웹툰은 무시
+
+        Args:
+            data_list: {"platform", "external_id", "serialization_status"}를 가진 레코드 목록
+        """
+        with self.database.transaction() as connection:
+            cursor = connection.executemany(
+                """
+                UPDATE webtoons SET serialization_status = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE platform = ? AND external_id = ?
+                """,
+                [(item["serialization_status"], item["platform"], item["external_id"]) for item in data_list]
+            )
+            return cursor.rowcount
+
+    def count(self) -> int:
+        return self.database.connection().execute("SELECT COUNT(*) FROM webtoons").fetchone()[0]
+
+    def iter_failures(self) -> Iterator[dict]:
+        for row in self.database.connection().execute("SELECT record FROM failures ORDER BY id"):
+            yield json.loads(row["record"])
+
+    @staticmethod
+    def _export(filename: str, records: List[dict]) -> None:
+        temp_filename = f"{filename}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as f:
+            json.dump(
+                records,
+                f,
+                ensure_ascii=False,
+                separators=(',', ':'),
+                indent=2
+            )
+        os.replace(temp_filename, filename)
+
+    @stage_timer.timed("repository.compact")
+    def compact(self) -> None:
+        """데이터베이스 내용을 기존 JSON 파일 형식으로 내보냄"""
+        try:
+            success_records = list(self.find())
+            failure_records = list(self.iter_failures())
+            self._export(self.success_filename, success_records)
+            self._export(self.failure_filename, failure_records)
+            logger.info("JSON 파일 내보내기 완료", extra={
+                "success_filename": self.success_filename,
+                "success_count": len(success_records),
+                "failure_filename": self.failure_filename,
+                "failure_count": len(failure_records)
+            })
+        except Exception as e:
+            logger.error("JSON 파일 내보내기 실패", error=e)
+
+    def close(self) -> None:
+        """모든 스레드의 연결을 닫음"""
+        self.database.close()
@@ -1,7 +1,13 @@
 from .common import IWebDriverManager
 from .web_driver_factory import WebDriverFactory
+from .web_driver_pool import WebDriverPool
+from .warm_web_driver_manager import WarmWebDriverManager
+from .managed_driver_session import ManagedDriverSession
 
 __all__ = [
     'IWebDriverManager',
-    'WebDriverFactory'
+    'WebDriverFactory',
+    'WebDriverPool',
+    'WarmWebDriverManager',
+    'ManagedDriverSession'
 ] 
\ No newline at end of file
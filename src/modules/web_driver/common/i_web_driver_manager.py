@@ -9,4 +9,12 @@ class IWebDriverManager(ABC):
     @abstractmethod
     def get_driver(self):
         """설정된 드라이버를 반환하는 메서드"""
-        pass 
\ No newline at end of file
+        pass
+
+    def release_driver(self, driver):
+        """사용이 끝난 드라이버를 반납하는 메서드 (기본 동작은 종료)"""
+        driver.quit()
+
+    def discard_driver(self, driver):
+        """응답하지 않거나 교체할 드라이버를 재사용하지 않고 종료하는 메서드"""
+        driver.quit()
@@ -1,5 +1,13 @@
 from .chrome_webdriver_manager import ChromeWebDriverManager
 from .docker_chrome_webdriver_manager import DockerChromeWebDriverManager
 from .web_driver_manager import WebDriverManager
+from .chrome_options_builder import ChromeOptionsBuilder, apply_blocked_urls, DEFAULT_BLOCKED_URL_PATTERNS
 
-__all__ = ['ChromeWebDriverManager', 'DockerChromeWebDriverManager', 'WebDriverManager'] 
\ No newline at end of file
+__all__ = [
+    'ChromeWebDriverManager',
+    'DockerChromeWebDriverManager',
+    'WebDriverManager',
+    'ChromeOptionsBuilder',
+    'apply_blocked_urls',
+    'DEFAULT_BLOCKED_URL_PATTERNS'
+] 
\ No newline at end of file
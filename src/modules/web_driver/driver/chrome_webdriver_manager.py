@@ -1,32 +1,46 @@
+from typing import List, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from .web_driver_manager import WebDriverManager
+from .chrome_options_builder import ChromeOptionsBuilder, apply_blocked_urls
 
 class ChromeWebDriverManager(WebDriverManager):
     """로컬 환경에서 Chrome WebDriver를 관리하는 클래스"""
     
-    def __init__(self, headless: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        block_resources: bool = True,
+        page_load_strategy: str = "eager",
+        blocked_url_patterns: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            headless (bool): 헤드리스 모드 사용 여부
+            block_resources (bool): 이미지, 폰트, 광고/분석 스크립트 요청 차단 여부
+            page_load_strategy (str): 페이지 로드 전략 ("eager", "normal")
+            blocked_url_patterns (List[str], optional): 차단할 URL 패턴. None이면 기본 목록 사용
+        """
         self.headless = headless
+        self.block_resources = block_resources
+        self.page_load_strategy = page_load_strategy
+        self.blocked_url_patterns = blocked_url_patterns
 
     def get_driver(self):
         """Chrome WebDriver 인스턴스를 생성하고 반환합니다."""
-        chrome_options = Options()
-        
-        if self.headless:
-            chrome_options.add_argument('--headless')
-        
-        # 기본 옵션 설정
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options = ChromeOptionsBuilder(
+            headless=self.headless,
+            page_load_strategy=self.page_load_strategy,
+            block_resources=self.block_resources
+        ).build()
         
         # ChromeDriver 자동 설치 및 서비스 생성
         service = Service(ChromeDriverManager().install())
         
         # WebDriver 생성
         driver = webdriver.Chrome(service=service, options=chrome_options)
+        if self.block_resources:
+            apply_blocked_urls(driver, self.blocked_url_patterns)
         
-        return driver 
\ No newline at end of file
+        return driver
@@ -2,32 +2,46 @@ import os
 from utils.logger import logger
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from typing import List, Optional
 from .web_driver_manager import WebDriverManager
+from .chrome_options_builder import ChromeOptionsBuilder, apply_blocked_urls
 
 class DockerChromeWebDriverManager(WebDriverManager):
     """Docker Lambda 환경에서 Chrome WebDriver를 관리하는 클래스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        block_resources: bool = True,
+        page_load_strategy: str = "eager",
+        blocked_url_patterns: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            block_resources (bool): 이미지, 폰트, 광고/분석 스크립트 요청 차단 여부
+            page_load_strategy (str): 페이지 로드 전략 ("eager", "normal")
+            blocked_url_patterns (List[str], optional): 차단할 URL 패턴. None이면 기본 목록 사용
+        """
         self.chrome_binary = os.getenv('CHROME_BIN', '/usr/bin/chromium')
         self.chromedriver_path = os.getenv('CHROMEDRIVER_PATH', '/usr/bin/chromedriver')
+        self.block_resources = block_resources
+        self.page_load_strategy = page_load_strategy
+        self.blocked_url_patterns = blocked_url_patterns
 
     def get_driver(self):
         """Chrome WebDriver 인스턴스를 생성하고 반환합니다."""
-        chrome_options = Options()
-        
-        # Docker Lambda 환경에 필요한 옵션 설정
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-software-rasterizer')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--single-process')
-        chrome_options.add_argument('--remote-debugging-port=9222')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-setuid-sandbox')
-        chrome_options.binary_location = '/usr/bin/chromium'
+        # Docker Lambda 환경은 항상 headless 모드로 동작
+        chrome_options = (ChromeOptionsBuilder(
+                headless=True,
+                headless_argument='--headless',
+                page_load_strategy=self.page_load_strategy,
+                block_resources=self.block_resources
+            )
+            .add_argument('--single-process')
+            # 세션 풀과 세션 재시작으로 한 컨테이너에 Chrome이 여러 개 뜨므로 고정 포트 대신 빈 포트를 할당받음
+            .add_argument('--remote-debugging-port=0')
+            .add_argument('--disable-setuid-sandbox')
+            .set_binary_location('/usr/bin/chromium')
+            .build())
         
         # Chrome 서비스 생성
         service = Service(
@@ -39,6 +53,8 @@ class DockerChromeWebDriverManager(WebDriverManager):
             service=service,
             options=chrome_options
         )
+        if self.block_resources:
+            apply_blocked_urls(driver, self.blocked_url_patterns)
         
         return driver
 
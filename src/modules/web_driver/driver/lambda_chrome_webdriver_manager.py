@@ -2,17 +2,18 @@ import os
 from utils.logger import logger
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from ..common.i_web_driver_manager import IWebDriverManager
+from .chrome_options_builder import ChromeOptionsBuilder, apply_blocked_urls
 
 class ChromeWebDriverManager(IWebDriverManager):
     """Lambda 환경에서 크롬 드라이버를 자동으로 관리하는 클래스"""
     
     CHROME_DRIVER_PATH = "/tmp/chromedriver"
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, block_resources: bool = True):
         self.headless = headless
+        self.block_resources = block_resources
         self.driver_path = None
         self.setup_driver()
 
@@ -39,31 +40,17 @@ class ChromeWebDriverManager(IWebDriverManager):
             logger.warning("크롬 드라이버를 찾을 수 없습니다. 다시 설정합니다")
             self.setup_driver()
 
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-            options.add_argument("--window-size=1920x1080")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-
         # Lambda 환경에 최적화된 옵션
-        options.binary_location = '/opt/chrome/chrome'  # Lambda Layer에 설치된 Chrome 위치
-        options.add_argument("--disable-gpu")
-        options.add_argument("--single-process")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--no-zygote")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-software-rasterizer")
-        options.add_argument("--disable-webgl")
-        options.add_argument("--log-level=3")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--blink-settings=imagesEnabled=false")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-popup-blocking")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-background-networking")
+        options = (ChromeOptionsBuilder(headless=self.headless, block_resources=self.block_resources)
+            .set_binary_location('/opt/chrome/chrome')  # Lambda Layer에 설치된 Chrome 위치
+            .add_argument("--single-process")
+            .add_argument("--no-zygote")
+            .add_argument("--disable-webgl")
+            .build())
 
         service = Service(self.driver_path)
         driver = webdriver.Chrome(service=service, options=options)
+        if self.block_resources:
+            apply_blocked_urls(driver)
         logger.info("크롬 드라이버 실행 완료")
         return driver 
\ No newline at end of file
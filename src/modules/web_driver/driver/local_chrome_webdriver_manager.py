@@ -1,15 +1,16 @@
 from utils.logger import logger
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from modules.web_driver import IWebDriverManager  # 인터페이스 import
+from .chrome_options_builder import ChromeOptionsBuilder, apply_blocked_urls
 
 class LocalChromeWebDriverManager(IWebDriverManager):
     """크롬 드라이버를 자동으로 관리하는 클래스"""
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, block_resources: bool = True):
         self.headless = headless
+        self.block_resources = block_resources
         self.driver_path = None
         self.setup_driver()
 
@@ -27,27 +28,13 @@ class LocalChromeWebDriverManager(IWebDriverManager):
             logger.warning("크롬 드라이버를 찾을 수 없습니다. 다시 설정합니다")
             self.setup_driver()
 
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")  # 최신 headless 모드 사용
-            options.add_argument("--window-size=1920x1080")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-
-        # WebGL 관련 에러 방지 옵션 추가
-        options.add_argument("--disable-gpu")  # GPU 가속 비활성화
-        options.add_argument("--disable-software-rasterizer")  # 소프트웨어 렌더링 방지
-        options.add_argument("--disable-webgl")  # WebGL 관련 기능 비활성화
-        options.add_argument("--log-level=3")  # 불필요한 로그 숨기기
-        options.add_argument("--disable-blink-features=AutomationControlled")  # 봇 탐지 방지
-
-        options.add_argument("--blink-settings=imagesEnabled=false")  # 이미지 로드 차단
-        options.add_argument("--disable-extensions")  # 확장 프로그램 비활성화
-        options.add_argument("--disable-popup-blocking")  # 팝업 차단 기능 비활성화
-        options.add_argument("--disable-notifications")  # 알림 비활성화
-        options.add_argument("--disable-background-networking")  # 백그라운드 네트워크 요청 방지
+        options = (ChromeOptionsBuilder(headless=self.headless, block_resources=self.block_resources)
+            .add_argument("--disable-webgl")  # WebGL 관련 에러 방지
+            .build())
 
         service = Service(self.driver_path)
         driver = webdriver.Chrome(service=service, options=options)
+        if self.block_resources:
+            apply_blocked_urls(driver)
         logger.info("크롬 드라이버 실행 완료")
         return driver 
\ No newline at end of file
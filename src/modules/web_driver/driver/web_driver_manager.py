@@ -7,4 +7,12 @@ class WebDriverManager(ABC):
     @abstractmethod
     def get_driver(self) -> WebDriver:
         """WebDriver 인스턴스를 생성하고 반환합니다."""
-        pass 
\ No newline at end of file
+        pass
+
+    def release_driver(self, driver: WebDriver) -> None:
+        """사용이 끝난 WebDriver를 반납합니다. (기본 동작은 종료)"""
+        driver.quit()
+
+    def discard_driver(self, driver: WebDriver) -> None:
+        """응답하지 않거나 교체할 WebDriver를 재사용하지 않고 종료합니다."""
+        driver.quit()
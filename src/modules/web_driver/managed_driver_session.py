@@ -0,0 +1,140 @@
+import os
+from typing import Dict, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.logger import logger
+from .common.i_web_driver_manager import IWebDriverManager
+
+class ManagedDriverSession:
+    """드라이버 매니저 하나로 만든 Chrome 세션을 장시간 실행에 맞게 관리하는 클래스
+
+    - max_pages 페이지를 처리했거나 Chrome 프로세스 RSS가 max_rss_mb를 넘으면 세션을 새로 만든다.
+    - 세션이 응답하지 않으면 새로 만든다 (처리 중이던 URL은 호출하는 쪽에서 다시 시도).
+    - 재시작 횟수를 원인별로 기록한다.
+
+    사용법:
+        driver = session.before_page()  # 필요하면 여기서 재시작
+        ... driver.get(url) ...
+        session.after_page()
+        if 실패 and session.restart_if_dead():
+            ... 같은 URL을 새 세션으로 다시 처리 ...
+    """
+
+    RECYCLE_PAGES = "pages"
+    RECYCLE_MEMORY = "memory"
+    RECYCLE_CRASH = "crash"
+
+    def __init__(
+        self,
+        driver_manager: IWebDriverManager,
+        max_pages: Optional[int] = 300,
+        max_rss_mb: Optional[float] = 2048,
+        memory_check_interval: int = 20
+    ):
+        """
+        Args:
+            driver_manager (IWebDriverManager): 드라이버를 생성하고 반납받을 매니저
+            max_pages (int, optional): 세션당 최대 페이지 수. None이면 페이지 수로 재시작하지 않음
+            max_rss_mb (float, optional): chromedriver와 Chrome 프로세스 RSS 합계 상한(MB). None이면 확인하지 않음
+            memory_check_interval (int): 몇 페이지마다 RSS를 확인할지 (/proc을 읽으므로 매 페이지 확인하지 않음)
+        """
+        self.driver_manager = driver_manager
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.memory_check_interval = max(memory_check_interval, 1)
+        self.driver: WebDriver = driver_manager.get_driver()
+        self.pages = 0
+        self.total_pages = 0
+        self.recycle_counts: Dict[str, int] = {
+            self.RECYCLE_PAGES: 0,
+            self.RECYCLE_MEMORY: 0,
+            self.RECYCLE_CRASH: 0
+        }
+
+    def before_page(self) -> WebDriver:
+        """다음 페이지를 처리하기 전에 재시작 조건을 확인하고 사용할 드라이버를 반환"""
+        if self.max_pages and self.pages >= self.max_pages:
+            self.restart(self.RECYCLE_PAGES)
+        elif self.max_rss_mb and self.pages and self.pages % self.memory_check_interval == 0:
+            rss_mb = self.get_rss_mb()
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                logger.info("Chrome 메모리 사용량 초과", extra={"rss_mb": round(rss_mb, 1), "max_rss_mb": self.max_rss_mb})
+                self.restart(self.RECYCLE_MEMORY)
+        return self.driver
+
+    def after_page(self) -> None:
+        self.pages += 1
+        self.total_pages += 1
+
+    def is_alive(self) -> bool:
+        """세션이 응답하는지 확인"""
+        if getattr(self.driver, "session_id", None) is None:
+            return False
+        try:
+            self.driver.execute_script("return document.readyState")
+            return True
+        except Exception:
+            return False
+
+    def restart_if_dead(self) -> bool:
+        """세션이 응답하지 않으면 재시작하고 True 반환"""
+        if self.is_alive():
+            return False
+        logger.warning("WebDriver 세션이 응답하지 않아 다시 시작합니다", extra={"pages": self.pages})
+        self.restart(self.RECYCLE_CRASH)
+        return True
+
+    def restart(self, reason: str) -> WebDriver:
+        """현재 세션을 종료하고 새 세션 생성"""
+        self._discard(self.driver)
+        self.driver = self.driver_manager.get_driver()
+        self.recycle_counts[reason] += 1
+        logger.info("WebDriver 세션 재시작", extra={"reason": reason, "pages": self.pages, "recycle_counts": self.recycle_counts})
+        self.pages = 0
+        return self.driver
+
+    def _discard(self, driver: WebDriver) -> None:
+        """세션을 재사용하지 않고 종료 (재사용 매니저도 종료된 세션을 초기화하거나 보관하지 않음)"""
+        try:
+            self.driver_manager.discard_driver(driver)
+        except Exception as e:
+            logger.warning("WebDriver 종료 중 오류 발생", extra={"error": str(e)})
+
+    def get_rss_mb(self) -> Optional[float]:
+        """chromedriver와 그 하위 프로세스(Chrome)의 RSS 합계(MB). /proc이 없거나 프로세스를 알 수 없으면 None"""
+        service = getattr(self.driver, "service", None)
+        process = getattr(service, "process", None)
+        root_pid = getattr(process, "pid", None)
+        if root_pid is None or not os.path.isdir("/proc"):
+            return None
+
+        children: Dict[int, list] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "r") as f:
+                    # "pid (comm) state ppid ..." 형식. comm에 공백이 있을 수 있어 마지막 ')' 뒤부터 읽음
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+
+        page_kb = os.sysconf("SC_PAGE_SIZE") / 1024
+        total_kb = 0.0
+        stack = [root_pid]
+        while stack:
+            pid = stack.pop()
+            try:
+                with open(f"/proc/{pid}/statm", "r") as f:
+                    total_kb += int(f.read().split()[1]) * page_kb
+            except (OSError, IndexError, ValueError):
+                pass
+            stack.extend(children.get(pid, []))
+        return total_kb / 1024
+
+    def release(self) -> None:
+        """세션을 드라이버 매니저에 반납 (기본 매니저는 종료, 재사용 매니저는 보관)"""
+        self.driver_manager.release_driver(self.driver)
+
+    def summary(self) -> Dict[str, int]:
+        return {"pages": self.total_pages, **{f"recycled_{reason}": count for reason, count in self.recycle_counts.items()}}
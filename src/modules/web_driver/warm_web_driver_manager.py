@@ -0,0 +1,117 @@
+import threading
+from typing import Optional
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.logger import logger
+from .common.i_web_driver_manager import IWebDriverManager
+
+class WarmWebDriverManager(IWebDriverManager):
+    """Lambda warm 컨테이너에서 하나의 WebDriver를 여러 요청에 걸쳐 재사용하는 드라이버 매니저
+
+    release_driver()로 반납된 드라이버는 종료하지 않고 쿠키와 저장소만 초기화해 보관한다.
+    다음 get_driver()에서 세션 상태를 확인하고, 응답하지 않는 경우에만 새로 생성한다.
+    보관 중인 드라이버가 이미 사용 중이면 내부 매니저로 일반 드라이버를 만들어 준다.
+    """
+
+    BLANK_PAGE = "about:blank"
+    CLEAR_STORAGE_SCRIPT = "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+
+    def __init__(self, driver_manager):
+        """
+        Args:
+            driver_manager (IWebDriverManager): 실제 드라이버를 생성할 매니저
+        """
+        self.driver_manager = driver_manager
+        self._driver: Optional[WebDriver] = None
+        self._in_use = False
+        self._lock = threading.Lock()
+        self.created_count = 0
+        self.reused_count = 0
+        self.last_reused = False
+
+    def setup_driver(self):
+        setup_driver = getattr(self.driver_manager, "setup_driver", None)
+        if setup_driver:
+            setup_driver()
+
+    def is_alive(self, driver: WebDriver) -> bool:
+        """세션이 살아있는지 확인"""
+        if driver is None or getattr(driver, "session_id", None) is None:
+            return False
+        try:
+            driver.execute_script("return document.readyState")
+            return True
+        except WebDriverException:
+            return False
+
+    def reset_session(self, driver: WebDriver) -> None:
+        """다음 요청에 이전 요청의 쿠키와 저장소가 남지 않도록 초기화"""
+        try:
+            # CDP로 모든 도메인의 쿠키와 저장소를 한 번에 삭제
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+        except (AttributeError, WebDriverException):
+            # CDP를 지원하지 않는 드라이버는 현재 도메인 기준으로 삭제
+            driver.execute_script(self.CLEAR_STORAGE_SCRIPT)
+            driver.delete_all_cookies()
+        driver.get(self.BLANK_PAGE)
+
+    def get_driver(self) -> WebDriver:
+        """보관 중인 드라이버가 살아있으면 재사용하고, 아니면 새로 생성"""
+        with self._lock:
+            if self._in_use:
+                logger.info("재사용 드라이버가 사용 중이므로 새 드라이버 생성")
+                return self.driver_manager.get_driver()
+
+            if self._driver is not None and self.is_alive(self._driver):
+                self.reused_count += 1
+                self.last_reused = True
+                logger.info("기존 WebDriver 재사용", extra={"reused_count": self.reused_count})
+            else:
+                if self._driver is not None:
+                    logger.warning("WebDriver 세션이 응답하지 않아 다시 생성합니다")
+                    self._quit(self._driver)
+                self._driver = self.driver_manager.get_driver()
+                self.created_count += 1
+                self.last_reused = False
+                logger.info("WebDriver 생성", extra={"created_count": self.created_count})
+
+            self._in_use = True
+            return self._driver
+
+    def release_driver(self, driver: WebDriver) -> None:
+        """보관 중인 드라이버는 초기화 후 보관하고, 그 외의 드라이버는 종료"""
+        with self._lock:
+            if driver is not self._driver:
+                self._quit(driver)
+                return
+
+            self._in_use = False
+            try:
+                self.reset_session(driver)
+            except Exception as e:
+                logger.warning("WebDriver 초기화 실패, 다음 요청에서 다시 생성합니다", extra={"error": str(e)})
+                self._quit(driver)
+                self._driver = None
+
+    def discard_driver(self, driver: WebDriver) -> None:
+        """드라이버를 초기화하거나 보관하지 않고 종료 (보관 중인 드라이버였다면 다음 요청에서 새로 생성)"""
+        with self._lock:
+            if driver is self._driver:
+                self._driver = None
+                self._in_use = False
+            self._quit(driver)
+
+    def shutdown(self) -> None:
+        """보관 중인 드라이버 종료"""
+        with self._lock:
+            if self._driver is not None:
+                self._quit(self._driver)
+                self._driver = None
+            self._in_use = False
+
+    def _quit(self, driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("WebDriver 종료 중 오류 발생", extra={"error": str(e)})
@@ -10,6 +10,15 @@ from .common.i_web_driver_manager import IWebDriverManager
 class WebDriverFactory:
     """웹 드라이버 팩토리 클래스"""
 
+    def __init__(self, block_resources: bool = True, page_load_strategy: str = "eager"):
+        """
+        Args:
+            block_resources (bool): 모든 드라이버에서 이미지, 폰트, 광고/분석 스크립트 요청 차단 여부
+            page_load_strategy (str): 모든 드라이버의 페이지 로드 전략 ("eager", "normal")
+        """
+        self.block_resources = block_resources
+        self.page_load_strategy = page_load_strategy
+
     def create_driver(self, environment: str = "local", headless: bool = True) -> WebDriverManager:
         """
         환경에 따른 웹 드라이버 매니저를 생성합니다.
@@ -23,10 +32,17 @@ class WebDriverFactory:
         """
         if environment == "docker_lambda":
             # Docker Lambda 환경에서는 항상 headless 모드로 동작
-            return DockerChromeWebDriverManager()
+            return DockerChromeWebDriverManager(
+                block_resources=self.block_resources,
+                page_load_strategy=self.page_load_strategy
+            )
         else:
             # 로컬 환경에서만 headless 옵션 적용
-            return ChromeWebDriverManager(headless=headless)
+            return ChromeWebDriverManager(
+                headless=headless,
+                block_resources=self.block_resources,
+                page_load_strategy=self.page_load_strategy
+            )
 
     @staticmethod
     def create_driver_old(environment: Optional[str] = None, headless: bool = False) -> IWebDriverManager:
@@ -0,0 +1,56 @@
+from typing import Dict, List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.logger import logger
+from .common.i_web_driver_manager import IWebDriverManager
+from .managed_driver_session import ManagedDriverSession
+
+class WebDriverPool:
+    """여러 WebDriver 세션을 함께 관리하는 풀 클래스"""
+
+    def __init__(
+        self,
+        managers: List[IWebDriverManager],
+        max_pages: Optional[int] = 300,
+        max_rss_mb: Optional[float] = 2048
+    ):
+        """
+        웹 드라이버 풀 초기화
+
+        Args:
+            managers (List[IWebDriverManager]): 세션마다 하나씩 사용할 드라이버 매니저 목록
+            max_pages (int, optional): 세션을 재시작하기 전까지 처리할 최대 페이지 수
+            max_rss_mb (float, optional): 세션을 재시작할 Chrome 메모리(RSS) 상한(MB)
+        """
+        if not managers:
+            raise ValueError("드라이버 매니저 목록이 비어있습니다.")
+        self.managers = list(managers)
+        self.sessions: List[ManagedDriverSession] = [
+            ManagedDriverSession(manager, max_pages=max_pages, max_rss_mb=max_rss_mb)
+            for manager in self.managers
+        ]
+        logger.info("WebDriver 풀 생성 완료", extra={"size": len(self.sessions)})
+
+    @property
+    def drivers(self) -> List[WebDriver]:
+        """각 세션의 현재 드라이버 (세션이 재시작되면 바뀜)"""
+        return [session.driver for session in self.sessions]
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def summary(self) -> Dict[str, int]:
+        """세션 전체의 처리 페이지 수와 원인별 재시작 횟수 합계"""
+        total: Dict[str, int] = {}
+        for session in self.sessions:
+            for key, value in session.summary().items():
+                total[key] = total.get(key, 0) + value
+        return total
+
+    def shutdown(self) -> None:
+        """풀의 모든 WebDriver를 각 드라이버 매니저에 반납 (기본 매니저는 종료, 재사용 매니저는 보관)"""
+        for session in self.sessions:
+            try:
+                session.release()
+            except Exception as e:
+                logger.error("WebDriver 종료 중 오류 발생", error=e)
+        logger.info("WebDriver 풀 종료 완료", extra={"size": len(self.sessions), "sessions": self.summary()})
@@ -1,13 +1,22 @@
 import os
-from typing import Set
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Dict, List, Optional, Tuple
 from utils.logger import logger
+from modules.webtoon_url import TitleIndex
 
 class WebtoonListManager:
     """웹툰 리스트를 관리하는 클래스"""
 
+    COMPLETED_PAGE_LIMIT = 200  # 완결 목록 최대 페이지 수 (무한 루프 방지)
+    COMPLETED_PAGE_WINDOW = 2  # 완결 목록을 미리 요청해 둘 페이지 수
+    PAGE_ATTEMPTS = 3  # 목록 페이지 하나를 요청할 최대 횟수
+    COMPLETED_FAILED_PAGE_LIMIT = 3  # 건너뛴 완결 목록 페이지가 이 수에 도달하면 이후 페이지는 요청하지 않음
+
     def __init__(self, filename: str):
         self.filename = filename
-        self.urls: Set[str] = set()
+        # 웹툰 키(플랫폼, titleId) 기준으로 정규 URL을 보관하여 URL 변형을 중복 없이 관리
+        self.urls: TitleIndex = TitleIndex()
 
     def load_urls_from_txt(self) -> bool:
         """텍스트 파일에서 웹툰 URL을 로드"""
@@ -23,8 +32,8 @@ class WebtoonListManager:
                 logger.warning("파일이 비어있습니다.", extra={"filename": self.filename})
                 return False
 
-            self.urls.update(loaded_urls)
-            logger.info("URL 로드 완료", extra={"count": len(loaded_urls), "filename": self.filename})
+            self.urls.update(sorted(loaded_urls))
+            logger.info("URL 로드 완료", extra={"count": len(self.urls), "filename": self.filename})
             return True
 
         except Exception as e:
@@ -41,11 +50,91 @@ class WebtoonListManager:
         except Exception as e:
             logger.error("웹툰 URL 저장 오류", error=e)
 
-    def collect_webtoon_urls(self, list_scraper) -> None:
-        """네이버 웹툰 요일별 페이지에서 모든 웹툰 URL을 수집"""
-        for page_url in list_scraper.NAVER_WEBTOON_URLS:
-            logger.info("웹툰 리스트 크롤링 시작", extra={"url": page_url})
-            webtoon_urls = list_scraper.get_webtoon_urls(page_url)
-            self.urls.update(webtoon_urls)
-        
-        self.save_urls_to_txt() 
\ No newline at end of file
+    def collect_webtoon_urls(self, list_scrapers, completed_page_limit: Optional[int] = None) -> None:
+        """네이버 웹툰 요일별 목록과 완결 목록에서 모든 웹툰 URL을 수집
+
+        목록 페이지를 스크래퍼(드라이버) 수만큼 동시에 수집하고, 완결 목록은 페이지 번호를 늘려가며
+        정상적으로 열렸지만 새 웹툰이 없는 페이지가 나올 때까지 COMPLETED_PAGE_WINDOW개씩 미리 요청한다.
+        실패한 페이지는 PAGE_ATTEMPTS번까지 다시 요청하고, 그래도 실패하면 마지막 페이지로 보지 않고 건너뛴다.
+        모든 수집이 끝난 뒤 한 번만 저장한다.
+
+        Args:
+            list_scrapers (WebtoonListScraper | List[WebtoonListScraper]): 세션마다 하나씩 사용할 목록 스크래퍼
+            completed_page_limit (int, optional): 완결 목록 최대 페이지 수
+        """
+        scrapers = list_scrapers if isinstance(list_scrapers, list) else [list_scrapers]
+        if not scrapers:
+            raise ValueError("목록 스크래퍼가 없습니다.")
+        completed_page_limit = completed_page_limit or self.COMPLETED_PAGE_LIMIT
+
+        # 드라이버는 스레드 간에 공유할 수 없으므로 작업마다 빈 스크래퍼를 하나씩 가져가 사용
+        idle_scrapers: Queue = Queue()
+        for scraper in scrapers:
+            idle_scrapers.put(scraper)
+
+        def fetch(page_url: str) -> List[str]:
+            scraper = idle_scrapers.get()
+            try:
+                logger.info("웹툰 리스트 크롤링 시작", extra={"url": page_url})
+                return scraper.get_webtoon_urls(page_url)
+            finally:
+                idle_scrapers.put(scraper)
+
+        template = scrapers[0].NAVER_COMPLETED_URL_TEMPLATE
+        before_count = len(self.urls)
+        failed_pages: List[str] = []
+        completed_failed_count = 0
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            # 작업별 (완결 목록 페이지 번호, 페이지 URL, 시도 횟수). 요일별 목록은 페이지 번호가 None
+            pending: Dict[Future, Tuple[Optional[int], str, int]] = {}
+
+            def submit(page: Optional[int], page_url: str, attempts: int = 1) -> None:
+                pending[executor.submit(fetch, page_url)] = (page, page_url, attempts)
+
+            for page_url in scrapers[0].NAVER_WEBTOON_URLS:
+                submit(None, page_url)
+            next_page = 1
+            last_page: Optional[int] = None
+            while next_page <= min(self.COMPLETED_PAGE_WINDOW, completed_page_limit):
+                submit(next_page, template.format(page=next_page))
+                next_page += 1
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page, page_url, attempts = pending.pop(future)
+                    try:
+                        page_urls = future.result()
+                    except Exception as e:
+                        if attempts < self.PAGE_ATTEMPTS:
+                            logger.warning("웹툰 리스트 페이지 다시 요청", extra={"url": page_url, "attempts": attempts})
+                            submit(page, page_url, attempts + 1)
+                            continue
+                        logger.error("웹툰 리스트 페이지를 건너뜁니다", error=e, extra={"url": page_url, "attempts": attempts})
+                        failed_pages.append(page_url)
+                        page_urls = None
+
+                    if page is None:
+                        if page_urls is not None:
+                            self.urls.update(page_urls)
+                        continue
+
+                    if page_urls is None:
+                        completed_failed_count += 1
+                    elif not self.urls.update(page_urls):
+                        # 정상적으로 열렸지만 새 웹툰이 없는 페이지를 마지막으로 보고 이후 페이지는 요청하지 않음
+                        last_page = page if last_page is None else min(last_page, page)
+                    if (last_page is None and next_page <= completed_page_limit
+                            and completed_failed_count < self.COMPLETED_FAILED_PAGE_LIMIT):
+                        submit(next_page, template.format(page=next_page))
+                        next_page += 1
+
+        if completed_failed_count >= self.COMPLETED_FAILED_PAGE_LIMIT and last_page is None:
+            logger.warning("완결 목록 페이지 실패가 많아 이후 페이지 수집을 중단했습니다.", extra={"next_page": next_page})
+        logger.info("웹툰 리스트 수집 완료", extra={
+            "new_count": len(self.urls) - before_count,
+            "total_count": len(self.urls),
+            "completed_pages": (last_page or next_page - 1),
+            "failed_pages": failed_pages
+        })
+        self.save_urls_to_txt()
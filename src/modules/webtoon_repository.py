@@ -2,6 +2,8 @@ import os
 import json
 from typing import List
 from utils.logger import logger
+from utils.stage_timer import stage_timer
+from modules.webtoon_url import get_external_id, get_record_key
 
 class WebtoonRepository:
     """웹툰 데이터를 JSON 파일로 저장하고 불러오는 클래스"""
@@ -21,12 +23,18 @@ class WebtoonRepository:
                 return []
         return []
 
+    @stage_timer.timed("repository.append_success")
     def append_success(self, data_list: List[dict]) -> None:
         """성공한 데이터를 JSON 파일에 추가"""
         try:
             existing_data = self.load_existing_data(self.success_filename)
-            existing_ids = {item['external_id'] for item in existing_data}
-            new_data = [item for item in data_list if item['external_id'] not in existing_ids]
+            existing_ids = {get_record_key(item) for item in existing_data}
+            new_data = []
+            for item in data_list:
+                key = get_record_key(item)
+                if key not in existing_ids:
+                    existing_ids.add(key)
+                    new_data.append(item)
             
             if new_data:
                 existing_data.extend(new_data)
@@ -41,13 +49,20 @@ class WebtoonRepository:
                 logger.info("성공 데이터 추가 완료", extra={"count": len(new_data)})
         except Exception as e:
             logger.error("성공 데이터 저장 실패", error=e)
+            raise
 
+    @stage_timer.timed("repository.append_failure")
     def append_failure(self, data_list: List[dict]) -> None:
         """실패한 데이터를 JSON 파일에 추가"""
         try:
             existing_data = self.load_existing_data(self.failure_filename)
-            existing_urls = {item['url'] for item in existing_data}
-            new_data = [item for item in data_list if item['url'] not in existing_urls]
+            existing_ids = {get_external_id(item['url']) for item in existing_data}
+            new_data = []
+            for item in data_list:
+                key = get_external_id(item['url'])
+                if key not in existing_ids:
+                    existing_ids.add(key)
+                    new_data.append(item)
             
             if new_data:
                 existing_data.extend(new_data)
@@ -62,3 +77,4 @@ class WebtoonRepository:
                 logger.info("실패 데이터 추가 완료", extra={"count": len(new_data)})
         except Exception as e:
             logger.error("실패 데이터 저장 실패", error=e)
+            raise
@@ -0,0 +1,116 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+# 호스트별 플랫폼 이름과 정규 목록 URL
+PLATFORM_HOSTS: Dict[str, str] = {
+    "comic.naver.com": "naver",
+    "m.comic.naver.com": "naver",
+}
+CANONICAL_URL_TEMPLATES: Dict[str, str] = {
+    "naver": "https://comic.naver.com/webtoon/list?titleId={title_id}",
+}
+# 플랫폼별로 titleId를 웹툰 키로 사용하는 경로. 도전만화(/challenge/, /bestChallenge/)는 같은 titleId라도
+# 다른 작품이므로 정규 목록 URL로 바꾸지 않고 URL 자체를 키로 사용
+TITLE_PATH_PREFIXES: Dict[str, str] = {
+    "naver": "/webtoon/",
+}
+TITLE_ID_PATTERN = re.compile(r'[?&]titleId=(\d+)')
+
+@dataclass(frozen=True)
+class TitleKey:
+    """웹툰 하나를 가리키는 키 (플랫폼, 작품 ID)
+
+    같은 웹툰의 URL은 tab=, page=, sort= 파라미터나 http/https 여부와 관계없이 같은 키를 가진다.
+    titleId를 찾을 수 없거나 TITLE_PATH_PREFIXES 밖의 경로인 URL은 플랫폼을 "url"로 두고
+    정규화한 URL 자체를 title_id로 사용한다 (정규 목록 URL로 바꾸지 않음).
+    """
+    platform: str
+    title_id: str
+
+    def __str__(self) -> str:
+        return f"{self.platform}:{self.title_id}"
+
+def _normalize_url(url: str) -> str:
+    """titleId가 없는 URL의 정규화 (https 사용, 호스트 소문자, 프래그먼트 제거)"""
+    parts = urlsplit(url.strip())
+    scheme = "https" if parts.scheme in ("http", "https", "") else parts.scheme
+    return urlunsplit((scheme, parts.netloc.lower(), parts.path, parts.query, ""))
+
+def get_platform(url: str) -> Optional[str]:
+    """URL 호스트로 플랫폼 이름을 반환. 알 수 없는 호스트면 None"""
+    return PLATFORM_HOSTS.get(urlsplit((url or "").strip()).netloc.lower())
+
+def get_record_platform(url: str) -> str:
+    """저장소 레코드에서 사용하는 플랫폼 이름 (Platform 이름, 예: NAVER). 알 수 없는 호스트면 빈 문자열"""
+    return (get_platform(url) or "").upper()
+
+def get_title_key(url: str) -> TitleKey:
+    """URL을 웹툰 키로 변환"""
+    url = (url or "").strip()
+    platform = get_platform(url)
+    id_match = TITLE_ID_PATTERN.search(url)
+    if platform and id_match and urlsplit(url).path.startswith(TITLE_PATH_PREFIXES[platform]):
+        return TitleKey(platform, id_match.group(1))
+    return TitleKey("url", _normalize_url(url))
+
+def canonicalize_url(url: str) -> str:
+    """같은 웹툰의 URL 변형을 하나의 정규 URL로 변환
+
+    예: http://comic.naver.com/webtoon/list?tab=mon&titleId=1&page=1&sort=ASC
+        -> https://comic.naver.com/webtoon/list?titleId=1
+    """
+    key = get_title_key(url)
+    template = CANONICAL_URL_TEMPLATES.get(key.platform)
+    return template.format(title_id=key.title_id) if template else key.title_id
+
+def get_external_id(url: str) -> str:
+    """저장소와 지문 저장소에서 사용하는 ID (titleId, 없으면 정규화한 URL)"""
+    return get_title_key(url).title_id
+
+def get_record_key(record: dict) -> str:
+    """수집 결과 레코드의 중복 판단 키. external_id가 없으면 link/url에서 계산"""
+    if record.get("external_id"):
+        return str(record["external_id"])
+    return get_external_id(record.get("link") or record.get("url") or "")
+
+class TitleIndex:
+    """웹툰 키로 URL을 관리하는 인덱스
+
+    URL 변형이 섞여 들어와도 웹툰당 정규 URL 하나만 보관하며, 포함 여부 확인과 추가는 O(1)이다.
+    반복하면 정규 URL을 추가된 순서대로 반환한다. 스레드 간 공유 시에는 호출하는 쪽에서 잠금이 필요하다.
+    """
+
+    def __init__(self, urls: Optional[Iterable[str]] = None):
+        self._urls: Dict[TitleKey, str] = {}
+        if urls:
+            self.update(urls)
+
+    def add(self, url: str) -> bool:
+        """URL을 추가하고 처음 보는 웹툰이면 True"""
+        key = get_title_key(url)
+        if key in self._urls:
+            return False
+        self._urls[key] = canonicalize_url(url)
+        return True
+
+    def update(self, urls: Iterable[str]) -> int:
+        """여러 URL을 추가하고 새로 추가된 웹툰 수를 반환"""
+        return sum(1 for url in urls if self.add(url))
+
+    def discard(self, url: str) -> None:
+        self._urls.pop(get_title_key(url), None)
+
+    def get(self, url: str) -> Optional[str]:
+        """같은 웹툰의 정규 URL. 없으면 None"""
+        return self._urls.get(get_title_key(url))
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and get_title_key(url) in self._urls
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._urls.values()))
+
+    def __len__(self) -> int:
+        return len(self._urls)
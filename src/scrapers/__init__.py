@@ -1,12 +1,16 @@
 from .webtoon_scraper_factory import WebtoonScraperFactory
 from .webtoon_scraper_builder import WebtoonScraperBuilder
-from .common import IWebtoonScraper, WebtoonListScraper
-from .platforms import NaverWebtoonScraper
+from .common import IWebtoonScraper, IEpisodeScraper, WebtoonListScraper
+from .platforms import NaverWebtoonScraper, NaverWebtoonHttpScraper, NaverEpisodeScraper, NaverEpisodeHttpScraper
 
 __all__ = [
     'WebtoonScraperFactory',
     'WebtoonScraperBuilder',
     'IWebtoonScraper',
+    'IEpisodeScraper',
     'WebtoonListScraper',
-    'NaverWebtoonScraper'
+    'NaverWebtoonScraper',
+    'NaverWebtoonHttpScraper',
+    'NaverEpisodeScraper',
+    'NaverEpisodeHttpScraper'
 ] 
\ No newline at end of file
@@ -1,4 +1,5 @@
 from .i_webtoon_scraper import IWebtoonScraper
+from .i_episode_scraper import IEpisodeScraper
 from .webtoon_list_scraper import WebtoonListScraper
 
-__all__ = ['IWebtoonScraper', 'WebtoonListScraper'] 
\ No newline at end of file
+__all__ = ['IWebtoonScraper', 'IEpisodeScraper', 'WebtoonListScraper'] 
\ No newline at end of file
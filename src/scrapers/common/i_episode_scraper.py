@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from models.episode import EpisodeDTO
+from models.enums import FailureType, Platform
+
+class IEpisodeScraper(ABC):
+    """웹툰 회차 목록 스크래퍼 인터페이스
+
+    회차 목록은 최신 회차부터(내림차순) 한 페이지씩 반환한다.
+    어디까지 읽을지는 크롤러가 저장된 마지막 회차 번호와 비교하여 결정한다.
+    """
+
+    PLATFORM_NAME: Platform
+
+    # 마지막 fetch가 실패한 원인
+    last_failure: Optional[FailureType] = None
+
+    def set_driver(self, driver) -> None:
+        """세션이 재시작되어 드라이버가 바뀌었을 때 호출"""
+        self.driver = driver
+
+    @abstractmethod
+    def fetch_episode_page(self, url: str, page: int) -> Tuple[bool, List[EpisodeDTO], bool]:
+        """회차 목록의 page번째 페이지(1부터)를 최신 회차부터 가져옴
+
+        Returns:
+            (성공 여부, 회차 목록, 다음 페이지 존재 여부)
+        """
+        pass
@@ -1,11 +1,33 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple
 from models.webtoon import WebtoonDTO
+from models.enums import FailureType
 
 class IWebtoonScraper(ABC):
     """웹툰 스크래퍼 인터페이스"""
 
+    # 마지막 fetch가 실패한 원인 (크롤러의 재시도 판단과 호스트별 속도 조절에 사용)
+    last_failure: Optional[FailureType] = None
+
+    def set_driver(self, driver) -> None:
+        """세션이 재시작되어 드라이버가 바뀌었을 때 호출"""
+        self.driver = driver
+
     @abstractmethod
     def fetch_webtoon(self, url: str) -> Tuple[bool, Optional[WebtoonDTO]]:
         """웹툰 정보를 가져와 WebtoonDTO 객체로 반환"""
-        pass 
\ No newline at end of file
+        pass
+
+    def fetch_webtoon_if_changed(
+        self,
+        url: str,
+        known_fingerprint: Optional[str] = None
+    ) -> Tuple[bool, Optional[WebtoonDTO], Optional[str]]:
+        """페이지 지문이 known_fingerprint와 같으면 전체 수집을 건너뛰는 메서드
+
+        Returns:
+            (성공 여부, WebtoonDTO 또는 변경이 없으면 None, 현재 지문)
+            지문을 지원하지 않는 스크래퍼는 항상 전체 수집 후 지문 None을 반환
+        """
+        success, webtoon_data = self.fetch_webtoon(url)
+        return success, webtoon_data, None
@@ -1,17 +1,62 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from typing import List, Optional
 from utils.logger import logger
-from time import sleep
 
 class WebtoonListScraper:
     """웹툰 리스트 페이지에서 웹툰 URL을 수집하는 스크래퍼"""
 
     WAITING_LOAD_PAGE = 5
-    SCROLL_SLEEP_TIME = 2 
+    SCROLL_IDLE_TIMEOUT = 2  # 스크롤 후 새 항목이 이 시간(초) 동안 추가되지 않으면 마지막으로 판단
     SCROLL_LIMIT = 30
 
+    # 요일별 연재 목록과 페이지 단위 완결 목록
+    NAVER_WEBTOON_URLS = [
+        f"https://comic.naver.com/webtoon?tab={tab}"
+        for tab in ("mon", "tue", "wed", "thu", "fri", "sat", "sun", "dailyPlus")
+    ]
+    NAVER_COMPLETED_URL_TEMPLATE = "https://comic.naver.com/webtoon?tab=finish&page={page}"
+
+    CONTENT_LIST_CLASS = "ContentList__content_list--q5KXY"
+    ITEM_CLASS = "item"
+    LINK_CLASS = "Poster__link--sopnC"
+
+    # start 이후에 추가된 항목의 링크만 한 번에 읽는 스크립트
+    COLLECT_LINKS_SCRIPT = """
+        const [itemClass, linkClass, start] = arguments;
+        const items = document.getElementsByClassName(itemClass);
+        const hrefs = [];
+        for (let i = start; i < items.length; i++) {
+            const link = items[i].getElementsByClassName(linkClass)[0];
+            hrefs.push(link ? link.getAttribute('href') : null);
+        }
+        return {count: items.length, hrefs: hrefs};
+    """
+
+    # 맨 아래로 스크롤한 뒤 항목 수가 늘어나거나 제한 시간이 지나면 현재 항목 수를 반환하는 스크립트
+    SCROLL_AND_WAIT_SCRIPT = """
+        const [itemClass, previousCount, timeoutMs, done] = arguments;
+        const items = document.getElementsByClassName(itemClass);
+        let finished = false;
+        let observer = null;
+        let timer = null;
+        const finish = () => {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            done(items.length);
+        };
+        observer = new MutationObserver(() => { if (items.length > previousCount) finish(); });
+        observer.observe(document.body, {childList: true, subtree: true});
+        timer = setTimeout(finish, timeoutMs);
+        window.scrollTo(0, document.body.scrollHeight);
+        if (items.length > previousCount) finish();
+    """
+
     def __init__(self, driver):
         self.driver = driver
 
@@ -25,56 +70,70 @@ class WebtoonListScraper:
         new_url = parsed_url._replace(query=new_query)
         return urlunparse(new_url)
 
+    def _to_webtoon_url(self, href: str) -> str:
+        full_url = f"https://comic.naver.com{href}" if href.startswith("/") else href
+        return self.remove_tab_param(full_url)
+
+    def _collect_new_links(self, start: int, webtoon_urls: List[str], seen: set) -> int:
+        """start 이후의 새 항목에서 링크를 추출하고 현재 항목 수를 반환"""
+        result = self.driver.execute_script(self.COLLECT_LINKS_SCRIPT, self.ITEM_CLASS, self.LINK_CLASS, start)
+        for href in result["hrefs"]:
+            if href and "/webtoon/list" in href:
+                full_url = self._to_webtoon_url(href)
+                if full_url not in seen:
+                    seen.add(full_url)
+                    webtoon_urls.append(full_url)
+        return result["count"]
+
     def get_webtoon_urls(self, url: str) -> list:
-        """웹툰 리스트 페이지에서 중복 없이 웹툰 URL들을 추출한다."""
-        webtoon_urls = set()
+        """웹툰 리스트 페이지에서 중복 없이 웹툰 URL들을 추출한다.
+
+        고정 시간 대기 대신 스크롤 후 항목이 DOM에 추가되는 시점(MutationObserver)까지만 기다리고,
+        새로 추가된 항목만 한 번의 스크립트 호출로 읽는다.
+
+        빈 목록은 페이지가 정상적으로 열렸지만 항목이 없는 경우에만 반환한다.
+        페이지 로드 시간 초과나 오류는 일부만 수집한 목록 대신 예외를 그대로 전달한다.
+        """
+        webtoon_urls: List[str] = []
+        seen = set()
+        # 드라이버는 크롤러의 세션 풀과 공유되므로 변경한 스크립트 제한 시간은 끝나면 되돌림
+        previous_script_timeout: Optional[float] = None
 
         try:
-            logger.log("info", f"페이지 열기: {url}")
+            logger.info("페이지 열기", extra={"url": url})
             self.driver.get(url)
 
             WebDriverWait(self.driver, self.WAITING_LOAD_PAGE).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "ContentList__content_list--q5KXY"))
+                EC.presence_of_element_located((By.CLASS_NAME, self.CONTENT_LIST_CLASS))
             )
-
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            scroll_count = 0
-
-            while True:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                sleep(self.SCROLL_SLEEP_TIME)
-
-                webtoon_elements = self.driver.find_elements(By.CLASS_NAME, "item")
-                previous_count = len(webtoon_urls)
-
-                for element in webtoon_elements:
-                    try:
-                        link_element = element.find_element(By.XPATH, ".//a[contains(@class, 'Poster__link--sopnC')]")
-                        relative_url = link_element.get_attribute("href")
-                        if relative_url and "/webtoon/list" in relative_url:
-                            full_url = self.remove_tab_param(f"https://comic.naver.com{relative_url}" if relative_url.startswith("/") else relative_url)
-                            webtoon_urls.add(full_url)
-                    except Exception as e:
-                        logger.log("warning", f"웹툰 링크 추출 오류: {e}")
-
-                if len(webtoon_urls) == previous_count:
-                    logger.log("info", "더 이상 새로운 웹툰 없음, 종료")
-                    break
-
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    logger.log("info", "마지막 페이지 도달")
-                    break
-
-                last_height = new_height
-                scroll_count += 1
-                if scroll_count >= self.SCROLL_LIMIT:
-                    logger.log("info", "스크롤 제한에 도달, 종료")
+            previous_script_timeout = self.driver.timeouts.script
+            self.driver.set_script_timeout(self.SCROLL_IDLE_TIMEOUT + self.WAITING_LOAD_PAGE)
+
+            item_count = self._collect_new_links(0, webtoon_urls, seen)
+            for _ in range(self.SCROLL_LIMIT):
+                new_count = self.driver.execute_async_script(
+                    self.SCROLL_AND_WAIT_SCRIPT,
+                    self.ITEM_CLASS,
+                    item_count,
+                    int(self.SCROLL_IDLE_TIMEOUT * 1000)
+                )
+                if new_count <= item_count:
+                    logger.info("더 이상 새로운 웹툰 없음, 종료", extra={"url": url})
                     break
+                item_count = self._collect_new_links(item_count, webtoon_urls, seen)
+            else:
+                logger.info("스크롤 제한에 도달, 종료", extra={"url": url})
 
-            logger.log("info", f"총 {len(webtoon_urls)}개의 웹툰 URL을 수집함")
+            logger.info("웹툰 URL 수집 완료", extra={"url": url, "count": len(webtoon_urls)})
 
+        except TimeoutException:
+            logger.warning("웹툰 리스트 로드 시간 초과", extra={"url": url})
+            raise
         except Exception as e:
-            logger.log("error", f"웹툰 리스트 수집 오류: {e}")
+            logger.error("웹툰 리스트 수집 오류", error=e, extra={"url": url})
+            raise
+        finally:
+            if previous_script_timeout is not None:
+                self.driver.set_script_timeout(previous_script_timeout)
 
-        return list(webtoon_urls)
\ No newline at end of file
+        return webtoon_urls
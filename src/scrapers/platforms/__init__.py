@@ -1,3 +1,6 @@
 from .naver_webtoon_scraper import NaverWebtoonScraper
+from .naver_webtoon_http_scraper import NaverWebtoonHttpScraper
+from .naver_episode_scraper import NaverEpisodeScraper
+from .naver_episode_http_scraper import NaverEpisodeHttpScraper
 
-__all__ = ['NaverWebtoonScraper'] 
\ No newline at end of file
+__all__ = ['NaverWebtoonScraper', 'NaverWebtoonHttpScraper', 'NaverEpisodeScraper', 'NaverEpisodeHttpScraper']
\ No newline at end of file
@@ -0,0 +1,57 @@
+import requests
+from typing import Any, Dict, List, Optional, Tuple
+from models.episode import EpisodeDTO
+from models.enums import Platform
+from modules.webtoon_url import get_title_key
+from utils.logger import logger
+from utils.stage_timer import stage_timer
+from scrapers.common import IEpisodeScraper
+from scrapers.platforms.naver_webtoon_http_scraper import NaverWebtoonHttpScraper
+
+class NaverEpisodeHttpScraper(IEpisodeScraper):
+    """네이버 웹툰 회차 목록을 브라우저 없이 회차 목록 API로 수집하는 클래스
+
+    HTTP 세션, 응답 처리, 실패 분류는 NaverWebtoonHttpScraper와 같은 방식을 사용한다.
+    """
+
+    PLATFORM_NAME = Platform.NAVER
+
+    def __init__(self, driver=None, session: Optional[requests.Session] = None):
+        """
+        Args:
+            driver (WebDriver, optional): 사용하지 않음 (다른 회차 스크래퍼와 생성 방식을 맞추기 위한 인자)
+            session (requests.Session, optional): 재사용할 HTTP 세션
+        """
+        self.driver = driver
+        self.api = NaverWebtoonHttpScraper(session=session)
+
+    def parse_episode(self, title_id: str, article: Dict[str, Any]) -> EpisodeDTO:
+        """회차 목록 API 항목을 EpisodeDTO로 변환"""
+        try:
+            published_date = self.api.format_date(article["serviceDateDescription"].strip())
+        except (KeyError, AttributeError, ValueError):
+            published_date = None
+        return EpisodeDTO(
+            platform=self.PLATFORM_NAME.name,
+            external_id=title_id,
+            episode_no=int(article["no"]),
+            title=(article.get("subtitle") or "").strip(),
+            thumbnail_url=article.get("thumbnailUrl"),
+            published_date=published_date
+        )
+
+    @stage_timer.timed("naver_episode_http.fetch_page")
+    def fetch_episode_page(self, url: str, page: int) -> Tuple[bool, List[EpisodeDTO], bool]:
+        """회차 목록 API로 최신 회차부터 한 페이지를 수집"""
+        self.last_failure = None
+        try:
+            title_id = get_title_key(url).title_id
+            article_list = self.api.get_article_list(title_id, sort="DESC", page=page)
+            episodes = [self.parse_episode(title_id, article) for article in article_list["articleList"]]
+            total_pages = (article_list.get("pageInfo") or {}).get("totalPages")
+            has_next = page < int(total_pages) if total_pages is not None else bool(episodes)
+            return True, episodes, has_next
+        except (requests.RequestException, KeyError, TypeError, ValueError, AttributeError) as e:
+            self.last_failure = self.api.classify_failure(e)
+            logger.error("회차 목록 HTTP 크롤링 오류", error=e, extra={"url": url, "page": page})
+            return False, [], False
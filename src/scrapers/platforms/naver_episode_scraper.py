@@ -0,0 +1,136 @@
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from models.episode import EpisodeDTO
+from models.enums import Platform, FailureType
+from modules.webtoon_url import canonicalize_url, get_title_key
+from utils.logger import logger
+from utils.stage_timer import stage_timer
+from scrapers.common import IEpisodeScraper
+from scrapers.platforms.naver_webtoon_scraper import NaverWebtoonScraper
+
+class NaverEpisodeScraper(IEpisodeScraper):
+    """네이버 웹툰 회차 목록을 Selenium으로 수집하는 클래스"""
+
+    PLATFORM_NAME = Platform.NAVER
+
+    # 회차 목록 한 페이지의 회차 수
+    PAGE_SIZE = 20
+    PAGE_READY_CLASS = NaverWebtoonScraper.PAGE_READY_CLASS
+    EPISODE_ITEM_CLASS = NaverWebtoonScraper.EPISODE_ITEM_CLASS
+    EPISODE_TITLE_CLASS = "EpisodeListList__title--lfIzU"
+    WAITING_LOAD_PAGE = NaverWebtoonScraper.WAITING_LOAD_PAGE
+    # 페이지 준비 이후 회차 목록이 그려지기를 추가로 기다릴 시간(초).
+    # 두 번째 이후 페이지는 이 시간 뒤 빈 목록으로 처리하고, 첫 페이지는 선택자 불일치로 처리
+    EPISODE_ITEM_TIMEOUT = NaverWebtoonScraper.FIELD_TIMEOUTS["episode_item"]
+
+    # 현재 페이지의 회차 항목을 한 번에 읽는 스크립트
+    EXTRACT_EPISODES_SCRIPT = """
+        const itemClass = arguments[0];
+        const titleClass = arguments[1];
+        return Array.from(document.getElementsByClassName(itemClass)).map((item) => {
+            const link = item.getElementsByTagName('a')[0];
+            const img = item.getElementsByTagName('img')[0];
+            const title = item.getElementsByClassName(titleClass)[0];
+            const date = item.getElementsByClassName('date')[0];
+            return {
+                href: link ? link.href : null,
+                title: title ? title.innerText : (img ? img.alt : null),
+                thumbnail: img ? img.src : null,
+                date: date ? date.innerText : null
+            };
+        });
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def get_page_url(self, url: str, page: int) -> str:
+        return f"{canonicalize_url(url)}&page={page}&sort=DESC"
+
+    @stage_timer.timed("naver_episode.wait")
+    def wait_for_episode_items(self, page: int) -> None:
+        """페이지 준비 후 회차 항목이 그려질 때까지 잠시 대기
+
+        회차가 하나도 없는 웹툰은 없으므로 첫 페이지에 항목이 없으면 회차 항목 선택자가 바뀐 것으로 보고
+        NoSuchElementException을 발생시킨다. 이후 페이지는 빈 목록으로 처리한다.
+        """
+        WebDriverWait(self.driver, self.WAITING_LOAD_PAGE).until(
+            EC.presence_of_element_located((By.CLASS_NAME, self.PAGE_READY_CLASS))
+        )
+        try:
+            WebDriverWait(self.driver, self.EPISODE_ITEM_TIMEOUT).until(
+                EC.presence_of_element_located((By.CLASS_NAME, self.EPISODE_ITEM_CLASS))
+            )
+        except TimeoutException:
+            if page == 1:
+                raise NoSuchElementException(f"회차 항목을 찾을 수 없습니다: {self.EPISODE_ITEM_CLASS}")
+
+    def parse_episode(self, title_id: str, raw: Dict[str, Any]) -> Optional[EpisodeDTO]:
+        """회차 항목을 EpisodeDTO로 변환. 회차 번호를 알 수 없으면 None"""
+        no_match = re.search(r'[?&]no=(\d+)', raw.get("href") or "")
+        if not no_match:
+            return None
+        return EpisodeDTO(
+            platform=self.PLATFORM_NAME.name,
+            external_id=title_id,
+            episode_no=int(no_match.group(1)),
+            title=(raw.get("title") or "").strip(),
+            thumbnail_url=raw.get("thumbnail"),
+            published_date=self.parse_date(raw.get("date"))
+        )
+
+    def parse_date(self, date_str: Optional[str]) -> Optional[str]:
+        """'24.05.13' 형식의 날짜를 ISO 형식으로 변환. 다른 형식이면 None"""
+        try:
+            return datetime.strptime((date_str or "").strip(), "%y.%m.%d").date().isoformat()
+        except ValueError:
+            return None
+
+    def fetch_episode_page(self, url: str, page: int) -> Tuple[bool, List[EpisodeDTO], bool]:
+        """회차 목록 페이지에 접속하여 최신 회차부터 한 페이지를 수집"""
+        self.last_failure = None
+        page_url = self.get_page_url(url, page)
+        try:
+            with stage_timer.measure("naver_episode.navigate"):
+                self.driver.get(page_url)
+
+            if "nid.naver.com" in self.driver.current_url:
+                logger.warning("성인 인증이 필요한 웹툰", extra={"url": page_url})
+                self.last_failure = FailureType.LOGIN_REDIRECT
+                return False, [], False
+
+            self.wait_for_episode_items(page)
+            with stage_timer.measure("naver_episode.extract"):
+                raw_items = self.driver.execute_script(
+                    self.EXTRACT_EPISODES_SCRIPT, self.EPISODE_ITEM_CLASS, self.EPISODE_TITLE_CLASS
+                ) or []
+
+            title_id = get_title_key(url).title_id
+            episodes = [episode for episode in (self.parse_episode(title_id, raw) for raw in raw_items) if episode]
+            return True, episodes, len(raw_items) >= self.PAGE_SIZE
+
+        except TimeoutException:
+            if "nid.naver.com" in self.driver.current_url:
+                logger.warning("성인 인증이 필요한 웹툰 (Timeout 발생)", extra={"url": page_url})
+                self.last_failure = FailureType.LOGIN_REDIRECT
+                return False, [], False
+            logger.error("회차 목록 크롤링 오류 (TimeoutException)", extra={"url": page_url})
+            self.last_failure = FailureType.TIMEOUT
+            return False, [], False
+        except NoSuchElementException as e:
+            logger.error("회차 목록 크롤링 오류 (페이지 요소 없음)", error=e, extra={"url": page_url})
+            self.last_failure = FailureType.SELECTOR_MISS
+            return False, [], False
+        except WebDriverException as e:
+            logger.error("회차 목록 크롤링 오류 (WebDriver)", error=e, extra={"url": page_url})
+            self.last_failure = FailureType.DRIVER_CRASH
+            return False, [], False
+        except Exception as e:
+            logger.error("회차 목록 크롤링 오류", error=e, extra={"url": page_url})
+            self.last_failure = FailureType.UNKNOWN
+            return False, [], False
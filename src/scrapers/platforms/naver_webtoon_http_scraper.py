@@ -0,0 +1,315 @@
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from models.webtoon import WebtoonDTO
+from models.author import AuthorDTO
+from models.enums import SerializationStatus, Platform, AgeRating, DayOfWeek, AuthorRole, FailureType
+from utils.logger import logger
+from utils.stage_timer import stage_timer
+from scrapers.common import IWebtoonScraper
+from scrapers.platforms.naver_webtoon_scraper import NaverWebtoonScraper
+
+class NaverWebtoonHttpScraper(IWebtoonScraper):
+    """네이버 웹툰 정보를 브라우저 없이 HTTP 요청으로 수집하는 클래스
+
+    타이틀 페이지는 클라이언트 렌더링 페이지이며, 화면에 표시되는 값은 모두
+    페이지가 호출하는 JSON API에서 온다. 이 스크래퍼는 해당 API를 직접 호출하고,
+    해석할 수 없는 응답을 받으면 Selenium 스크래퍼로 대체 수집한다.
+    """
+
+    PLATFORM_NAME = Platform.NAVER
+
+    BASE_URL = "https://comic.naver.com"
+    INFO_API_URL = f"{BASE_URL}/api/article/list/info"
+    ARTICLE_LIST_API_URL = f"{BASE_URL}/api/article/list"
+    REQUEST_TIMEOUT = 5
+    CONNECTION_POOL_SIZE = 10
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36",
+        "Referer": f"{BASE_URL}/",
+        "Accept": "application/json"
+    }
+
+    AGE_RATING_MAP = {
+        "전체연령가": AgeRating.ALL,
+        "12세": AgeRating.AGE_12,
+        "15세": AgeRating.AGE_15,
+        "18세": AgeRating.ADULT,
+        "19세": AgeRating.ADULT
+    }
+    ARTIST_TYPE_MAP = {
+        "ARTIST_WRITER": AuthorRole.WRITER,
+        "ARTIST_PAINTER": AuthorRole.ARTIST,
+        "ARTIST_NOVEL_ORIGIN": AuthorRole.ORIGINAL
+    }
+
+    def __init__(self, driver=None, session: Optional[requests.Session] = None):
+        """
+        Args:
+            driver (WebDriver, optional): 대체 수집에 사용할 WebDriver. 없으면 대체 수집을 하지 않음
+            session (requests.Session, optional): 재사용할 HTTP 세션
+        """
+        self.driver = driver
+        self.session = session or self._create_session()
+        self._fallback_scraper: Optional[NaverWebtoonScraper] = None
+        # 스크래핑 옵션 초기화
+        self.scrape_title = False
+        self.scrape_thumbnail = False
+        self.scrape_story = False
+        self.scrape_day_age = False
+        self.scrape_day = False
+        self.scrape_status = False
+        self.scrape_genres = False
+        self.scrape_authors = False
+        self.scrape_unique_id = False
+        self.scrape_episode_count = False
+        self.scrape_dates = False
+
+    def _create_session(self) -> requests.Session:
+        """커넥션 풀을 사용하는 HTTP 세션 생성"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.CONNECTION_POOL_SIZE,
+            pool_maxsize=self.CONNECTION_POOL_SIZE
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.HEADERS)
+        return session
+
+    @stage_timer.timed("naver_http.request")
+    def _get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON API 호출. 응답 코드가 200이 아니면 HTTPError 발생"""
+        response = self.session.get(url, params=params, timeout=self.REQUEST_TIMEOUT, allow_redirects=False)
+        response.raise_for_status()
+        if response.status_code != 200:
+            # 성인 인증 등으로 로그인 페이지로 리다이렉트되는 경우
+            raise requests.HTTPError(f"예상하지 못한 응답 코드: {response.status_code}", response=response)
+        return response.json()
+
+    def _get_fallback_scraper(self) -> Optional[NaverWebtoonScraper]:
+        """같은 수집 옵션을 가진 Selenium 스크래퍼를 지연 생성"""
+        if self.driver is None:
+            return None
+        if self._fallback_scraper is None:
+            scraper = NaverWebtoonScraper(self.driver)
+            for option, value in vars(self).items():
+                if option.startswith("scrape_") or option == "extraction_mode":
+                    setattr(scraper, option, value)
+            self._fallback_scraper = scraper
+        return self._fallback_scraper
+
+    def set_driver(self, driver) -> None:
+        """대체 수집용 Selenium 스크래퍼도 새 드라이버를 사용하도록 함께 변경"""
+        self.driver = driver
+        if self._fallback_scraper is not None:
+            self._fallback_scraper.set_driver(driver)
+
+    def get_unique_id(self, url: str) -> Optional[str]:
+        """URL에서 웹툰의 고유 ID를 추출하는 메서드"""
+        id_match = re.search(r'titleId=(\d+)', url)
+        return id_match.group(1) if id_match else None
+
+    def parse_age_rating(self, info: Dict[str, Any]) -> Optional[str]:
+        """연령 등급 파싱"""
+        age = info.get("age") or {}
+        text = f"{age.get('description') or ''} {age.get('type') or ''}"
+        age_match = re.search(r'(전체연령가|12세|15세|18세|19세)', text)
+        if age_match:
+            return self.AGE_RATING_MAP[age_match.group(1)].name
+        type_match = re.search(r'(ALL|\d+)$', age.get("type") or "")
+        if type_match:
+            value = type_match.group(1)
+            if value in ("ALL", "0"):
+                return AgeRating.ALL.name
+            return self.AGE_RATING_MAP.get(f"{value}세", AgeRating.ADULT).name
+        return None
+
+    def parse_day(self, info: Dict[str, Any]) -> Optional[str]:
+        """연재 요일 파싱"""
+        for day in info.get("publishDayOfWeekList") or []:
+            if day in DayOfWeek.__members__:
+                return DayOfWeek[day].name
+        return None
+
+    def parse_status(self, info: Dict[str, Any]) -> str:
+        """연재 상태 파싱"""
+        if info.get("rest"):
+            return SerializationStatus.HIATUS.name
+        if info.get("finished"):
+            return SerializationStatus.COMPLETED.name
+        return SerializationStatus.ONGOING.name
+
+    def parse_genres(self, info: Dict[str, Any]) -> List[str]:
+        """장르(큐레이션 태그) 파싱"""
+        return [
+            tag["tagName"].strip().replace('#', '')
+            for tag in info.get("curationTagList") or []
+            if tag.get("tagName", "").strip()
+        ]
+
+    def parse_authors(self, info: Dict[str, Any]) -> List[AuthorDTO]:
+        """저자 정보 파싱"""
+        authors = []
+        for artist in info.get("communityArtists") or []:
+            href = artist.get("profilePageUrl") or ""
+            author_id_match = re.search(r'u/([^?]+)', href) or re.search(r'id=(\d+)', href)
+            author_id = author_id_match.group(1) if author_id_match else str(artist["artistId"])
+
+            roles = [self.ARTIST_TYPE_MAP[t] for t in artist.get("artistTypeList") or [] if t in self.ARTIST_TYPE_MAP]
+            if AuthorRole.WRITER in roles and AuthorRole.ARTIST in roles:
+                roles = [AuthorRole.BOTH] + [role for role in roles if role not in (AuthorRole.WRITER, AuthorRole.ARTIST)]
+            if not roles:
+                logger.warning("알 수 없는 역할", extra={"role": artist.get("artistTypeList")})
+                continue
+
+            for role in dict.fromkeys(roles):
+                authors.append(AuthorDTO(author_id, artist["name"].strip(), role.name))
+        return authors
+
+    def get_article_list(self, title_id: str, sort: str = "DESC", page: int = 1) -> Dict[str, Any]:
+        """회차 목록 조회 (기본값은 최신 회차부터 첫 페이지)"""
+        return self._get_json(self.ARTICLE_LIST_API_URL, {"titleId": title_id, "page": page, "sort": sort})
+
+    def get_first_article_date(self, article_list: Dict[str, Any]) -> Optional[str]:
+        """회차 목록 첫 항목의 날짜를 ISO 형식으로 반환"""
+        try:
+            date_text = article_list["articleList"][0]["serviceDateDescription"].strip()
+            return self.format_date(date_text)
+        except (KeyError, IndexError, ValueError) as e:
+            logger.warning("회차 날짜 추출 오류", extra={"error": str(e)})
+            return None
+
+    def format_date(self, date_str: str) -> str:
+        return datetime.strptime(date_str, "%y.%m.%d").date().isoformat()
+
+    def compute_fingerprint(self, info: Dict[str, Any], article_list: Dict[str, Any]) -> str:
+        """info API 응답과 회차 수로 지문 계산 (Selenium 스크래퍼와 같은 정규화된 필드 사용)"""
+        total_count = article_list.get("totalCount")
+        return NaverWebtoonScraper.build_fingerprint({
+            "title": info["titleName"].strip(),
+            "day_of_week": self.parse_day(info),
+            "age_rating": self.parse_age_rating(info),
+            "serialization_status": self.parse_status(info),
+            "episode_count": int(total_count) if total_count is not None else None,
+        })
+
+    def _get_title_id(self, url: str) -> str:
+        title_id = self.get_unique_id(url)
+        if not title_id:
+            raise ValueError(f"titleId를 찾을 수 없습니다: {url}")
+        return title_id
+
+    @stage_timer.timed("naver_http.build")
+    def _build_webtoon(
+        self,
+        url: str,
+        info: Optional[Dict[str, Any]] = None,
+        article_list: Optional[Dict[str, Any]] = None
+    ) -> WebtoonDTO:
+        """API 응답으로 WebtoonDTO 생성. 해석할 수 없으면 예외 발생"""
+        title_id = self._get_title_id(url)
+        if info is None:
+            info = self._get_json(self.INFO_API_URL, {"titleId": title_id})
+
+        title = info["titleName"].strip() if self.scrape_title else None
+        thumbnail_url = info["thumbnailUrl"] if self.scrape_thumbnail else None
+        description = info["synopsis"].strip() if self.scrape_story else None
+        day_of_week = self.parse_day(info) if self.scrape_day else None
+        genres = self.parse_genres(info) if self.scrape_genres else []
+        authors = self.parse_authors(info) if self.scrape_authors else []
+        age_rating = self.parse_age_rating(info) if self.scrape_day_age else None
+        serialization_status = self.parse_status(info) if self.scrape_status else None
+
+        episode_count = None
+        last_updated_date = None
+        publish_start_date = None
+        if self.scrape_episode_count or self.scrape_dates:
+            if article_list is None:
+                article_list = self.get_article_list(title_id)
+            if self.scrape_episode_count:
+                episode_count = int(article_list["totalCount"])
+            if self.scrape_dates:
+                last_updated_date = self.get_first_article_date(article_list)
+                publish_start_date = self.get_first_article_date(self.get_article_list(title_id, sort="ASC"))
+
+        return WebtoonDTO(
+            title=title,
+            external_id=title_id if self.scrape_unique_id else None,
+            platform=self.PLATFORM_NAME.name,
+            day_of_week=(day_of_week if serialization_status != SerializationStatus.COMPLETED.name else None),
+            thumbnail_url=thumbnail_url,
+            link=url,
+            age_rating=age_rating,
+            description=description,
+            serialization_status=serialization_status,
+            episode_count=episode_count,
+            platform_rating=0.0,
+            publish_start_date=publish_start_date,
+            last_updated_date=last_updated_date,
+            authors=authors,
+            genres=genres
+        )
+
+    def classify_failure(self, error: Exception) -> FailureType:
+        """HTTP 수집 실패 원인 분류"""
+        if isinstance(error, requests.Timeout):
+            return FailureType.TIMEOUT
+        if not isinstance(error, requests.RequestException):
+            # 응답은 받았지만 필요한 필드가 없거나 형식이 다름
+            return FailureType.SELECTOR_MISS
+        response = getattr(error, "response", None)
+        if response is not None:
+            if response.status_code in (403, 429):
+                return FailureType.THROTTLED
+            if response.status_code in (404, 410):
+                return FailureType.NOT_FOUND
+            if "nid.naver.com" in response.headers.get("Location", ""):
+                return FailureType.LOGIN_REDIRECT
+        return FailureType.HTTP_ERROR
+
+    def fetch_webtoon(self, url: str) -> Tuple[bool, Optional[WebtoonDTO]]:
+        """웹툰 정보를 가져와 WebtoonDTO 객체로 반환. 실패 시 Selenium 스크래퍼로 대체 수집"""
+        self.last_failure = None
+        try:
+            return True, self._build_webtoon(url)
+        except (requests.RequestException, KeyError, TypeError, ValueError, AttributeError) as e:
+            self.last_failure = self.classify_failure(e)
+            fallback_scraper = self._get_fallback_scraper()
+            if fallback_scraper is None:
+                logger.error("HTTP 크롤링 오류", error=e, extra={"url": url})
+                return False, None
+            logger.warning("HTTP 수집 실패, Selenium 스크래퍼로 대체", extra={"url": url, "error": str(e)})
+            result = fallback_scraper.fetch_webtoon(url)
+            self.last_failure = fallback_scraper.last_failure
+            return result
+
+    def fetch_webtoon_if_changed(
+        self,
+        url: str,
+        known_fingerprint: Optional[str] = None
+    ) -> Tuple[bool, Optional[WebtoonDTO], Optional[str]]:
+        """info API와 회차 목록 첫 페이지만 조회하여 지문이 같으면 나머지 수집을 건너뜀"""
+        self.last_failure = None
+        try:
+            title_id = self._get_title_id(url)
+            info = self._get_json(self.INFO_API_URL, {"titleId": title_id})
+            article_list = self.get_article_list(title_id)
+            fingerprint = self.compute_fingerprint(info, article_list)
+            if known_fingerprint is not None and fingerprint == known_fingerprint:
+                logger.info("변경 사항 없음, 수집 생략", extra={"url": url})
+                return True, None, fingerprint
+            return True, self._build_webtoon(url, info, article_list), fingerprint
+        except (requests.RequestException, KeyError, TypeError, ValueError, AttributeError) as e:
+            self.last_failure = self.classify_failure(e)
+            fallback_scraper = self._get_fallback_scraper()
+            if fallback_scraper is None:
+                logger.error("HTTP 크롤링 오류", error=e, extra={"url": url})
+                return False, None, None
+            logger.warning("HTTP 수집 실패, Selenium 스크래퍼로 대체", extra={"url": url, "error": str(e)})
+            result = fallback_scraper.fetch_webtoon_if_changed(url, known_fingerprint)
+            self.last_failure = fallback_scraper.last_failure
+            return result
@@ -1,15 +1,18 @@
 import re
+import json
+import hashlib
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from selenium.webdriver.remote.webelement import WebElement
 from models.webtoon import WebtoonDTO
 from models.author import AuthorDTO
-from models.enums import SerializationStatus, Platform, AgeRating, DayOfWeek, AuthorRole
+from models.enums import SerializationStatus, Platform, AgeRating, DayOfWeek, AuthorRole, FailureType
 from utils.logger import logger
+from utils.stage_timer import stage_timer
 from scrapers.common import IWebtoonScraper
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from datetime import datetime
 
 class NaverWebtoonScraper(IWebtoonScraper):
@@ -17,6 +20,10 @@ class NaverWebtoonScraper(IWebtoonScraper):
 
     PLATFORM_NAME = Platform.NAVER
 
+    # 추출 방식: "getter"는 필드마다 WebDriver를 호출, "script"는 한 번의 execute_script로 모든 필드를 읽음
+    EXTRACTION_MODE_GETTER = "getter"
+    EXTRACTION_MODE_SCRIPT = "script"
+
     # CSS 클래스 변수
     TITLE_CLASS = "EpisodeListInfo__title--mYLjC"
     THUMBNAIL_CLASS = "Poster__thumbnail_area--gviWY"
@@ -32,6 +39,78 @@ class NaverWebtoonScraper(IWebtoonScraper):
     CATEGORY_CLASS = "ContentMetaInfo__category--WwrCp"
     WAITING_LOAD_PAGE = 3
     EPISODE_LIST_META_INFO_CLASS = "EpisodeListInfo__meta_info--GbTg4"
+    EPISODE_ITEM_CLASS = "EpisodeListList__item--M8zq4"
+
+    # 제목과 메타 정보는 함께 렌더링되므로 메타 정보가 보이면 페이지 준비 완료로 보고,
+    # 이후 필드는 기다리지 않고 바로 조회한다.
+    PAGE_READY_CLASS = META_INFO_CLASS
+    # 준비 이후에도 없을 때 추가로 기다릴 필드별 시간(초). 에피소드 목록은 별도 요청으로 늦게 그려질 수 있음
+    FIELD_TIMEOUTS = {
+        "episode_count": 2.0,
+        "episode_item": 2.0,
+    }
+
+    AGE_RATING_MAP = {
+        "전체연령가": AgeRating.ALL,
+        "12세": AgeRating.AGE_12,
+        "15세": AgeRating.AGE_15,
+        "19세": AgeRating.ADULT
+    }
+
+    # 지문 계산에 사용하는 정규화된 필드. NaverWebtoonHttpScraper도 같은 필드로 지문을 계산하므로
+    # 엔진을 바꾸거나 대체 수집으로 넘어가도 같은 페이지면 같은 지문이 나온다
+    FINGERPRINT_FIELDS = ("title", "day_of_week", "age_rating", "serialization_status", "episode_count")
+
+    # 요청된 필드를 페이지 안에서 한 번에 읽어 JSON 객체로 반환하는 스크립트
+    EXTRACT_FIELDS_SCRIPT = """
+        const cls = arguments[0];
+        const want = arguments[1];
+        const first = (name, root) => (root || document).getElementsByClassName(name)[0] || null;
+        const all = (name, root) => Array.from((root || document).getElementsByClassName(name));
+        const text = (el) => (el ? el.innerText : null);
+        const result = {currentUrl: window.location.href};
+
+        if (want.title) result.title = text(first(cls.title));
+        if (want.thumbnail) {
+            const area = first(cls.thumbnail);
+            const img = area ? area.getElementsByTagName('img')[0] : null;
+            result.thumbnail = img ? img.src : null;
+        }
+        if (want.story) {
+            const summary = first(cls.summary);
+            result.story = text(summary ? summary.getElementsByTagName('p')[0] : null);
+        }
+        if (want.meta) {
+            const meta = first(cls.metaInfo);
+            result.metaText = text(meta ? first(cls.metaInfoItem, meta) : null);
+            result.absenceTexts = all(cls.absenceInfo).map(text);
+        }
+        if (want.genres) {
+            const button = first(cls.expandButton);
+            if (button && button.offsetParent !== null) button.click();
+            const group = first(cls.tagGroup);
+            result.genres = group ? all(cls.tag, group).map(text) : [];
+        }
+        if (want.authors) {
+            result.authors = [];
+            all(cls.author).forEach((element) => {
+                all(cls.category, element).forEach((category) => {
+                    const link = category.getElementsByTagName('a')[0];
+                    result.authors.push({
+                        href: link ? link.href : null,
+                        name: text(link),
+                        text: text(category)
+                    });
+                });
+            });
+        }
+        if (want.episodeCount) result.episodeCountText = text(first(cls.episodeCount));
+        if (want.lastUpdatedDate) {
+            const item = first(cls.episodeItem);
+            result.lastUpdatedDate = text(item ? item.getElementsByClassName('date')[0] : null);
+        }
+        return result;
+    """
 
     def __init__(self, driver):
         self.driver = driver
@@ -47,160 +126,240 @@ class NaverWebtoonScraper(IWebtoonScraper):
         self.scrape_unique_id = False
         self.scrape_episode_count = False
         self.scrape_dates = False
-
-    def wait_for_element(self, class_name: str) -> WebElement:
-        """주어진 클래스 이름을 가진 요소가 로드될 때까지 대기하는 메서드"""
-        return WebDriverWait(self.driver, self.WAITING_LOAD_PAGE).until(
-            EC.presence_of_element_located((By.CLASS_NAME, class_name))
-        )
-
+        self.extraction_mode = self.EXTRACTION_MODE_GETTER
+        self.page_ready_timeout = self.WAITING_LOAD_PAGE
+        self.field_timeouts: Dict[str, float] = dict(self.FIELD_TIMEOUTS)
+        self._page_ready = False
+
+    def reset_page_state(self) -> None:
+        """페이지를 이동한 뒤 호출. 다음 조회에서 페이지 준비를 다시 확인"""
+        self._page_ready = False
+
+    @stage_timer.timed("naver.page_ready")
+    def wait_for_page_ready(self) -> None:
+        """페이지 준비 표식이 나타날 때까지 페이지당 한 번만 대기하는 메서드
+
+        문서는 모두 불러왔는데 표식만 없으면 페이지 구조가 바뀐 것이므로 TimeoutException 대신
+        NoSuchElementException을 발생시킨다 (재시도하지 않는 SELECTOR_MISS로 분류됨).
+        """
+        if self._page_ready:
+            return
+        try:
+            WebDriverWait(self.driver, self.page_ready_timeout).until(
+                EC.presence_of_element_located((By.CLASS_NAME, self.PAGE_READY_CLASS))
+            )
+        except TimeoutException:
+            if ("nid.naver.com" not in self.driver.current_url
+                    and self.driver.execute_script("return document.readyState") == "complete"):
+                raise NoSuchElementException(f"페이지 준비 표식을 찾을 수 없습니다: {self.PAGE_READY_CLASS}")
+            raise
+        self._page_ready = True
+
+    @stage_timer.timed("naver.wait")
+    def find_field_elements(self, class_name: str, field: Optional[str] = None) -> List[WebElement]:
+        """페이지 준비 후 요소를 바로 조회하는 메서드
+
+        없으면 field_timeouts에 지정된 시간만큼만 더 기다리고, 그래도 없으면 빈 목록을 반환한다.
+        """
+        self.wait_for_page_ready()
+        elements = self.driver.find_elements(By.CLASS_NAME, class_name)
+        timeout = self.field_timeouts.get(field, 0) if field else 0
+        if not elements and timeout > 0:
+            try:
+                elements = WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                    lambda driver: driver.find_elements(By.CLASS_NAME, class_name)
+                )
+            except TimeoutException:
+                elements = []
+        return elements
+
+    def wait_for_element(self, class_name: str, field: Optional[str] = None) -> WebElement:
+        """주어진 클래스 이름을 가진 요소를 가져오는 메서드. 없으면 NoSuchElementException"""
+        elements = self.find_field_elements(class_name, field)
+        if not elements:
+            raise NoSuchElementException(f"요소를 찾을 수 없습니다: {class_name}")
+        return elements[0]
+
+    @stage_timer.timed("naver.get_title")
     def get_title(self) -> str:
         """웹툰 제목을 가져오는 메서드"""
         element = self.wait_for_element(self.TITLE_CLASS)
-        title = element.text.strip()
-        cleaned_title = re.sub(r'\n.*', '', title).strip()
-        return cleaned_title
+        return self.parse_title(element.text)
+
+    def parse_title(self, text: str) -> str:
+        """제목 텍스트에서 첫 줄만 남기는 메서드"""
+        return re.sub(r'\n.*', '', text.strip()).strip()
 
+    @stage_timer.timed("naver.get_thumbnail_url")
     def get_thumbnail_url(self) -> str:
         """웹툰 썸네일 URL을 가져오는 메서드"""
         element = self.wait_for_element(self.THUMBNAIL_CLASS)
         return element.find_element(By.TAG_NAME, 'img').get_attribute('src')
 
+    @stage_timer.timed("naver.get_story")
     def get_story(self) -> str:
         """웹툰 설명을 가져오는 메서드"""
         element = self.wait_for_element(self.SUMMARY_CLASS)
         return element.find_element(By.TAG_NAME, 'p').text.strip()
 
+    @stage_timer.timed("naver.get_day_age")
     def get_day_age(self) -> Optional[str]:
         """웹툰의 연령 등급을 가져오는 메서드"""
         element = self.wait_for_element(self.META_INFO_CLASS)
         text = element.find_element(By.CLASS_NAME, self.META_INFO_ITEM_CLASS).text.strip()
+        return self.parse_age_rating(text)
+
+    def parse_age_rating(self, text: str) -> Optional[str]:
+        """메타 정보 텍스트에서 연령 등급을 파싱하는 메서드"""
         age_match = re.search(r'(전체연령가|12세|15세|19세)', text)
         if age_match:
-            age_rating_map = {
-                "전체연령가": AgeRating.ALL,
-                "12세": AgeRating.AGE_12,
-                "15세": AgeRating.AGE_15,
-                "19세": AgeRating.ADULT
-            }
-            return age_rating_map[age_match.group(1)].name
+            return self.AGE_RATING_MAP[age_match.group(1)].name
         return None
 
+    @stage_timer.timed("naver.get_day")
     def get_day(self) -> Optional[str]:
         day_age_text = self.wait_for_element(self.META_INFO_CLASS).find_element(By.CLASS_NAME, self.META_INFO_ITEM_CLASS).text.strip()
-        day_match = re.search(r'(월|화|수|목|금|토|일)', day_age_text)
+        return self.parse_day(day_age_text)
+
+    def parse_day(self, text: str) -> Optional[str]:
+        """메타 정보 텍스트에서 연재 요일을 파싱하는 메서드"""
+        day_match = re.search(r'(월|화|수|목|금|토|일)', text)
         if day_match:
             korean_day = day_match.group(1)
             day_of_week = DayOfWeek.from_korean(korean_day)
             return day_of_week.name if day_of_week else None
         return None
 
+    @stage_timer.timed("naver.get_status")
     def get_status(self) -> str:
         """연재 상태를 가져오는 메서드"""
         day_age_text = self.wait_for_element(self.META_INFO_CLASS).find_element(By.CLASS_NAME, self.META_INFO_ITEM_CLASS).text.strip()
         absence_elements = self.driver.find_elements(By.CLASS_NAME, self.ABSENCE_INFO_CLASS)
-        for element in absence_elements:
-            if element.text.strip() == '휴재':
+        return self.parse_status(day_age_text, [element.text for element in absence_elements])
+
+    def parse_status(self, meta_text: str, absence_texts: List[str]) -> str:
+        """메타 정보와 휴재 안내 텍스트로 연재 상태를 판단하는 메서드"""
+        for absence_text in absence_texts:
+            if absence_text and absence_text.strip() == '휴재':
                 return SerializationStatus.HIATUS.name
-        
-        if '완결' in day_age_text:
+
+        if '완결' in meta_text:
             return SerializationStatus.COMPLETED.name
         return SerializationStatus.ONGOING.name
 
+    @stage_timer.timed("naver.get_genres")
     def get_genres(self) -> List[str]:
         """장르 정보를 가져오는 메서드"""
+        expand_buttons = self.find_field_elements(self.EXPAND_BUTTON_CLASS, "expand_button")
         try:
-            expand_button = self.driver.find_element(By.CLASS_NAME, self.EXPAND_BUTTON_CLASS)
-            if expand_button.is_displayed():
-                expand_button.click()
+            if expand_buttons and expand_buttons[0].is_displayed():
+                expand_buttons[0].click()
         except Exception:
-            logger.debug("장르 카테고리 펼치기 버튼이 없거나 클릭할 수 없습니다")
-
-        WebDriverWait(self.driver, self.WAITING_LOAD_PAGE).until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, self.TAG_CLASS))
-        )
+            logger.debug("장르 카테고리 펼치기 버튼을 클릭할 수 없습니다")
 
-        genre_elements = self.wait_for_element(self.TAG_GROUP_CLASS).find_elements(By.CLASS_NAME, self.TAG_CLASS)
-        genres = [genre.text.strip().replace('#', '') for genre in genre_elements if genre.text.strip()]
+        # 태그가 없는 웹툰은 기다리지 않고 빈 목록 반환
+        tag_groups = self.find_field_elements(self.TAG_GROUP_CLASS, "genres")
+        genre_elements = tag_groups[0].find_elements(By.CLASS_NAME, self.TAG_CLASS) if tag_groups else []
+        genres = self.parse_genres([genre.text for genre in genre_elements])
         logger.debug("장르 수집 완료", extra={"genres": genres})
 
         return genres
 
+    def parse_genres(self, texts: List[str]) -> List[str]:
+        """태그 텍스트 목록에서 장르 목록을 만드는 메서드"""
+        return [text.strip().replace('#', '') for text in texts if text and text.strip()]
+
+    @stage_timer.timed("naver.get_authors")
     def get_authors(self) -> List[AuthorDTO]:
         """저자 정보를 가져오는 메서드"""
         authors = []
-        author_elements = self.driver.find_elements(By.CLASS_NAME, self.AUTHOR_CLASS)
+        author_elements = self.find_field_elements(self.AUTHOR_CLASS, "authors")
 
         for element in author_elements:
             category_elements = element.find_elements(By.CLASS_NAME, self.CATEGORY_CLASS)
             
             for category in category_elements:
                 link_tag = category.find_element(By.TAG_NAME, 'a')
-                href = link_tag.get_attribute('href')
-                name = link_tag.text.strip()
-
-                if "artistTitle" in href:
-                    author_id_match = re.search(r'id=(\d+)', href)
-                    author_id = author_id_match.group(1) if author_id_match else None
-                    url = href
-                elif "community" in href:
-                    author_id_match = re.search(r'u/([^?]+)', href)
-                    author_id = author_id_match.group(1) if author_id_match else None
-                    url = href.split('?')[0]  
-                else:
-                    logger.warning("알 수 없는 구조의 링크", extra={"href": href})
-                    continue 
+                author = self.parse_author(link_tag.get_attribute('href'), link_tag.text, category.text)
+                if author:
+                    authors.append(author)
 
-                role_text = category.text.split()[-1].strip()
-                try:
-                    role = AuthorRole(role_text)
-                    role = role.name
-                except ValueError:
-                    logger.warning("알 수 없는 역할", extra={"role": role_text})
-                    continue
+        return authors
 
-                authors.append(AuthorDTO(author_id, name, role))
+    def parse_author(self, href: Optional[str], name: Optional[str], category_text: Optional[str]) -> Optional[AuthorDTO]:
+        """작가 링크와 카테고리 텍스트로 AuthorDTO를 만드는 메서드"""
+        href = href or ""
+        if "artistTitle" in href:
+            author_id_match = re.search(r'id=(\d+)', href)
+            author_id = author_id_match.group(1) if author_id_match else None
+        elif "community" in href:
+            author_id_match = re.search(r'u/([^?]+)', href)
+            author_id = author_id_match.group(1) if author_id_match else None
+        else:
+            logger.warning("알 수 없는 구조의 링크", extra={"href": href})
+            return None
 
-        return authors
+        role_text = (category_text or "").split()[-1].strip() if (category_text or "").split() else ""
+        try:
+            role = AuthorRole(role_text).name
+        except ValueError:
+            logger.warning("알 수 없는 역할", extra={"role": role_text})
+            return None
+
+        return AuthorDTO(author_id, (name or "").strip(), role)
 
+    @stage_timer.timed("naver.get_unique_id")
     def get_unique_id(self) -> Optional[str]:
         """웹툰의 고유 ID를 가져오는 메서드"""
-        url = self.driver.current_url
+        return self.parse_unique_id(self.driver.current_url)
+
+    def parse_unique_id(self, url: str) -> Optional[str]:
+        """URL에서 titleId를 추출하는 메서드"""
         id_match = re.search(r'titleId=(\d+)', url)
         if id_match:
             return id_match.group(1)
         return None
 
+    @stage_timer.timed("naver.get_episode_count")
     def get_episode_count(self) -> Optional[int]:
         """웹툰의 에피소드 수를 가져오는 메서드"""
-        element = self.wait_for_element(self.EPISODE_COUNT_CLASS)
-        return int(re.search(r'\d+', element.text).group()) if element else None
+        elements = self.find_field_elements(self.EPISODE_COUNT_CLASS, "episode_count")
+        return self.parse_episode_count(elements[0].text) if elements else None
+
+    def parse_episode_count(self, text: Optional[str]) -> Optional[int]:
+        """에피소드 수 텍스트에서 숫자를 추출하는 메서드"""
+        count_match = re.search(r'\d+', text or "")
+        return int(count_match.group()) if count_match else None
 
+    @stage_timer.timed("naver.get_publish_start_date")
     def get_publish_start_date(self) -> Optional[str]:
         """웹툰의 시작 날짜를 가져오는 메서드"""
         try:
             current_url = self.driver.current_url
             modified_url = f"{current_url}&page=1&sort=ASC"
-            self.driver.get(modified_url)
+            with stage_timer.measure("naver.navigate"):
+                self.driver.get(modified_url)
+            self.reset_page_state()
 
-            first_item = self.wait_for_element("EpisodeListList__item--M8zq4")
+            first_item = self.wait_for_element(self.EPISODE_ITEM_CLASS, "episode_item")
             date_element = first_item.find_element(By.CLASS_NAME, "date")
             first_day = date_element.text.strip()
 
             return self.format_date(first_day)
         except Exception as e:
-            logger.warning("시작일 추출 오류", error=e)
+            logger.warning("시작일 추출 오류", extra={"error": str(e)})
             return None
 
+    @stage_timer.timed("naver.get_last_updated_date")
     def get_last_updated_date(self) -> Optional[str]:
         """웹툰의 마지막 업데이트 날짜를 가져오는 메서드"""
         try:
-            first_item = self.wait_for_element("EpisodeListList__item--M8zq4")
+            first_item = self.wait_for_element(self.EPISODE_ITEM_CLASS, "episode_item")
             date_element = first_item.find_element(By.CLASS_NAME, "date")
             last_day = date_element.text.strip()
             return self.format_date(last_day)
         except Exception as e:
-            logger.warning("마지막일 추출 오류", error=e)
+            logger.warning("마지막일 추출 오류", extra={"error": str(e)})
             return None
 
     def format_date(self, date_str: str) -> str:
@@ -213,28 +372,180 @@ class NaverWebtoonScraper(IWebtoonScraper):
     def get_serialization_status(self) -> str:
         return self.get_status()
 
+    @classmethod
+    def build_fingerprint(cls, fields: Dict[str, Any]) -> str:
+        """정규화된 필드 값(FINGERPRINT_FIELDS)의 해시로 지문을 계산하는 메서드"""
+        payload = {field: fields.get(field) for field in cls.FINGERPRINT_FIELDS}
+        # 완결 웹툰은 수집 결과와 같이 연재 요일을 두지 않음 (엔진마다 완결 후 요일 표시가 다름)
+        if payload["serialization_status"] == SerializationStatus.COMPLETED.name:
+            payload["day_of_week"] = None
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    @stage_timer.timed("naver.get_fingerprint")
+    def get_fingerprint(self) -> str:
+        """현재 페이지의 지문(제목, 연재 요일, 연령 등급, 연재 상태, 에피소드 수의 해시)을 계산하는 메서드"""
+        if not self.find_field_elements(self.EPISODE_COUNT_CLASS, "episode_count"):
+            logger.debug("에피소드 수 요소 없이 지문 계산")
+        raw = self.driver.execute_script(self.EXTRACT_FIELDS_SCRIPT, self._get_script_classes(), {
+            "title": True,
+            "meta": True,
+            "episodeCount": True,
+        })
+        meta_text = (raw.get("metaText") or "").strip()
+        return self.build_fingerprint({
+            "title": self.parse_title(raw.get("title") or ""),
+            "day_of_week": self.parse_day(meta_text),
+            "age_rating": self.parse_age_rating(meta_text),
+            "serialization_status": self.parse_status(meta_text, raw.get("absenceTexts") or []),
+            "episode_count": self.parse_episode_count(raw.get("episodeCountText")),
+        })
+
+    def _extract_fields(self) -> Dict[str, Any]:
+        """필드마다 getter를 호출하여 현재 페이지의 정보를 수집"""
+        return {
+            "title": self.get_title() if self.scrape_title else None,
+            "external_id": self.get_unique_id() if self.scrape_unique_id else None,
+            "thumbnail_url": self.get_thumbnail_url() if self.scrape_thumbnail else None,
+            "description": self.get_story() if self.scrape_story else None,
+            "day_of_week": self.get_day() if self.scrape_day else None,
+            "episode_count": self.get_episode_count() if self.scrape_episode_count else None,
+            "genres": self.get_genres() if self.scrape_genres else [],
+            "authors": self.get_authors() if self.scrape_authors else [],
+            "age_rating": self.get_age_rating() if self.scrape_day_age else None,
+            "serialization_status": self.get_serialization_status() if self.scrape_status else None,
+            "last_updated_date": self.get_last_updated_date() if self.scrape_dates else None,
+        }
+
+    def _get_script_classes(self) -> Dict[str, str]:
+        """EXTRACT_FIELDS_SCRIPT에 전달할 CSS 클래스 이름"""
+        return {
+            "title": self.TITLE_CLASS,
+            "thumbnail": self.THUMBNAIL_CLASS,
+            "summary": self.SUMMARY_CLASS,
+            "metaInfo": self.META_INFO_CLASS,
+            "metaInfoItem": self.META_INFO_ITEM_CLASS,
+            "absenceInfo": self.ABSENCE_INFO_CLASS,
+            "expandButton": self.EXPAND_BUTTON_CLASS,
+            "tagGroup": self.TAG_GROUP_CLASS,
+            "tag": self.TAG_CLASS,
+            "author": self.AUTHOR_CLASS,
+            "category": self.CATEGORY_CLASS,
+            "episodeCount": self.EPISODE_COUNT_CLASS,
+            "episodeItem": self.EPISODE_ITEM_CLASS,
+        }
+
+    def _extract_fields_with_script(self) -> Dict[str, Any]:
+        """한 번의 execute_script로 현재 페이지의 정보를 수집"""
+        needs_meta = self.scrape_day or self.scrape_day_age or self.scrape_status
+        self.wait_for_page_ready()
+        # 에피소드 목록은 늦게 그려질 수 있으므로 getter 방식과 같이 필드별 시간만큼 더 기다림
+        if self.scrape_episode_count:
+            self.find_field_elements(self.EPISODE_COUNT_CLASS, "episode_count")
+        if self.scrape_dates:
+            self.find_field_elements(self.EPISODE_ITEM_CLASS, "episode_item")
+
+        wanted = {
+            "title": self.scrape_title,
+            "thumbnail": self.scrape_thumbnail,
+            "story": self.scrape_story,
+            "meta": needs_meta,
+            "genres": self.scrape_genres,
+            "authors": self.scrape_authors,
+            "episodeCount": self.scrape_episode_count,
+            "lastUpdatedDate": self.scrape_dates,
+        }
+        raw = self.driver.execute_script(self.EXTRACT_FIELDS_SCRIPT, self._get_script_classes(), wanted)
+
+        # getter 방식과 동일하게 필수 요소가 없으면 수집 실패로 처리
+        for key, requested in (("title", self.scrape_title), ("thumbnail", self.scrape_thumbnail),
+                               ("story", self.scrape_story), ("metaText", needs_meta)):
+            if requested and raw.get(key) is None:
+                raise NoSuchElementException(f"요소를 찾을 수 없습니다: {key}")
+
+        meta_text = (raw.get("metaText") or "").strip()
+        authors = []
+        for author in raw.get("authors") or []:
+            parsed = self.parse_author(author.get("href"), author.get("name"), author.get("text"))
+            if parsed:
+                authors.append(parsed)
+
+        last_updated_date = None
+        if self.scrape_dates:
+            try:
+                last_updated_date = self.format_date((raw.get("lastUpdatedDate") or "").strip())
+            except ValueError as e:
+                logger.warning("마지막일 추출 오류", extra={"error": str(e)})
+
+        return {
+            "title": self.parse_title(raw["title"]) if self.scrape_title else None,
+            "external_id": self.parse_unique_id(raw["currentUrl"]) if self.scrape_unique_id else None,
+            "thumbnail_url": raw["thumbnail"] if self.scrape_thumbnail else None,
+            "description": raw["story"].strip() if self.scrape_story else None,
+            "day_of_week": self.parse_day(meta_text) if self.scrape_day else None,
+            "episode_count": self.parse_episode_count(raw.get("episodeCountText")) if self.scrape_episode_count else None,
+            "genres": self.parse_genres(raw.get("genres") or []) if self.scrape_genres else [],
+            "authors": authors,
+            "age_rating": self.parse_age_rating(meta_text) if self.scrape_day_age else None,
+            "serialization_status": self.parse_status(meta_text, raw.get("absenceTexts") or []) if self.scrape_status else None,
+            "last_updated_date": last_updated_date,
+        }
+
     def fetch_webtoon(self, url: str) -> Tuple[bool, Optional[WebtoonDTO]]:
         """웹툰 정보를 가져와 WebtoonDTO 객체로 반환"""
+        success, webtoon_data, _ = self._fetch(url, with_fingerprint=False)
+        return success, webtoon_data
+
+    def fetch_webtoon_if_changed(
+        self,
+        url: str,
+        known_fingerprint: Optional[str] = None
+    ) -> Tuple[bool, Optional[WebtoonDTO], Optional[str]]:
+        """지문이 같으면 필드 추출과 날짜 페이지 이동을 건너뛰고 (True, None, 지문)을 반환"""
+        return self._fetch(url, with_fingerprint=True, known_fingerprint=known_fingerprint)
+
+    def _fetch(
+        self,
+        url: str,
+        with_fingerprint: bool,
+        known_fingerprint: Optional[str] = None
+    ) -> Tuple[bool, Optional[WebtoonDTO], Optional[str]]:
+        """페이지 접속 후 (선택적으로 지문을 비교하고) 웹툰 정보를 수집"""
+        self.last_failure = None
         try:
             logger.info("웹툰 페이지 접속", extra={"url": url})
-            self.driver.get(url)
+            with stage_timer.measure("naver.navigate"):
+                self.driver.get(url)
+            self.reset_page_state()
 
             if "nid.naver.com" in self.driver.current_url:
                 logger.warning("성인 인증이 필요한 웹툰", extra={"url": url})
-                return False, None
+                self.last_failure = FailureType.LOGIN_REDIRECT
+                return False, None, None
+
+            fingerprint = None
+            if with_fingerprint:
+                fingerprint = self.get_fingerprint()
+                if known_fingerprint is not None and fingerprint == known_fingerprint:
+                    logger.info("변경 사항 없음, 수집 생략", extra={"url": url})
+                    return True, None, fingerprint
 
             # 선택적으로 데이터 수집
-            title = self.get_title() if self.scrape_title else None
-            external_id = self.get_unique_id() if self.scrape_unique_id else None
-            thumbnail_url = self.get_thumbnail_url() if self.scrape_thumbnail else None
-            description = self.get_story() if self.scrape_story else None
-            day_of_week = self.get_day() if self.scrape_day else None
-            episode_count = self.get_episode_count() if self.scrape_episode_count else None
-            genres = self.get_genres() if self.scrape_genres else []
-            authors = self.get_authors() if self.scrape_authors else []
-            age_rating = self.get_age_rating() if self.scrape_day_age else None
-            serialization_status = self.get_serialization_status() if self.scrape_status else None
-            last_updated_date = self.get_last_updated_date() if self.scrape_dates else None
+            with stage_timer.measure(f"naver.extract.{self.extraction_mode}"):
+                if self.extraction_mode == self.EXTRACTION_MODE_SCRIPT:
+                    fields = self._extract_fields_with_script()
+                else:
+                    fields = self._extract_fields()
+            title = fields["title"]
+            external_id = fields["external_id"]
+            thumbnail_url = fields["thumbnail_url"]
+            description = fields["description"]
+            day_of_week = fields["day_of_week"]
+            episode_count = fields["episode_count"]
+            genres = fields["genres"]
+            authors = fields["authors"]
+            age_rating = fields["age_rating"]
+            serialization_status = fields["serialization_status"]
+            last_updated_date = fields["last_updated_date"]
             publish_start_date = self.get_publish_start_date() if self.scrape_dates else None
 
             webtoon_data = WebtoonDTO(
@@ -254,14 +565,25 @@ class NaverWebtoonScraper(IWebtoonScraper):
                 authors=authors,
                 genres=genres
             )
-            return True, webtoon_data
+            return True, webtoon_data, fingerprint
 
         except TimeoutException:
             if "nid.naver.com" in self.driver.current_url:
                 logger.warning("성인 인증이 필요한 웹툰 (Timeout 발생)", extra={"url": url})
-                return False, None
+                self.last_failure = FailureType.LOGIN_REDIRECT
+                return False, None, None
             logger.error("크롤링 오류 (TimeoutException)", extra={"url": url})
-            return False, None
+            self.last_failure = FailureType.TIMEOUT
+            return False, None, None
+        except NoSuchElementException as e:
+            logger.error("크롤링 오류 (페이지 요소 없음)", error=e, extra={"url": url})
+            self.last_failure = FailureType.SELECTOR_MISS
+            return False, None, None
+        except WebDriverException as e:
+            logger.error("크롤링 오류 (WebDriver)", error=e, extra={"url": url})
+            self.last_failure = FailureType.DRIVER_CRASH
+            return False, None, None
         except Exception as e:
             logger.error("크롤링 오류", error=e, extra={"url": url})
-            return False, None
\ No newline at end of file
+            self.last_failure = FailureType.UNKNOWN
+            return False, None, None
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Dict, Optional, Type
 from selenium.webdriver.remote.webdriver import WebDriver
 from scrapers.platforms.naver_webtoon_scraper import NaverWebtoonScraper
 from scrapers.common import IWebtoonScraper
@@ -18,6 +18,9 @@ class WebtoonScraperBuilder:
         self._scrape_unique_id = False
         self._scrape_episode_count = False
         self._scrape_dates = False
+        self._use_script_extraction = False
+        self._page_ready_timeout: Optional[float] = None
+        self._field_timeouts: Dict[str, float] = {}
 
     def scrape_title(self) -> 'WebtoonScraperBuilder':
         self._scrape_title = True
@@ -63,6 +66,21 @@ class WebtoonScraperBuilder:
         self._scrape_dates = True
         return self
 
+    def use_script_extraction(self) -> 'WebtoonScraperBuilder':
+        """필드별 getter 대신 한 번의 execute_script로 모든 필드를 읽도록 설정"""
+        self._use_script_extraction = True
+        return self
+
+    def set_page_ready_timeout(self, seconds: float) -> 'WebtoonScraperBuilder':
+        """페이지 준비 표식을 기다릴 최대 시간 설정"""
+        self._page_ready_timeout = seconds
+        return self
+
+    def set_field_timeout(self, field: str, seconds: float) -> 'WebtoonScraperBuilder':
+        """페이지 준비 이후에도 요소가 없을 때 추가로 기다릴 필드별 시간 설정 (0이면 즉시 실패)"""
+        self._field_timeouts[field] = seconds
+        return self
+
     def build(self) -> IWebtoonScraper:
         scraper = self.scraper_class(self.driver)
         scraper.scrape_title = self._scrape_title
@@ -76,6 +94,12 @@ class WebtoonScraperBuilder:
         scraper.scrape_unique_id = self._scrape_unique_id
         scraper.scrape_episode_count = self._scrape_episode_count
         scraper.scrape_dates = self._scrape_dates
+        if self._use_script_extraction:
+            scraper.extraction_mode = NaverWebtoonScraper.EXTRACTION_MODE_SCRIPT
+        if self._page_ready_timeout is not None and hasattr(scraper, "page_ready_timeout"):
+            scraper.page_ready_timeout = self._page_ready_timeout
+        if self._field_timeouts and hasattr(scraper, "field_timeouts"):
+            scraper.field_timeouts.update(self._field_timeouts)
         return scraper
 
     @classmethod
@@ -1,14 +1,28 @@
 from selenium.webdriver.remote.webdriver import WebDriver
 from typing import Dict, Type
 from scrapers.platforms.naver_webtoon_scraper import NaverWebtoonScraper
+from scrapers.platforms.naver_webtoon_http_scraper import NaverWebtoonHttpScraper
+from scrapers.platforms.naver_episode_scraper import NaverEpisodeScraper
+from scrapers.platforms.naver_episode_http_scraper import NaverEpisodeHttpScraper
 from scrapers.webtoon_scraper_builder import WebtoonScraperBuilder
-from scrapers.common import IWebtoonScraper
+from scrapers.common import IWebtoonScraper, IEpisodeScraper
 
 class WebtoonScraperFactory:
-    """웹툰 스크래퍼 팩토리 클래스"""
+    """웹툰 스크래퍼 팩토리 클래스
+
+    미리 정의된 스크래퍼(create_*_scraper)는 한 번의 execute_script로 필드를 읽는 단일 스크립트 추출을 사용한다.
+    필드별 getter 방식이 필요하면 create_builder()로 직접 구성한다.
+    """
     
     _scrapers: Dict[str, Type[IWebtoonScraper]] = {
-        "naver": NaverWebtoonScraper
+        "naver": NaverWebtoonScraper,
+        # 브라우저 없이 HTTP로 수집하고, 실패한 웹툰만 Selenium으로 대체 수집
+        "naver_http": NaverWebtoonHttpScraper
+    }
+    _episode_scrapers: Dict[str, Type[IEpisodeScraper]] = {
+        "naver": NaverEpisodeScraper,
+        # 회차 목록 API를 직접 호출 (브라우저 사용 안 함)
+        "naver_http": NaverEpisodeHttpScraper
     }
 
     @classmethod
@@ -16,6 +30,11 @@ class WebtoonScraperFactory:
         """새로운 스크래퍼를 등록하는 메서드"""
         cls._scrapers[platform] = scraper_class
 
+    @classmethod
+    def register_episode_scraper(cls, platform: str, scraper_class: Type[IEpisodeScraper]) -> None:
+        """새로운 회차 목록 스크래퍼를 등록하는 메서드"""
+        cls._episode_scrapers[platform] = scraper_class
+
     @classmethod
     def create_builder(cls, driver: WebDriver, platform: str = "naver") -> WebtoonScraperBuilder:
         """주어진 플랫폼에 맞는 스크래퍼 빌더를 생성"""
@@ -27,19 +46,28 @@ class WebtoonScraperFactory:
     @classmethod
     def create_title_genre_scraper(cls, driver: WebDriver, platform: str = "naver") -> IWebtoonScraper:
         """제목과 장르만 수집하는 스크래퍼 생성"""
-        return cls.create_builder(driver, platform).scrape_title().scrape_genres().build()
+        return cls.create_builder(driver, platform).scrape_title().scrape_genres().use_script_extraction().build()
 
     @classmethod
     def create_basic_info_scraper(cls, driver: WebDriver, platform: str = "naver") -> IWebtoonScraper:
-        """기본 정보를 수집하는 스크래퍼 생성"""
+        """기본 정보를 수집하는 스크래퍼 생성 (연재 요일과 상태는 CrawlScheduler의 일정 계산에 사용)"""
         return (cls.create_builder(driver, platform)
+            .scrape_unique_id()
             .scrape_title()
             .scrape_thumbnail()
             .scrape_story()
+            .scrape_day()
+            .scrape_status()
             .scrape_genres()
             .scrape_authors()
+            .use_script_extraction()
             .build())
 
+    @classmethod
+    def create_status_scraper(cls, driver: WebDriver, platform: str = "naver") -> IWebtoonScraper:
+        """연재 상태만 수집하는 스크래퍼 생성 (메타 정보와 휴재 안내만 읽음)"""
+        return cls.create_builder(driver, platform).scrape_unique_id().scrape_status().use_script_extraction().build()
+
     @classmethod
     def create_full_info_scraper(cls, driver: WebDriver, platform: str = "naver") -> IWebtoonScraper:
         """모든 정보를 수집하는 스크래퍼 생성"""
@@ -55,4 +83,12 @@ class WebtoonScraperFactory:
             .scrape_unique_id()
             .scrape_episode_count()
             .scrape_dates()
+            .use_script_extraction()
             .build()) 
+
+    @classmethod
+    def create_episode_scraper(cls, driver: WebDriver, platform: str = "naver") -> IEpisodeScraper:
+        """회차 목록을 수집하는 스크래퍼 생성"""
+        if platform not in cls._episode_scrapers:
+            raise ValueError(f"지원하지 않는 플랫폼: {platform}")
+        return cls._episode_scrapers[platform](driver)
@@ -0,0 +1,107 @@
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List
+
+class StageHistogram:
+    """단계별 소요 시간 히스토그램
+
+    샘플을 모두 보관하지 않고 로그 간격의 버킷에 개수만 누적하므로 실행 시간이 길어져도 메모리가 일정하다.
+    백분위수는 해당 버킷의 상한값으로 추정한다 (오차는 버킷 간격 약 19% 이내).
+    """
+
+    # 0.1ms ~ 약 10분, 버킷 간격 2^(1/4)
+    BUCKET_BOUNDS: List[float] = [0.0001 * (2 ** (i / 4)) for i in range(92)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(p / 100 * self.count + 0.5)))
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                bound = self.BUCKET_BOUNDS[index] if index < len(self.BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 4),
+            "mean_s": round(self.total / self.count, 4) if self.count else 0.0,
+            "p50_s": round(self.percentile(50), 4),
+            "p90_s": round(self.percentile(90), 4),
+            "p99_s": round(self.percentile(99), 4),
+            "max_s": round(self.max, 4),
+        }
+
+class StageTimer:
+    """크롤링 단계(페이지 이동, 대기, 필드 추출, 직렬화, 저장)별 소요 시간을 수집하는 클래스
+
+    사용법:
+        with stage_timer.measure("scraper.navigate"):
+            driver.get(url)
+
+        @stage_timer.timed("scraper.get_title")
+        def get_title(self): ...
+    """
+
+    def __init__(self):
+        self._histograms: Dict[str, StageHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """단계 소요 시간 기록"""
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = StageHistogram()
+            histogram.add(seconds)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """with 블록의 소요 시간을 기록 (예외가 발생해도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def timed(self, stage: str) -> Callable:
+        """함수 호출의 소요 시간을 기록하는 데코레이터"""
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.measure(stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """단계별 count/total/mean/p50/p90/p99/max (총 소요 시간이 큰 순)"""
+        with self._lock:
+            items = [(stage, histogram.summary()) for stage, histogram in self._histograms.items()]
+        return dict(sorted(items, key=lambda item: item[1]["total_s"], reverse=True))
+
+    def reset(self) -> None:
+        """기록 초기화"""
+        with self._lock:
+            self._histograms = {}
+
+# 전역 단계 타이머 인스턴스
+stage_timer = StageTimer()
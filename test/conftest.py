@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 소스 코드는 src를 기준으로 import하므로 (python src/main.py와 같은 방식) 테스트에서도 src를 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
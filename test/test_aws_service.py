@@ -0,0 +1,58 @@
+import threading
+from modules.aws_service import AWSService
+
+class FakeSqsClient:
+    """send_message_batch 호출을 기록하고 지정한 Id를 정해진 횟수만큼 실패시키는 SQS 클라이언트"""
+
+    def __init__(self, transient_failures=None, sender_faults=()):
+        self.calls = []
+        self.transient_failures = dict(transient_failures or {})
+        self.sender_faults = set(sender_faults)
+        self._lock = threading.Lock()
+
+    def send_message_batch(self, QueueUrl, Entries):
+        failed = []
+        with self._lock:
+            self.calls.append([entry["Id"] for entry in Entries])
+            for entry in Entries:
+                if entry["Id"] in self.sender_faults:
+                    failed.append({"Id": entry["Id"], "SenderFault": True})
+                elif self.transient_failures.get(entry["Id"], 0) > 0:
+                    self.transient_failures[entry["Id"]] -= 1
+                    failed.append({"Id": entry["Id"], "SenderFault": False})
+        return {"Failed": failed}
+
+def create_service(sqs_client) -> AWSService:
+    service = AWSService(ssm_client=object(), sqs_client=sqs_client)
+    service.SQS_RETRY_DELAY = 0
+    return service
+
+def test_batches_are_limited_to_ten_entries():
+    sqs = FakeSqsClient()
+    failed = create_service(sqs).send_sqs_message_batch("queue", [{"n": n} for n in range(25)])
+    assert failed == []
+    assert sorted(len(call) for call in sqs.calls) == [5, 10, 10]
+    assert sorted(entry_id for call in sqs.calls for entry_id in call) == sorted(str(n) for n in range(25))
+
+def test_batches_are_limited_by_size():
+    sqs = FakeSqsClient()
+    service = create_service(sqs)
+    body = {"data": "x" * (100 * 1024)}
+    service.send_sqs_message_batch("queue", [body, body, body])
+    # 100KB 메시지는 256KB 안에 두 개까지만 들어감
+    assert sorted(len(call) for call in sqs.calls) == [1, 2]
+
+def test_only_failed_entries_are_retried():
+    sqs = FakeSqsClient(transient_failures={"1": 2})
+    failed = create_service(sqs).send_sqs_message_batch("queue", [{"n": n} for n in range(3)])
+    assert failed == []
+    assert sqs.calls == [["0", "1", "2"], ["1"], ["1"]]
+
+def test_sender_faults_and_exhausted_retries_are_returned():
+    sqs = FakeSqsClient(transient_failures={"2": 10}, sender_faults={"0"})
+    service = create_service(sqs)
+    bodies = [{"n": n} for n in range(3)]
+    failed = service.send_sqs_message_batch("queue", bodies)
+    assert failed == [bodies[0], bodies[2]]
+    # 거부된 항목은 재시도하지 않음
+    assert sqs.calls[1:] == [["2"]] * service.SQS_BATCH_RETRIES
@@ -0,0 +1,77 @@
+import json
+from crawler.batch import CrawlCheckpoint
+from models.crawl_failure import CrawlFailure
+from models.enums import FailureType
+
+URL_1 = "https://comic.naver.com/webtoon/list?titleId=1"
+URL_2 = "https://comic.naver.com/webtoon/list?titleId=2"
+URL_3 = "https://comic.naver.com/webtoon/list?titleId=3"
+
+def failure(url: str, failure_type: FailureType) -> dict:
+    return CrawlFailure(url=url, failure_type=failure_type).to_dict()
+
+def test_load_restores_completed_and_permanent_failures(tmp_path):
+    filename = str(tmp_path / "checkpoint.jsonl")
+    checkpoint = CrawlCheckpoint(filename)
+    checkpoint.reset()
+    checkpoint.record_batch([URL_1, URL_2, URL_3], [
+        failure(URL_2, FailureType.LOGIN_REDIRECT),
+        failure(URL_3, FailureType.TIMEOUT)
+    ])
+
+    restored = CrawlCheckpoint(filename)
+    assert restored.load()
+    assert restored.cursor == 2
+    assert restored.is_done(URL_1)
+    assert restored.is_done(URL_2)
+    # 일시적인 실패는 이어서 실행할 때 다시 처리
+    assert not restored.is_done(URL_3)
+
+def test_url_variants_are_done(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.jsonl"))
+    checkpoint.record_batch([URL_1], [])
+    assert checkpoint.is_done("http://comic.naver.com/webtoon/list?tab=mon&titleId=1&page=2")
+
+def test_load_without_file(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "missing.jsonl"))
+    assert not checkpoint.load()
+    assert checkpoint.cursor == 0
+
+def test_load_skips_and_removes_truncated_line(tmp_path):
+    filename = tmp_path / "checkpoint.jsonl"
+    checkpoint = CrawlCheckpoint(str(filename))
+    checkpoint.record_batch([URL_1], [])
+    with open(filename, "a", encoding="utf-8") as f:
+        f.write('{"cursor": 2, "completed": ["')
+
+    restored = CrawlCheckpoint(str(filename))
+    assert restored.load()
+    assert restored.cursor == 1
+    lines = filename.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["completed"] == [URL_1]
+
+def test_load_rejects_other_plan(tmp_path):
+    filename = str(tmp_path / "checkpoint.jsonl")
+    plan_id = CrawlCheckpoint.compute_plan_id([URL_1, URL_2])
+    checkpoint = CrawlCheckpoint(filename)
+    checkpoint.reset(plan_id)
+    checkpoint.record_batch([URL_1], [])
+
+    assert CrawlCheckpoint(filename).load(plan_id)
+    other = CrawlCheckpoint(filename)
+    assert not other.load(CrawlCheckpoint.compute_plan_id([URL_1, URL_3]))
+    assert not other.is_done(URL_1)
+
+def test_plan_id_ignores_order_and_url_variants():
+    assert CrawlCheckpoint.compute_plan_id([URL_1, URL_2]) == CrawlCheckpoint.compute_plan_id([
+        URL_2, "http://comic.naver.com/webtoon/list?titleId=1&page=3", URL_1
+    ])
+
+def test_reset_removes_file(tmp_path):
+    filename = tmp_path / "checkpoint.jsonl"
+    checkpoint = CrawlCheckpoint(str(filename))
+    checkpoint.record_batch([URL_1], [])
+    checkpoint.reset()
+    assert not filename.exists()
+    assert not checkpoint.is_done(URL_1)
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+import pytest
+from crawler.batch import CrawlScheduler
+from crawler.batch.crawl_scheduler import KST
+from models.enums import DayOfWeek
+from modules.webtoon_url import PLATFORM_HOSTS, TITLE_PATH_PREFIXES
+
+MONDAY_MORNING = datetime(2026, 10, 19, 10, 0, tzinfo=KST)
+
+def url(title_id: str) -> str:
+    return f"https://comic.naver.com/webtoon/list?titleId={title_id}"
+
+@pytest.fixture
+def scheduler(tmp_path):
+    return CrawlScheduler(str(tmp_path / "schedule.json"))
+
+def test_release_day_starts_at_23_previous_day(scheduler):
+    assert scheduler.get_release_day(MONDAY_MORNING) == (DayOfWeek.MONDAY, datetime(2026, 10, 18, 23, 0, tzinfo=KST))
+    sunday_night = datetime(2026, 10, 18, 23, 30, tzinfo=KST)
+    assert scheduler.get_release_day(sunday_night)[0] == DayOfWeek.MONDAY
+    assert scheduler.get_release_day(sunday_night - timedelta(hours=1))[0] == DayOfWeek.SUNDAY
+
+def test_classify(scheduler):
+    assert scheduler.classify({"day_of_week": "MONDAY", "serialization_status": "ONGOING"}, DayOfWeek.MONDAY) == "today"
+    assert scheduler.classify({"day_of_week": "FRIDAY", "serialization_status": "ONGOING"}, DayOfWeek.MONDAY) == "ongoing"
+    assert scheduler.classify({"day_of_week": "MONDAY", "serialization_status": "HIATUS"}, DayOfWeek.MONDAY) == "ongoing"
+    assert scheduler.classify({"day_of_week": None, "serialization_status": "COMPLETED"}, DayOfWeek.MONDAY) == "completed"
+    assert scheduler.classify({"day_of_week": None, "serialization_status": "ONGOING"}, DayOfWeek.MONDAY) == "unknown"
+    assert scheduler.classify(None, DayOfWeek.MONDAY) == "unknown"
+
+def test_plan_orders_by_tier_and_skips_recent(scheduler):
+    metadata = {
+        ("NAVER", "1"): {"day_of_week": None, "serialization_status": "COMPLETED"},
+        ("NAVER", "2"): {"day_of_week": "FRIDAY", "serialization_status": "ONGOING"},
+        ("NAVER", "3"): {"day_of_week": "MONDAY", "serialization_status": "ONGOING"},
+        ("NAVER", "5"): {"day_of_week": "MONDAY", "serialization_status": "ONGOING"},
+        ("NAVER", "6"): {"day_of_week": "FRIDAY", "serialization_status": "ONGOING"},
+    }
+    # 6은 3일 전에 크롤링했으므로 간격(7일)이 지나지 않음, 5는 오늘 공개 이후 이미 크롤링함
+    scheduler.mark_crawled([url("6")], now=MONDAY_MORNING - timedelta(days=3))
+    scheduler.mark_crawled([url("5")], now=MONDAY_MORNING - timedelta(hours=1))
+    planned = scheduler.plan([url(n) for n in "123456"], metadata, now=MONDAY_MORNING)
+    assert planned == [url("3"), url("4"), url("2"), url("1")]
+    assert scheduler.plan([url(n) for n in "123456"], metadata, now=MONDAY_MORNING, budget=2) == [url("3"), url("4")]
+
+def test_plan_matches_metadata_by_platform(scheduler):
+    metadata = {("KAKAO", "1"): {"day_of_week": None, "serialization_status": "COMPLETED"}}
+    scheduler.mark_crawled([url("1")], now=MONDAY_MORNING - timedelta(days=2))
+    # 네이버 웹툰 1의 정보는 없으므로 완결(30일)이 아닌 정보 없음(1일) 간격이 적용됨
+    assert scheduler.plan([url("1")], metadata, now=MONDAY_MORNING) == [url("1")]
+
+def test_saved_times_survive_reload(scheduler):
+    scheduler.mark_crawled([url("1")], now=MONDAY_MORNING)
+    assert CrawlScheduler(scheduler.filename).get_last_crawled(url("1")) is None
+    scheduler.save()
+    assert CrawlScheduler(scheduler.filename).get_last_crawled(url("1")) == MONDAY_MORNING
+
+def test_platforms_sharing_an_id_keep_separate_times(scheduler, monkeypatch):
+    monkeypatch.setitem(PLATFORM_HOSTS, "webtoon.kakao.com", "kakao")
+    monkeypatch.setitem(TITLE_PATH_PREFIXES, "kakao", "/webtoon/")
+    kakao_url = "https://webtoon.kakao.com/webtoon/list?titleId=1"
+    metadata = {
+        ("NAVER", "1"): {"day_of_week": "FRIDAY", "serialization_status": "ONGOING"},
+        ("KAKAO", "1"): {"day_of_week": "FRIDAY", "serialization_status": "ONGOING"},
+    }
+    scheduler.mark_crawled([url("1")], now=MONDAY_MORNING - timedelta(days=1))
+    assert scheduler.get_last_crawled(kakao_url) is None
+    # 네이버 웹툰 1만 최근에 크롤링했으므로 카카오 웹툰 1은 여전히 기한이 됨
+    assert scheduler.plan([url("1"), kakao_url], metadata, now=MONDAY_MORNING) == [kakao_url]
@@ -0,0 +1,161 @@
+from typing import List, Tuple
+import pytest
+from crawler.batch.crawl_checkpoint import CrawlCheckpoint
+from crawler.webtoon_crawler_factory import WebtoonCrawlerFactory
+from crawler.tasks.episode_collector import EpisodeCollectorCrawler
+from crawler.sinks import MemoryResultSink, RepositoryResultSink
+from modules.sqlite_episode_repository import SqliteEpisodeRepository
+from modules.web_driver.common import IWebDriverManager
+from scrapers.common import IEpisodeScraper
+from models.episode import EpisodeDTO
+from models.enums import FailureType, Platform
+
+URL = "https://comic.naver.com/webtoon/list?titleId=1"
+
+class FakeDriver:
+    session_id = "fake"
+
+    def quit(self):
+        pass
+
+class FakeDriverManager(IWebDriverManager):
+    def setup_driver(self):
+        pass
+
+    def get_driver(self):
+        return FakeDriver()
+
+class FakeEpisodeScraper(IEpisodeScraper):
+    """페이지별 회차 번호 목록(최신 회차부터)을 돌려주는 스크래퍼
+
+    repeat_last_page가 True면 범위를 벗어난 페이지 요청에 마지막 페이지를 다시 돌려줌
+    """
+
+    PLATFORM_NAME = Platform.NAVER
+
+    def __init__(self, pages: List[List[int]], repeat_last_page: bool = False, fail_on_page: int = 0):
+        self.driver = None
+        self.pages = pages
+        self.repeat_last_page = repeat_last_page
+        self.fail_on_page = fail_on_page
+        self.requested_pages: List[int] = []
+
+    def fetch_episode_page(self, url: str, page: int) -> Tuple[bool, List[EpisodeDTO], bool]:
+        self.requested_pages.append(page)
+        if page == self.fail_on_page:
+            self.last_failure = FailureType.TIMEOUT
+            return False, [], False
+        self.last_failure = None
+        index = min(page, len(self.pages)) - 1 if self.repeat_last_page else page - 1
+        episode_nos = self.pages[index] if index < len(self.pages) else []
+        has_next = self.repeat_last_page or page < len(self.pages)
+        episodes = [EpisodeDTO("NAVER", "1", no, f"{no}화", None, None) for no in episode_nos]
+        return True, episodes, has_next
+
+@pytest.fixture
+def episode_repository(tmp_path):
+    repository = SqliteEpisodeRepository(str(tmp_path / "episodes.json"), str(tmp_path / "failures.json"))
+    yield repository
+    repository.close()
+
+class FakeWebDriverFactory:
+    def create_driver(self, environment=None, headless=True):
+        return FakeDriverManager()
+
+def create_crawler(scraper: FakeEpisodeScraper, episode_repository=None, **kwargs) -> EpisodeCollectorCrawler:
+    crawler = EpisodeCollectorCrawler(driver_manager=FakeDriverManager(), episode_repository=episode_repository,
+                                      web_driver_factory=FakeWebDriverFactory(), max_session_rss_mb=None, **kwargs)
+    crawler.scrapers = [scraper] + [
+        FakeEpisodeScraper(scraper.pages, scraper.repeat_last_page, scraper.fail_on_page)
+        for _ in crawler.scrapers[1:]
+    ]
+    crawler.scraper = scraper
+    return crawler
+
+def test_first_collection_reads_all_pages():
+    scraper = FakeEpisodeScraper([[5, 4], [3, 2], [1]])
+    success, episodes, failure_type = create_crawler(scraper).collect_title(URL)
+    assert success and failure_type is None
+    assert [episode.episode_no for episode in episodes] == [5, 4, 3, 2, 1]
+    assert scraper.requested_pages == [1, 2, 3]
+
+def test_stops_at_last_stored_episode(episode_repository):
+    episode_repository.append_success([EpisodeDTO("NAVER", "1", no, f"{no}화", None, None).to_dict() for no in (1, 2, 3)])
+    scraper = FakeEpisodeScraper([[5, 4], [3, 2], [1]])
+    success, episodes, _ = create_crawler(scraper, episode_repository).collect_title(URL)
+    assert success
+    assert [episode.episode_no for episode in episodes] == [5, 4]
+    assert scraper.requested_pages == [1, 2]
+
+def test_stops_when_page_repeats():
+    scraper = FakeEpisodeScraper([[3, 2], [1]], repeat_last_page=True)
+    success, episodes, _ = create_crawler(scraper).collect_title(URL)
+    assert success
+    assert [episode.episode_no for episode in episodes] == [3, 2, 1]
+    assert scraper.requested_pages == [1, 2, 3]
+
+def test_page_limit_fails_title():
+    scraper = FakeEpisodeScraper([[no] for no in range(10, 0, -1)])
+    success, episodes, failure_type = create_crawler(scraper, max_pages_per_title=3).collect_title(URL)
+    assert (success, episodes, failure_type) == (False, [], FailureType.SELECTOR_MISS)
+    assert scraper.requested_pages == [1, 2, 3]
+
+def test_failed_page_fails_title():
+    scraper = FakeEpisodeScraper([[3], [2], [1]], fail_on_page=2)
+    assert create_crawler(scraper).collect_title(URL) == (False, [], FailureType.TIMEOUT)
+
+def test_run_saves_oldest_first_and_clears_recovered_failures(episode_repository):
+    episode_repository.append_failure([{"url": URL, "error": "timeout", "failure_type": "timeout", "attempts": 3}])
+    sink = MemoryResultSink()
+    crawler = create_crawler(FakeEpisodeScraper([[2, 1]]), episode_repository,
+                             sinks=[RepositoryResultSink(episode_repository), sink])
+    crawler.initialize([URL])
+    crawler.run()
+    episodes, failures = sink.get_results()
+    assert [episode["episode_no"] for episode in episodes] == [1, 2]
+    assert failures == []
+    assert episode_repository.get_last_episode_no("NAVER", "1") == 2
+    assert list(episode_repository.iter_failures()) == []
+
+    # 새 회차가 없어도 성공한 웹툰의 실패 기록은 지워짐
+    episode_repository.append_failure([{"url": URL, "error": "timeout", "failure_type": "timeout", "attempts": 3}])
+    crawler.initialize([URL])
+    crawler.run()
+    assert crawler.get_summary()["episodes"] == 0
+    assert list(episode_repository.iter_failures()) == []
+
+def test_pool_sessions_share_titles():
+    urls = [f"https://comic.naver.com/webtoon/list?titleId={title_id}" for title_id in range(1, 9)]
+    crawler = create_crawler(FakeEpisodeScraper([[2, 1]]), pool_size=2)
+    crawler.initialize(urls)
+    crawler.run()
+
+    episodes, failures = crawler.get_results()
+    assert len(episodes) == 16 and failures == []
+    assert all(scraper.requested_pages for scraper in crawler.scrapers)
+    assert crawler.get_summary() == {"titles": 8, "episodes": 16, "failures": 0, "pages": 8}
+
+def test_resume_skips_checkpointed_titles(tmp_path):
+    urls = [f"https://comic.naver.com/webtoon/list?titleId={title_id}" for title_id in range(1, 5)]
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.jsonl"))
+    checkpoint.reset(CrawlCheckpoint.compute_plan_id(urls))
+    checkpoint.record_batch(urls[:2], [])
+
+    scraper = FakeEpisodeScraper([[1]])
+    crawler = create_crawler(scraper, batch_size=2, checkpoint=checkpoint)
+    crawler.initialize(urls, resume=True)
+    crawler.run()
+    assert crawler.get_summary()["titles"] == 2
+    assert scraper.requested_pages == [1, 1]
+
+def test_factory_passes_pool_and_checkpoint(tmp_path):
+    crawler = WebtoonCrawlerFactory(FakeWebDriverFactory()).create_crawler(
+        "collect_episodes",
+        pool_size=3,
+        checkpoint_filename=str(tmp_path / "checkpoint.jsonl"),
+        driver_manager=FakeDriverManager()
+    )
+    assert isinstance(crawler, EpisodeCollectorCrawler)
+    assert len(crawler.driver_pool) == 3
+    assert crawler.checkpoint.filename == str(tmp_path / "checkpoint.jsonl")
+    crawler.shutdown()
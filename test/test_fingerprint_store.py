@@ -0,0 +1,58 @@
+from modules.fingerprint_store import FingerprintStore
+from modules.webtoon_url import TitleKey
+from scrapers.platforms.naver_webtoon_scraper import NaverWebtoonScraper
+from scrapers.platforms.naver_webtoon_http_scraper import NaverWebtoonHttpScraper
+
+def test_update_is_kept_in_memory_until_save(tmp_path):
+    filename = str(tmp_path / "fingerprints.json")
+    store = FingerprintStore(filename)
+    store.update(TitleKey("naver", "1"), "abc")
+    assert store.get(TitleKey("naver", "1")) == "abc"
+    assert FingerprintStore(filename).get(TitleKey("naver", "1")) is None
+
+    store.save()
+    assert FingerprintStore(filename).get(TitleKey("naver", "1")) == "abc"
+
+def test_platforms_sharing_an_id_do_not_collide(tmp_path):
+    store = FingerprintStore(str(tmp_path / "fingerprints.json"))
+    store.update(TitleKey("naver", "1"), "naver")
+    store.update(TitleKey("kakao", "1"), "kakao")
+    assert store.get(TitleKey("naver", "1")) == "naver"
+    assert store.get(TitleKey("kakao", "1")) == "kakao"
+
+def test_invalid_file_is_treated_as_empty(tmp_path):
+    filename = tmp_path / "fingerprints.json"
+    filename.write_text("{", encoding="utf-8")
+    assert FingerprintStore(str(filename)).get(TitleKey("naver", "1")) is None
+
+class FakeDriver:
+    """지문 계산용 스크립트 결과만 돌려주는 드라이버"""
+    current_url = "https://comic.naver.com/webtoon/list?titleId=1"
+
+    def execute_script(self, script, *args):
+        return {
+            "currentUrl": self.current_url,
+            "title": "제목\n작가명",
+            "metaText": "월요웹툰 ∙ 15세 이용가",
+            "absenceTexts": [],
+            "episodeCountText": "총 120화"
+        }
+
+    def find_element(self, by, value):
+        return object()
+
+    def find_elements(self, by, value):
+        return [object()]
+
+def test_http_and_selenium_fingerprints_match():
+    scraper = NaverWebtoonScraper(FakeDriver())
+    http_scraper = NaverWebtoonHttpScraper(session=object())
+    info = {
+        "titleName": "제목 ",
+        "publishDayOfWeekList": ["MONDAY"],
+        "age": {"type": "RATE_15", "description": "15세 이용가"},
+        "rest": False,
+        "finished": False
+    }
+    assert scraper.get_fingerprint() == http_scraper.compute_fingerprint(info, {"totalCount": 120})
+    assert scraper.get_fingerprint() != http_scraper.compute_fingerprint(info, {"totalCount": 121})
@@ -0,0 +1,52 @@
+import pytest
+from crawler.batch import HostRateController
+
+URL = "https://comic.naver.com/webtoon/list?titleId=1"
+HOST = "comic.naver.com"
+
+def test_limit_grows_additively_on_success():
+    controller = HostRateController(max_limit=4, initial_limit=2)
+    for _ in range(2):
+        controller.release(controller.acquire(URL), 0.1, HostRateController.OUTCOME_SUCCESS)
+    # 성공할 때마다 1/한도씩 늘어나므로 한도만큼 성공하면 약 1 늘어남
+    assert controller.summary()[HOST]["limit"] == pytest.approx(2 + 1 / 2 + 1 / 2.5, abs=0.01)
+
+def test_limit_never_exceeds_max():
+    controller = HostRateController(max_limit=3)
+    for _ in range(50):
+        controller.release(controller.acquire(URL), 0.1, HostRateController.OUTCOME_SUCCESS)
+    assert controller.summary()[HOST]["limit"] == 3.0
+
+def test_timeout_halves_limit_once_per_latency_window():
+    controller = HostRateController(max_limit=4, initial_limit=4)
+    controller.release(controller.acquire(URL), 10.0, HostRateController.OUTCOME_SUCCESS)
+    limit = controller.summary()[HOST]["limit"]
+
+    controller.release(controller.acquire(URL), None, HostRateController.OUTCOME_TIMEOUT)
+    controller.release(controller.acquire(URL), None, HostRateController.OUTCOME_TIMEOUT)
+    summary = controller.summary()[HOST]
+    # 평균 지연(10초) 안의 두 번째 타임아웃은 같은 혼잡으로 보고 다시 줄이지 않음
+    assert summary["limit"] == pytest.approx(limit / 2, abs=0.01)
+    assert summary["decreases"] == 1
+    assert summary["timeouts"] == 2
+
+def test_limit_never_goes_below_min():
+    controller = HostRateController(max_limit=4, min_limit=1, initial_limit=1)
+    controller.release(controller.acquire(URL), None, HostRateController.OUTCOME_TIMEOUT)
+    assert controller.summary()[HOST]["limit"] == 1.0
+
+def test_redirects_decrease_only_when_consecutive():
+    controller = HostRateController(max_limit=4, initial_limit=4, block_threshold=3, block_pause=0)
+    for outcome in (HostRateController.OUTCOME_BLOCKED, HostRateController.OUTCOME_BLOCKED,
+                    HostRateController.OUTCOME_ERROR, HostRateController.OUTCOME_BLOCKED):
+        controller.release(controller.acquire(URL), None, outcome)
+    assert controller.summary()[HOST]["decreases"] == 0
+
+    for _ in range(2):
+        controller.release(controller.acquire(URL), None, HostRateController.OUTCOME_BLOCKED)
+    assert controller.summary()[HOST]["decreases"] == 1
+    assert controller.summary()[HOST]["limit"] == 2.0
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        HostRateController(max_limit=1, min_limit=2)
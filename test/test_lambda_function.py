@@ -0,0 +1,20 @@
+import os
+import importlib.util
+
+# test/lambda_function.py와 모듈 이름이 같으므로 src의 파일을 경로로 직접 불러옴
+LAMBDA_FUNCTION_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "lambda_function.py")
+spec = importlib.util.spec_from_file_location("src_lambda_function", LAMBDA_FUNCTION_PATH)
+lambda_function = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(lambda_function)
+build_batch_item_failures = lambda_function.build_batch_item_failures
+
+def test_only_failed_records_are_reported():
+    records = [{"messageId": "a"}, {"messageId": "b"}, {"messageId": "c"}]
+    results = [{"status": "SUCCESS"}, {"status": "FAILED"}, {"status": "ERROR"}]
+    assert build_batch_item_failures(records, results) == [{"itemIdentifier": "b"}, {"itemIdentifier": "c"}]
+
+def test_records_without_message_id_are_skipped():
+    assert build_batch_item_failures([{}], [{"status": "FAILED"}]) == []
+
+def test_all_success_reports_nothing():
+    assert build_batch_item_failures([{"messageId": "a"}], [{"status": "SUCCESS"}]) == []
@@ -0,0 +1,116 @@
+import os
+import itertools
+from types import SimpleNamespace
+import pytest
+from modules.web_driver import IWebDriverManager, ManagedDriverSession
+
+class FakeDriver:
+    """execute_script 응답 여부만 흉내 내는 드라이버"""
+    _ids = itertools.count(1)
+
+    def __init__(self, pid=None):
+        self.session_id = f"session-{next(self._ids)}"
+        self.alive = True
+        self.quit_count = 0
+        self.service = SimpleNamespace(process=SimpleNamespace(pid=pid))
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("세션 종료됨")
+        return "complete"
+
+    def quit(self):
+        self.quit_count += 1
+
+class FakeDriverManager(IWebDriverManager):
+    def __init__(self, pid=None):
+        self.pid = pid
+        self.created = []
+        self.released = []
+        self.discarded = []
+
+    def setup_driver(self):
+        pass
+
+    def get_driver(self):
+        driver = FakeDriver(self.pid)
+        self.created.append(driver)
+        return driver
+
+    def release_driver(self, driver):
+        self.released.append(driver)
+
+    def discard_driver(self, driver):
+        self.discarded.append(driver)
+
+def process_pages(session: ManagedDriverSession, count: int) -> None:
+    for _ in range(count):
+        session.before_page()
+        session.after_page()
+
+def test_restarts_after_max_pages():
+    manager = FakeDriverManager()
+    session = ManagedDriverSession(manager, max_pages=3, max_rss_mb=None)
+    first = session.driver
+    process_pages(session, 3)
+    assert session.driver is first
+
+    assert session.before_page() is not first
+    assert manager.discarded == [first]
+    assert session.pages == 0
+    assert session.summary() == {"pages": 3, "recycled_pages": 1, "recycled_memory": 0, "recycled_crash": 0}
+
+def test_restarts_when_rss_exceeds_limit(monkeypatch):
+    manager = FakeDriverManager()
+    session = ManagedDriverSession(manager, max_pages=None, max_rss_mb=100, memory_check_interval=2)
+    rss_values = iter([50.0, 150.0])
+    monkeypatch.setattr(session, "get_rss_mb", lambda: next(rss_values))
+    first = session.driver
+
+    # 2페이지마다만 확인: 2페이지 뒤 50MB는 유지, 4페이지 뒤 150MB는 재시작
+    process_pages(session, 4)
+    assert session.driver is first
+    session.before_page()
+    assert session.driver is not first
+    assert session.recycle_counts[ManagedDriverSession.RECYCLE_MEMORY] == 1
+
+def test_rss_is_read_from_proc():
+    if not os.path.isdir("/proc"):
+        pytest.skip("/proc이 없는 환경")
+    session = ManagedDriverSession(FakeDriverManager(pid=os.getpid()), max_rss_mb=None)
+    assert session.get_rss_mb() > 0
+
+def test_rss_is_unknown_without_process():
+    assert ManagedDriverSession(FakeDriverManager(), max_rss_mb=None).get_rss_mb() is None
+
+def test_restart_if_dead_only_restarts_crashed_session():
+    manager = FakeDriverManager()
+    session = ManagedDriverSession(manager, max_rss_mb=None)
+    first = session.driver
+    assert not session.restart_if_dead()
+
+    first.alive = False
+    assert session.restart_if_dead()
+    assert session.driver is not first
+    assert manager.discarded == [first]
+    assert session.recycle_counts[ManagedDriverSession.RECYCLE_CRASH] == 1
+
+def test_session_without_id_is_dead():
+    session = ManagedDriverSession(FakeDriverManager(), max_rss_mb=None)
+    session.driver.session_id = None
+    assert not session.is_alive()
+
+def test_discard_errors_do_not_stop_restart():
+    class FailingManager(FakeDriverManager):
+        def discard_driver(self, driver):
+            raise RuntimeError("종료 실패")
+
+    session = ManagedDriverSession(FailingManager(), max_rss_mb=None)
+    first = session.driver
+    assert session.restart(ManagedDriverSession.RECYCLE_PAGES) is not first
+
+def test_release_returns_current_driver():
+    manager = FakeDriverManager()
+    session = ManagedDriverSession(manager, max_rss_mb=None)
+    session.release()
+    assert manager.released == [session.driver]
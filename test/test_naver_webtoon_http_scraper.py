@@ -0,0 +1,140 @@
+import pytest
+import requests
+from scrapers.platforms.naver_webtoon_http_scraper import NaverWebtoonHttpScraper
+from models.enums import FailureType
+
+URL = "https://comic.naver.com/webtoon/list?titleId=183559"
+
+INFO = {
+    "titleName": " 신의 탑 ",
+    "thumbnailUrl": "https://image-comic.pstatic.net/183559.jpg",
+    "synopsis": "줄거리 ",
+    "rest": False,
+    "finished": False,
+    "publishDayOfWeekList": ["MONDAY"],
+    "age": {"type": "RATE_15", "description": "15세 이용가"},
+    "curationTagList": [{"tagName": "#판타지"}, {"tagName": " "}],
+    "communityArtists": [{
+        "artistId": 1,
+        "name": "SIU ",
+        "profilePageUrl": "https://comic.naver.com/community/u/_abc?tab=1",
+        "artistTypeList": ["ARTIST_WRITER", "ARTIST_PAINTER"]
+    }]
+}
+ARTICLE_LIST = {
+    "totalCount": 600,
+    "articleList": [{"serviceDateDescription": "24.05.13"}]
+}
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self.payload = payload
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} 오류", response=self)
+
+    def json(self):
+        return self.payload
+
+class StubSession:
+    """API URL별로 정해진 응답(또는 예외)을 돌려주는 requests.Session 대용"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, allow_redirects=True):
+        self.calls.append((url, params))
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+def create_scraper(responses, driver=None) -> NaverWebtoonHttpScraper:
+    scraper = NaverWebtoonHttpScraper(driver=driver, session=StubSession(responses))
+    for option in ("title", "thumbnail", "story", "day", "day_age", "status", "genres", "authors",
+                   "unique_id", "episode_count"):
+        setattr(scraper, f"scrape_{option}", True)
+    return scraper
+
+def good_responses():
+    return {
+        NaverWebtoonHttpScraper.INFO_API_URL: FakeResponse(payload=INFO),
+        NaverWebtoonHttpScraper.ARTICLE_LIST_API_URL: FakeResponse(payload=ARTICLE_LIST),
+    }
+
+def test_parses_api_response():
+    success, webtoon = create_scraper(good_responses()).fetch_webtoon(URL)
+    assert success
+    assert webtoon.title == "신의 탑"
+    assert webtoon.external_id == "183559"
+    assert webtoon.description == "줄거리"
+    assert webtoon.day_of_week == "MONDAY"
+    assert webtoon.age_rating == "AGE_15"
+    assert webtoon.serialization_status == "ONGOING"
+    assert webtoon.episode_count == 600
+    assert webtoon.genres == ["판타지"]
+    assert [(author.uid, author.name, author.role) for author in webtoon.authors] == [("_abc", "SIU", "BOTH")]
+
+def test_completed_webtoon_has_no_day():
+    responses = good_responses()
+    responses[NaverWebtoonHttpScraper.INFO_API_URL] = FakeResponse(payload={**INFO, "finished": True})
+    _, webtoon = create_scraper(responses).fetch_webtoon(URL)
+    assert webtoon.serialization_status == "COMPLETED"
+    assert webtoon.day_of_week is None
+
+def test_malformed_response_is_selector_miss():
+    responses = good_responses()
+    responses[NaverWebtoonHttpScraper.INFO_API_URL] = FakeResponse(payload={"synopsis": "제목 없음"})
+    scraper = create_scraper(responses)
+    assert scraper.fetch_webtoon(URL) == (False, None)
+    assert scraper.last_failure == FailureType.SELECTOR_MISS
+
+@pytest.mark.parametrize("response, failure_type", [
+    (FakeResponse(429), FailureType.THROTTLED),
+    (FakeResponse(404), FailureType.NOT_FOUND),
+    (FakeResponse(500), FailureType.HTTP_ERROR),
+    (FakeResponse(302, headers={"Location": "https://nid.naver.com/nidlogin.login"}), FailureType.LOGIN_REDIRECT),
+    (requests.Timeout("시간 초과"), FailureType.TIMEOUT),
+])
+def test_http_errors_are_classified(response, failure_type):
+    scraper = create_scraper({NaverWebtoonHttpScraper.INFO_API_URL: response})
+    assert scraper.fetch_webtoon(URL) == (False, None)
+    assert scraper.last_failure == failure_type
+
+class StubFallbackScraper:
+    last_failure = None
+
+    def __init__(self, result):
+        self.result = result
+        self.urls = []
+
+    def fetch_webtoon(self, url):
+        self.urls.append(url)
+        return self.result
+
+    def fetch_webtoon_if_changed(self, url, known_fingerprint=None):
+        self.urls.append(url)
+        return (*self.result, "fallback")
+
+def test_falls_back_to_selenium_scraper():
+    scraper = create_scraper({NaverWebtoonHttpScraper.INFO_API_URL: FakeResponse(500)}, driver=object())
+    scraper._fallback_scraper = StubFallbackScraper((True, "webtoon"))
+    assert scraper.fetch_webtoon(URL) == (True, "webtoon")
+    assert scraper.fetch_webtoon_if_changed(URL, "old") == (True, "webtoon", "fallback")
+    assert scraper._fallback_scraper.urls == [URL, URL]
+    assert scraper.last_failure is None
+
+def test_unchanged_fingerprint_skips_build():
+    scraper = create_scraper(good_responses())
+    _, _, fingerprint = scraper.fetch_webtoon_if_changed(URL)
+    session = scraper.session
+    session.calls.clear()
+    assert scraper.fetch_webtoon_if_changed(URL, fingerprint) == (True, None, fingerprint)
+    # info와 회차 목록 첫 페이지만 요청
+    assert [url for url, _ in session.calls] == [
+        NaverWebtoonHttpScraper.INFO_API_URL, NaverWebtoonHttpScraper.ARTICLE_LIST_API_URL
+    ]
@@ -0,0 +1,83 @@
+from scrapers.platforms.naver_webtoon_scraper import NaverWebtoonScraper
+from scrapers.webtoon_scraper_factory import WebtoonScraperFactory
+from models.enums import FailureType
+
+URL = "https://comic.naver.com/webtoon/list?titleId=183559"
+
+# EXTRACT_FIELDS_SCRIPT가 실제 페이지에서 반환하는 형태의 결과
+SCRIPT_RESULT = {
+    "currentUrl": URL,
+    "title": "신의 탑\nSIU",
+    "thumbnail": "https://image-comic.pstatic.net/183559.jpg",
+    "story": " 자신의 모든 것이었던 소녀를 쫓아 탑에 들어온 소년 ",
+    "metaText": "월요웹툰 ∙ 15세 이용가",
+    "absenceTexts": [],
+    "genres": ["#판타지", "#액션", " "],
+    "authors": [
+        {"href": "https://comic.naver.com/community/u/_abc?tab=1", "name": "SIU ", "text": "글/그림"},
+        {"href": "https://example.com/unknown", "name": "?", "text": "글"}
+    ]
+}
+
+class FakeDriver:
+    """페이지 이동과 execute_script 호출을 기록하는 드라이버"""
+
+    def __init__(self, script_result):
+        self.script_result = script_result
+        self.current_url = ""
+        self.scripts = []
+
+    def get(self, url):
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return dict(self.script_result)
+
+    def find_element(self, by, value):
+        return object()
+
+    def find_elements(self, by, value):
+        return [object()]
+
+def test_factory_scrapers_use_script_extraction():
+    for create in (WebtoonScraperFactory.create_basic_info_scraper,
+                   WebtoonScraperFactory.create_status_scraper,
+                   WebtoonScraperFactory.create_full_info_scraper):
+        assert create(FakeDriver({})).extraction_mode == NaverWebtoonScraper.EXTRACTION_MODE_SCRIPT
+    # 빌더를 직접 구성하면 기본은 getter 방식
+    assert WebtoonScraperFactory.create_builder(FakeDriver({})).build().extraction_mode == NaverWebtoonScraper.EXTRACTION_MODE_GETTER
+
+def test_script_result_is_parsed():
+    driver = FakeDriver(SCRIPT_RESULT)
+    success, webtoon = WebtoonScraperFactory.create_basic_info_scraper(driver).fetch_webtoon(URL)
+
+    assert success
+    # 요청한 필드를 한 번의 스크립트 호출로 읽음
+    assert [script for script, _ in driver.scripts] == [NaverWebtoonScraper.EXTRACT_FIELDS_SCRIPT]
+    _, (_, wanted) = driver.scripts[0]
+    assert wanted["meta"] and wanted["authors"] and not wanted["episodeCount"]
+
+    assert webtoon.title == "신의 탑"
+    assert webtoon.external_id == "183559"
+    assert webtoon.description == "자신의 모든 것이었던 소녀를 쫓아 탑에 들어온 소년"
+    assert webtoon.day_of_week == "MONDAY"
+    assert webtoon.serialization_status == "ONGOING"
+    assert webtoon.genres == ["판타지", "액션"]
+    assert [(author.uid, author.name, author.role) for author in webtoon.authors] == [("_abc", "SIU", "BOTH")]
+
+def test_hiatus_and_completed_status_from_script():
+    driver = FakeDriver({**SCRIPT_RESULT, "absenceTexts": ["휴재"]})
+    _, webtoon = WebtoonScraperFactory.create_status_scraper(driver).fetch_webtoon(URL)
+    assert webtoon.serialization_status == "HIATUS"
+
+    driver = FakeDriver({**SCRIPT_RESULT, "metaText": "월요웹툰 ∙ 완결 ∙ 15세 이용가"})
+    _, webtoon = WebtoonScraperFactory.create_basic_info_scraper(driver).fetch_webtoon(URL)
+    assert webtoon.serialization_status == "COMPLETED"
+    assert webtoon.day_of_week is None
+
+def test_missing_required_field_is_selector_miss():
+    driver = FakeDriver({**SCRIPT_RESULT, "title": None})
+    scraper = WebtoonScraperFactory.create_basic_info_scraper(driver)
+    assert scraper.fetch_webtoon(URL) == (False, None)
+    assert scraper.last_failure == FailureType.SELECTOR_MISS
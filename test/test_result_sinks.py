@@ -0,0 +1,78 @@
+import json
+from crawler.batch import CrawlScheduler
+from crawler.sinks import JsonlResultSink, RepositoryResultSink, ScheduleResultSink
+
+URL_1 = "https://comic.naver.com/webtoon/list?titleId=1"
+URL_2 = "https://comic.naver.com/webtoon/list?titleId=2"
+URL_3 = "https://comic.naver.com/webtoon/list?titleId=3"
+
+SUCCESS = [{"platform": "NAVER", "external_id": "1", "link": URL_1}]
+FAILURE = [{"url": URL_2, "failure_type": "timeout", "attempts": 3}]
+UNCHANGED = [{"url": URL_3, "external_id": "3", "fingerprint": "abc"}]
+
+class FakeRepository:
+    """append_* 호출을 기록하는 저장소"""
+
+    def __init__(self):
+        self.calls = []
+
+    def append_success(self, data_list):
+        self.calls.append(("success", data_list))
+
+    def append_failure(self, data_list):
+        self.calls.append(("failure", data_list))
+
+class FakeRepositoryWithUnchanged(FakeRepository):
+    def append_unchanged(self, data_list):
+        self.calls.append(("unchanged", data_list))
+
+def test_repository_sink_writes_each_batch():
+    repository = FakeRepositoryWithUnchanged()
+    sink = RepositoryResultSink(repository)
+    sink.write_batch(SUCCESS, FAILURE, UNCHANGED)
+    assert repository.calls == [("success", SUCCESS), ("failure", FAILURE), ("unchanged", UNCHANGED)]
+
+def test_repository_sink_skips_empty_batches():
+    repository = FakeRepositoryWithUnchanged()
+    RepositoryResultSink(repository).write_batch([], FAILURE, [])
+    assert repository.calls == [("failure", FAILURE)]
+
+def test_repository_sink_without_append_unchanged():
+    repository = FakeRepository()
+    RepositoryResultSink(repository).write_batch(SUCCESS, [], UNCHANGED)
+    assert repository.calls == [("success", SUCCESS)]
+
+def test_schedule_sink_marks_success_and_unchanged_only(tmp_path):
+    filename = str(tmp_path / "crawl_schedule.json")
+    scheduler = CrawlScheduler(filename)
+    sink = ScheduleResultSink(scheduler)
+    sink.write_batch(SUCCESS, FAILURE, UNCHANGED)
+
+    assert scheduler.get_last_crawled(URL_1) is not None
+    assert scheduler.get_last_crawled(URL_3) is not None
+    # 실패한 웹툰은 다음 실행에서 다시 일정에 포함되도록 기록하지 않음
+    assert scheduler.get_last_crawled(URL_2) is None
+
+    # close()에서 파일에 저장
+    assert CrawlScheduler(filename).get_last_crawled(URL_1) is None
+    sink.close()
+    assert CrawlScheduler(filename).get_last_crawled(URL_1) is not None
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+def test_jsonl_sink_appends_batches_to_separate_files(tmp_path):
+    success_path, failure_path, unchanged_path = (tmp_path / "success.jsonl", tmp_path / "failure.jsonl",
+                                                  tmp_path / "unchanged.jsonl")
+    sink = JsonlResultSink(str(success_path), str(failure_path), str(unchanged_path))
+    sink.write_batch(SUCCESS, FAILURE, UNCHANGED)
+    sink.write_batch(SUCCESS, [], [])
+
+    assert read_jsonl(success_path) == SUCCESS + SUCCESS
+    assert read_jsonl(failure_path) == FAILURE
+    assert read_jsonl(unchanged_path) == UNCHANGED
+
+def test_jsonl_sink_without_unchanged_file(tmp_path):
+    sink = JsonlResultSink(str(tmp_path / "success.jsonl"), str(tmp_path / "failure.jsonl"))
+    sink.write_batch([], [], UNCHANGED)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,33 @@
+import random
+import pytest
+from crawler.batch import RetryQueue
+
+def test_delay_grows_exponentially_with_jitter():
+    queue = RetryQueue(base_delay=1.0, max_delay=30.0, rng=random.Random(0))
+    for attempts, delay in ((1, 1.0), (2, 2.0), (3, 4.0), (6, 30.0)):
+        for _ in range(20):
+            assert delay / 2 <= queue.get_delay(attempts) <= delay
+
+def test_push_stops_at_max_attempts():
+    queue = RetryQueue(max_attempts=3, base_delay=0)
+    assert queue.push("a", 1)
+    assert queue.push("b", 2)
+    assert not queue.push("c", 3)
+    assert len(queue) == 2
+    assert queue.scheduled_count == 2
+
+def test_pop_ready_returns_urls_in_ready_order():
+    queue = RetryQueue(max_attempts=5, base_delay=0)
+    queue.push("a", 1)
+    queue.push("b", 2)
+    assert sorted(queue.pop_ready()) == [("a", 1), ("b", 2)]
+    assert queue.pop_ready() == []
+
+def test_pop_ready_waits_for_earliest_retry():
+    queue = RetryQueue(base_delay=0.02, max_delay=0.02, rng=random.Random(0))
+    queue.push("a", 1)
+    assert queue.pop_ready() == [("a", 1)]
+
+def test_invalid_max_attempts():
+    with pytest.raises(ValueError):
+        RetryQueue(max_attempts=0)
@@ -0,0 +1,103 @@
+import json
+import pytest
+from modules.sqlite_webtoon_repository import SqliteWebtoonRepository
+
+URL = "https://comic.naver.com/webtoon/list?titleId=1"
+
+def make_record(**overrides) -> dict:
+    record = {
+        "title": "제목",
+        "external_id": "1",
+        "platform": "NAVER",
+        "day_of_week": "MONDAY",
+        "thumbnail_url": "https://example.com/1.jpg",
+        "link": URL,
+        "age_rating": "ALL",
+        "description": "줄거리",
+        "serialization_status": "ONGOING",
+        "episode_count": 10,
+        "platform_rating": 0.0,
+        "publish_start_date": "2020-01-01",
+        "last_updated_date": "2024-01-01",
+        "authors": [
+            {"uid": 123, "name": "작가", "role": "WRITER"},
+            {"uid": "abc", "name": "그림", "role": "ARTIST"},
+            {"uid": None, "name": "원작", "role": "ORIGINAL"}
+        ],
+        "genres": ["판타지", "액션"]
+    }
+    record.update(overrides)
+    return record
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = SqliteWebtoonRepository(str(tmp_path / "webtoons.json"), str(tmp_path / "failures.json"))
+    yield repository
+    repository.close()
+
+def test_upsert_overwrites_existing_webtoon(repository):
+    repository.append_success([make_record()])
+    repository.append_success([make_record(title="새 제목", genres=["액션"])])
+    assert repository.count() == 1
+    stored = repository.get("1", "NAVER")
+    assert stored["title"] == "새 제목"
+    assert stored["genres"] == ["액션"]
+
+def test_partial_record_keeps_stored_columns(repository):
+    repository.append_success([make_record()])
+    # create_basic_info_scraper는 연령 등급, 에피소드 수, 날짜를 수집하지 않음
+    repository.append_success([make_record(
+        title="새 제목", age_rating=None, episode_count=None, publish_start_date=None, last_updated_date=None,
+        authors=[], genres=[]
+    )])
+    assert repository.get("1") == make_record(title="새 제목")
+
+def test_completed_webtoon_clears_day_of_week(repository):
+    repository.append_success([make_record()])
+    repository.append_success([make_record(day_of_week=None, serialization_status="COMPLETED")])
+    stored = repository.get("1")
+    assert stored["day_of_week"] is None
+    assert stored["serialization_status"] == "COMPLETED"
+
+def test_compact_exports_original_types(repository, tmp_path):
+    record = make_record()
+    repository.append_success([record])
+    repository.compact()
+    with open(tmp_path / "webtoons.json", encoding="utf-8") as f:
+        assert json.load(f) == [record]
+
+def test_success_clears_failure_of_same_platform_only(repository):
+    repository.append_failure([{"url": URL, "error": "timeout", "failure_type": "timeout", "attempts": 3}])
+    repository.append_failure([{"url": URL, "error": "timeout", "failure_type": "timeout", "attempts": 4}])
+    assert [failure["attempts"] for failure in repository.iter_failures()] == [4]
+
+    repository.append_success([make_record(platform="KAKAO")])
+    assert len(list(repository.iter_failures())) == 1
+    repository.append_success([make_record()])
+    assert list(repository.iter_failures()) == []
+
+def test_maps_are_keyed_by_platform_and_external_id(repository):
+    repository.append_success([make_record(), make_record(platform="KAKAO", serialization_status="COMPLETED")])
+    assert repository.get_serialization_statuses() == {("NAVER", "1"): "ONGOING", ("KAKAO", "1"): "COMPLETED"}
+    assert repository.get_crawl_metadata("NAVER") == {
+        ("NAVER", "1"): {"day_of_week": "MONDAY", "serialization_status": "ONGOING"}
+    }
+
+def test_update_serialization_status(repository):
+    repository.append_success([make_record()])
+    updated = repository.update_serialization_status([
+        {"platform": "NAVER", "external_id": "1", "serialization_status": "HIATUS"},
+        {"platform": "NAVER", "external_id": "2", "serialization_status": "HIATUS"}
+    ])
+    assert updated == 1
+    assert repository.get("1")["serialization_status"] == "HIATUS"
+
+def test_existing_json_is_imported(tmp_path):
+    record = make_record()
+    with open(tmp_path / "webtoons.json", "w", encoding="utf-8") as f:
+        json.dump([record], f)
+    repository = SqliteWebtoonRepository(str(tmp_path / "webtoons.json"), str(tmp_path / "failures.json"))
+    try:
+        assert list(repository.find(serialization_status="ONGOING")) == [record]
+    finally:
+        repository.close()
@@ -0,0 +1,43 @@
+from crawler.tasks.init_webtoon_crawler import InitWebtoonCrawler
+from crawler.tasks.status_checker import StatusCheckCrawler
+
+def status_record(title_id: str, status: str) -> dict:
+    return {
+        "platform": "NAVER",
+        "external_id": title_id,
+        "link": f"https://comic.naver.com/webtoon/list?titleId={title_id}",
+        "serialization_status": status
+    }
+
+def create_crawler(known_statuses: dict) -> StatusCheckCrawler:
+    # 드라이버 풀 없이 상태 비교만 확인
+    crawler = StatusCheckCrawler.__new__(StatusCheckCrawler)
+    crawler.known_statuses = dict(known_statuses)
+    crawler.status_unchanged_count = 0
+    return crawler
+
+def test_only_changed_statuses_are_returned(monkeypatch):
+    failure = {"url": "https://comic.naver.com/webtoon/list?titleId=4", "failure_type": "timeout"}
+    monkeypatch.setattr(InitWebtoonCrawler, "_process_batch", lambda self, url_batch: ([
+        status_record("1", "ONGOING"),
+        status_record("2", "COMPLETED"),
+        status_record("3", "HIATUS")
+    ], [failure]))
+    crawler = create_crawler({("NAVER", "1"): "ONGOING", ("NAVER", "2"): "ONGOING", ("KAKAO", "3"): "HIATUS"})
+
+    changed, failures = crawler._process_batch([])
+    assert [(item["external_id"], item["previous_status"], item["serialization_status"]) for item in changed] == [
+        ("2", "ONGOING", "COMPLETED"),
+        # 다른 플랫폼의 같은 ID는 비교 기준이 아님
+        ("3", None, "HIATUS")
+    ]
+    assert failures == [failure]
+    assert crawler.status_unchanged_count == 1
+    assert crawler.known_statuses[("NAVER", "2")] == "COMPLETED"
+
+def test_repeated_status_is_reported_once(monkeypatch):
+    monkeypatch.setattr(InitWebtoonCrawler, "_process_batch",
+                        lambda self, url_batch: ([status_record("1", "COMPLETED")], []))
+    crawler = create_crawler({})
+    assert len(crawler._process_batch([])[0]) == 1
+    assert crawler._process_batch([])[0] == []
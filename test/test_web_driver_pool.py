@@ -0,0 +1,133 @@
+import time
+import pytest
+from modules.web_driver import IWebDriverManager, WebDriverPool
+from modules.fingerprint_store import FingerprintStore
+from crawler.tasks.init_webtoon_crawler import InitWebtoonCrawler
+
+class FakeDriver:
+    def __init__(self, name):
+        self.name = name
+        self.session_id = name
+
+    def execute_script(self, script):
+        return "complete"
+
+class FakeDriverManager(IWebDriverManager):
+    """드라이버 생성, 반납, 폐기 순서를 공유 로그에 남기는 매니저"""
+
+    def __init__(self, name, events, fail_release=False):
+        self.name = name
+        self.events = events
+        self.fail_release = fail_release
+        self.count = 0
+
+    def setup_driver(self):
+        pass
+
+    def get_driver(self):
+        self.count += 1
+        driver = FakeDriver(f"{self.name}-{self.count}")
+        self.events.append(("get", driver.name))
+        return driver
+
+    def release_driver(self, driver):
+        self.events.append(("release", driver.name))
+        if self.fail_release:
+            raise RuntimeError("반납 실패")
+
+    def discard_driver(self, driver):
+        self.events.append(("discard", driver.name))
+
+def create_pool(names, events, **kwargs) -> WebDriverPool:
+    return WebDriverPool([FakeDriverManager(name, events) for name in names], max_rss_mb=None, **kwargs)
+
+def test_empty_managers_are_rejected():
+    with pytest.raises(ValueError):
+        WebDriverPool([])
+
+def test_sessions_acquire_and_release_in_manager_order():
+    events = []
+    pool = create_pool(["a", "b", "c"], events)
+    assert len(pool) == 3
+    assert [driver.name for driver in pool.drivers] == ["a-1", "b-1", "c-1"]
+
+    pool.shutdown()
+    assert events == [
+        ("get", "a-1"), ("get", "b-1"), ("get", "c-1"),
+        ("release", "a-1"), ("release", "b-1"), ("release", "c-1")
+    ]
+
+def test_discarded_driver_is_replaced_in_pool():
+    events = []
+    pool = create_pool(["a", "b"], events, max_pages=1)
+    session = pool.sessions[1]
+    session.before_page()
+    session.after_page()
+    session.before_page()
+
+    assert [driver.name for driver in pool.drivers] == ["a-1", "b-2"]
+    assert events[-2:] == [("discard", "b-1"), ("get", "b-2")]
+    assert pool.summary()["pages"] == 1
+
+    # 폐기된 드라이버는 다시 반납하지 않음
+    pool.shutdown()
+    assert [event for event in events if event[0] == "release"] == [("release", "a-1"), ("release", "b-2")]
+
+def test_shutdown_continues_after_release_error():
+    events = []
+    managers = [FakeDriverManager("a", events, fail_release=True), FakeDriverManager("b", events)]
+    WebDriverPool(managers, max_rss_mb=None).shutdown()
+    assert events[-2:] == [("release", "a-1"), ("release", "b-1")]
+
+class FakeWebDriverFactory:
+    def __init__(self, events):
+        self.events = events
+        self.count = 0
+
+    def create_driver(self, environment=None, headless=True):
+        self.count += 1
+        return FakeDriverManager(f"extra{self.count}", self.events)
+
+class UnchangedScraper:
+    """항상 '변경 없음'을 반환하는 스크래퍼 (작업 스레드가 건너뛴 목록에 동시에 추가하도록)"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.last_failure = None
+        self.urls = []
+
+    def set_driver(self, driver):
+        self.driver = driver
+
+    def fetch_webtoon_if_changed(self, url, known_fingerprint=None):
+        time.sleep(0.001)
+        self.urls.append(url)
+        return True, None, "same"
+
+def test_pool_workers_collect_unchanged_entries(tmp_path):
+    events = []
+    crawler = InitWebtoonCrawler(
+        driver_manager=FakeDriverManager("main", events),
+        web_driver_factory=FakeWebDriverFactory(events),
+        pool_size=3,
+        batch_size=30,
+        max_session_rss_mb=None,
+        fingerprint_store=FingerprintStore(str(tmp_path / "fingerprints.json"))
+    )
+    crawler.scrapers = [UnchangedScraper(driver) for driver in crawler.driver_pool.drivers]
+    crawler.scraper = crawler.scrapers[0]
+    urls = [f"https://comic.naver.com/webtoon/list?titleId={title_id}" for title_id in range(1, 61)]
+    crawler.initialize(urls)
+    crawler.run()
+
+    unchanged = crawler.get_unchanged_results()
+    assert sorted(int(entry["external_id"]) for entry in unchanged) == list(range(1, 61))
+    assert crawler.unchanged_count == 60
+    # 모든 세션이 작업 큐에서 URL을 나눠 가짐
+    assert sum(len(scraper.urls) for scraper in crawler.scrapers) == 60
+    assert all(scraper.urls for scraper in crawler.scrapers)
+
+    crawler.shutdown()
+    assert [event for event in events if event[0] == "release"] == [
+        ("release", "main-1"), ("release", "extra1-1"), ("release", "extra2-1")
+    ]
@@ -0,0 +1,97 @@
+import time
+import threading
+from collections import Counter
+from typing import Dict, List
+from modules.webtoon_list_manager import WebtoonListManager
+
+WEEKDAY_URL = "https://comic.naver.com/webtoon?tab=mon"
+COMPLETED_TEMPLATE = "https://comic.naver.com/webtoon?tab=finish&page={page}"
+
+def title_url(title_id: int) -> str:
+    return f"https://comic.naver.com/webtoon/list?titleId={title_id}"
+
+class StubListScraper:
+    """목록 페이지 URL별로 정해진 웹툰 URL을 돌려주는 스크래퍼
+
+    failures: 페이지 URL별로 앞에서 몇 번 실패할지 (-1이면 항상 실패)
+    delays: 페이지 URL별 응답 지연(초)
+    """
+
+    NAVER_WEBTOON_URLS = [WEEKDAY_URL]
+    NAVER_COMPLETED_URL_TEMPLATE = COMPLETED_TEMPLATE
+
+    def __init__(self, pages: Dict[str, List[str]], failures: Dict[str, int] = None, delays: Dict[str, float] = None,
+                 requests: Counter = None):
+        self.pages = pages
+        self.failures = failures if failures is not None else {}
+        self.delays = delays or {}
+        self.requests = requests if requests is not None else Counter()
+        self._lock = threading.Lock()
+
+    def get_webtoon_urls(self, url: str) -> list:
+        with self._lock:
+            self.requests[url] += 1
+            attempt = self.requests[url]
+        time.sleep(self.delays.get(url, 0))
+        failures = self.failures.get(url, 0)
+        if failures < 0 or attempt <= failures:
+            raise TimeoutError(f"목록 로딩 실패: {url}")
+        return list(self.pages.get(url, []))
+
+def completed(page: int) -> str:
+    return COMPLETED_TEMPLATE.format(page=page)
+
+def create_scrapers(count: int, pages, failures=None, delays=None) -> List[StubListScraper]:
+    # 스크래퍼끼리 요청 횟수와 실패 횟수를 공유 (같은 페이지를 다른 세션이 다시 요청할 수 있음)
+    requests = Counter()
+    failures = dict(failures or {})
+    return [StubListScraper(pages, failures, delays, requests) for _ in range(count)]
+
+def test_failed_page_is_retried(tmp_path):
+    manager = WebtoonListManager(str(tmp_path / "urls.txt"))
+    scrapers = create_scrapers(2, {WEEKDAY_URL: [title_url(1)], completed(1): [title_url(2)]},
+                               failures={WEEKDAY_URL: 2})
+    manager.collect_webtoon_urls(scrapers)
+    assert sorted(manager.urls) == [title_url(1), title_url(2)]
+    assert scrapers[0].requests[WEEKDAY_URL] == 3
+    assert (tmp_path / "urls.txt").read_text(encoding="utf-8").split() == [title_url(1), title_url(2)]
+
+def test_page_failing_every_attempt_is_skipped(tmp_path):
+    manager = WebtoonListManager(str(tmp_path / "urls.txt"))
+    scrapers = create_scrapers(2, {
+        WEEKDAY_URL: [title_url(1)],
+        completed(1): [title_url(2)],
+        completed(3): [title_url(3)],
+    }, failures={completed(2): -1})
+    manager.collect_webtoon_urls(scrapers)
+    # 실패한 2페이지를 마지막 페이지로 보지 않고 3페이지까지 수집
+    assert sorted(manager.urls) == [title_url(1), title_url(2), title_url(3)]
+    assert scrapers[0].requests[completed(2)] == WebtoonListManager.PAGE_ATTEMPTS
+
+def test_pages_finishing_out_of_order(tmp_path):
+    manager = WebtoonListManager(str(tmp_path / "urls.txt"))
+    scrapers = create_scrapers(3, {
+        WEEKDAY_URL: [title_url(1)],
+        completed(1): [title_url(2), title_url(3)],
+    }, delays={completed(1): 0.2})
+    manager.collect_webtoon_urls(scrapers)
+    # 비어 있는 2페이지가 먼저 끝나도 늦게 끝난 1페이지의 웹툰은 수집되고, 3페이지는 요청하지 않음
+    assert sorted(manager.urls) == [title_url(1), title_url(2), title_url(3)]
+    assert scrapers[0].requests[completed(3)] == 0
+
+def test_stops_after_too_many_failed_completed_pages(tmp_path):
+    manager = WebtoonListManager(str(tmp_path / "urls.txt"))
+    failures = {completed(page): -1 for page in range(1, 20)}
+    scrapers = create_scrapers(2, {WEEKDAY_URL: [title_url(1)]}, failures=failures)
+    manager.collect_webtoon_urls(scrapers, completed_page_limit=19)
+    assert sorted(manager.urls) == [title_url(1)]
+    requested_pages = [page for page in range(1, 20) if scrapers[0].requests[completed(page)]]
+    # 실패 한도(3)에 도달하기 전에 미리 요청한 페이지까지만 요청
+    assert len(requested_pages) < WebtoonListManager.COMPLETED_FAILED_PAGE_LIMIT + WebtoonListManager.COMPLETED_PAGE_WINDOW
+
+def test_completed_page_limit(tmp_path):
+    manager = WebtoonListManager(str(tmp_path / "urls.txt"))
+    pages = {completed(page): [title_url(page)] for page in range(1, 10)}
+    scrapers = create_scrapers(2, pages)
+    manager.collect_webtoon_urls(scrapers, completed_page_limit=4)
+    assert sorted(manager.urls) == sorted(title_url(page) for page in range(1, 5))
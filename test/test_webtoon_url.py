@@ -0,0 +1,47 @@
+from modules.webtoon_url import TitleIndex, TitleKey, canonicalize_url, get_external_id, get_record_platform, get_title_key
+
+CANONICAL_URL = "https://comic.naver.com/webtoon/list?titleId=183559"
+
+def test_variants_share_canonical_url():
+    for url in (
+        CANONICAL_URL,
+        "http://comic.naver.com/webtoon/list?titleId=183559",
+        "https://comic.naver.com/webtoon/list?tab=mon&titleId=183559&page=2&sort=ASC",
+        "https://m.comic.naver.com/webtoon/list?titleId=183559",
+        " https://comic.naver.com/webtoon/list?titleId=183559#top ",
+    ):
+        assert canonicalize_url(url) == CANONICAL_URL
+        assert get_title_key(url) == TitleKey("naver", "183559")
+
+def test_challenge_urls_keep_their_own_key():
+    url = "https://comic.naver.com/challenge/list?titleId=183559"
+    key = get_title_key(url)
+    assert key.platform == "url"
+    assert key != get_title_key(CANONICAL_URL)
+    assert canonicalize_url(url) == url
+
+def test_url_without_title_id_is_normalized():
+    assert canonicalize_url("http://Example.com/path?a=1#frag") == "https://example.com/path?a=1"
+    assert get_external_id("http://Example.com/path") == "https://example.com/path"
+
+def test_record_platform():
+    assert get_record_platform(CANONICAL_URL) == "NAVER"
+    assert get_record_platform("https://example.com/") == ""
+
+def test_title_index_deduplicates_variants():
+    index = TitleIndex([
+        "http://comic.naver.com/webtoon/list?titleId=1&page=2",
+        "https://comic.naver.com/webtoon/list?titleId=2",
+        "https://comic.naver.com/webtoon/list?tab=mon&titleId=1",
+    ])
+    assert list(index) == [
+        "https://comic.naver.com/webtoon/list?titleId=1",
+        "https://comic.naver.com/webtoon/list?titleId=2",
+    ]
+    assert "https://m.comic.naver.com/webtoon/list?titleId=2" in index
+    assert not index.add("https://comic.naver.com/webtoon/list?titleId=2&sort=ASC")
+    assert index.add("https://comic.naver.com/webtoon/list?titleId=3")
+
+    index.discard("http://comic.naver.com/webtoon/list?titleId=1")
+    assert len(index) == 2
+    assert index.get("https://comic.naver.com/webtoon/list?titleId=1") is None